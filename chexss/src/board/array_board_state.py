@@ -0,0 +1,106 @@
+"""
+array_board_state.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import collections
+from typing import Dict, Optional, Set
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state import BoardState
+from src.board.cell_index import CellIndex, get_cell_index
+from src.pieces.piece_code import EMPTY_CODE, decode_piece, encode_piece, encode_piece_info
+from src.pieces.piece_info import PieceInfo
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+
+
+class ArrayBoardState:
+    """This class is a compact alternative to BoardState. Instead of a dict from BoardCoordinate to PieceInfo it keeps
+    one byte per cell of the board in a bytearray, indexed by the CellIndex of the board, where each byte is the code of
+    the piece on that cell (see piece_code.py) or zero if the cell is empty. Copying a state is then a single copy of a
+    small block of memory, and move generation can work on small integers rather than hashing coordinates.
+    """
+
+    def __init__(
+        self,
+        board: Board,
+        cells: Optional[bytearray] = None
+    ) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        board: Board
+            The board the state is for.
+
+        cells: Optional[bytearray]
+            The piece code of every cell ordered by cell index. If not given the board starts out empty.
+        """
+        self._board = board
+        self._cell_index: CellIndex = get_cell_index(board.dimension)
+        if cells is None:
+            cells = bytearray(self._cell_index.size)
+        if len(cells) != self._cell_index.size:
+            raise ValueError("Expected {} cells but got {}.".format(self._cell_index.size, len(cells)))
+        self._cells = cells
+
+    @staticmethod
+    def from_board_state(board_state: BoardState) -> 'ArrayBoardState':
+        """Create an ArrayBoardState with the same pieces as the given BoardState."""
+        state = ArrayBoardState(board_state.board)
+        index = state._cell_index.index
+        cells = state._cells
+        for coord, piece_info in board_state.piece_map.items():
+            cells[index(coord)] = encode_piece_info(piece_info)
+        return state
+
+    def to_board_state(self) -> BoardState:
+        """Create a BoardState with the same pieces as this state."""
+        piece_map = self.piece_map
+        player_piece_map: Dict[Player, Set[BoardCoordinate]] = collections.defaultdict(set)
+        for coord, piece_info in piece_map.items():
+            player_piece_map[piece_info.player].add(coord)
+        return BoardState(self._board, piece_map, player_piece_map)
+
+    def copy(self) -> 'ArrayBoardState':
+        """Returns an independent copy of this state."""
+        return ArrayBoardState(self._board, bytearray(self._cells))
+
+    def get_piece_info(self, board_coordinate: BoardCoordinate) -> Optional[PieceInfo]:
+        return decode_piece(self._cells[self._cell_index.index(board_coordinate)])
+
+    def get_piece_code(self, index: int) -> int:
+        """Returns the code of the piece on the cell with the given index, or zero if the cell is empty."""
+        return self._cells[index]
+
+    def set_piece(self, index: int, player: Player, piece_type: PieceType) -> None:
+        """Put a piece on the cell with the given index, replacing anything that was there."""
+        self._cells[index] = encode_piece(player, piece_type)
+
+    def clear(self, index: int) -> None:
+        """Remove any piece from the cell with the given index."""
+        self._cells[index] = EMPTY_CODE
+
+    @property
+    def piece_map(self) -> Dict[BoardCoordinate, PieceInfo]:
+        """A dict of the occupied coordinates to the piece on them. This is built on every access."""
+        coordinate = self._cell_index.coordinate
+        piece_map: Dict[BoardCoordinate, PieceInfo] = dict()
+        for index, code in enumerate(self._cells):
+            if code != EMPTY_CODE:
+                piece_map[coordinate(index)] = decode_piece(code)  # type: ignore [assignment]
+        return piece_map
+
+    @property
+    def cells(self) -> bytearray:
+        """The piece code of every cell ordered by cell index."""
+        return self._cells
+
+    @property
+    def cell_index(self) -> CellIndex:
+        return self._cell_index
+
+    @property
+    def board(self) -> Board:
+        return self._board
@@ -0,0 +1,277 @@
+"""
+attack_map.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+from typing import List, Optional, Set, Tuple
+from src.board.bitboards import Bitboards, bit_indexes
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state import BoardState
+from src.pieces.move import Move
+from src.pieces.piece_info import PieceInfo
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+
+
+_SLIDER_TYPES = (PieceType.QUEEN, PieceType.ROOK, PieceType.BISHOP)
+
+
+class AttackUndo:
+    """This class records what AttackMap.make_move() changed, so that AttackMap.unmake_move() can put it back."""
+
+    __slots__ = ("_from_index", "_to_index", "_moved", "_placed", "_captured", "_changed")
+
+    def __init__(
+        self,
+        from_index: int,
+        to_index: int,
+        moved: PieceInfo,
+        placed: PieceInfo,
+        captured: Optional[PieceInfo],
+        changed: List[Tuple[int, int]]
+    ) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        from_index: int
+            The cell index the piece moved from.
+
+        to_index: int
+            The cell index the piece moved to.
+
+        moved: PieceInfo
+            The piece that was on the from cell before the move.
+
+        placed: PieceInfo
+            The piece that is on the to cell after the move. This differs from moved if the move promoted a pawn.
+
+        captured: Optional[PieceInfo]
+            The piece that was on the to cell before the move, or None if it was empty.
+
+        changed: List[Tuple[int, int]]
+            The cell index and previous attack mask of every piece whose attacks were changed by the move.
+        """
+        self._from_index = from_index
+        self._to_index = to_index
+        self._moved = moved
+        self._placed = placed
+        self._captured = captured
+        self._changed = changed
+
+    @property
+    def from_index(self) -> int:
+        return self._from_index
+
+    @property
+    def to_index(self) -> int:
+        return self._to_index
+
+    @property
+    def moved(self) -> PieceInfo:
+        return self._moved
+
+    @property
+    def placed(self) -> PieceInfo:
+        return self._placed
+
+    @property
+    def captured(self) -> Optional[PieceInfo]:
+        return self._captured
+
+    @property
+    def changed(self) -> List[Tuple[int, int]]:
+        return self._changed
+
+
+class AttackMap:
+    """This class keeps track of which cells each player attacks. A cell is attacked by a player if one of their pieces
+    could capture a piece on it (for pawns only the capture directions count), and like Bitboards.attacks() this
+    includes cells holding the player's own pieces.
+
+    The map is built in one sweep over the pieces, storing the attack mask of the piece on every cell, and is then kept
+    up to date by make_move() and unmake_move(). A move can only change the attacks of the piece that moved, the piece
+    that was captured, and the sliding pieces whose rays reach the from or to cell, so only those masks are recomputed.
+    The per-player masks are rebuilt from the per-piece masks the next time they are asked for. This makes checking
+    whether a king is attacked after a candidate move far cheaper than generating the moves of every opponent.
+    """
+
+    def __init__(self, bitboards: Bitboards) -> None:
+        """Constructor. Use from_board_state() to build an attack map for a BoardState.
+
+        Parameters
+        ----------
+        bitboards: Bitboards
+            The bitboards of the pieces on the board. The attack map takes ownership of them and keeps them up to date.
+        """
+        self._bitboards = bitboards
+        size = bitboards.masks.cell_index.size
+        self._cell_pieces: List[Optional[PieceInfo]] = [None] * size
+        self._cell_attacks: List[int] = [0] * size
+        for player in Player:
+            for piece_type in PieceType:
+                piece_info = PieceInfo(player, piece_type)
+                for index in bit_indexes(bitboards.pieces(player, piece_type)):
+                    self._cell_pieces[index] = piece_info
+                    self._cell_attacks[index] = bitboards.piece_attacks(index, player, piece_type)
+        self._player_attacks: List[int] = [0] * len(Player)
+        self._dirty: List[bool] = [True] * len(Player)
+
+    @staticmethod
+    def from_board_state(board_state: BoardState) -> 'AttackMap':
+        """Create the attack map for the pieces of the given BoardState."""
+        return AttackMap(Bitboards.from_board_state(board_state))
+
+    @property
+    def bitboards(self) -> Bitboards:
+        """The bitboards of the pieces on the board. Do not change them directly, use make_move() instead."""
+        return self._bitboards
+
+    def attacks(self, player: Player) -> int:
+        """Returns the mask of every cell attacked by the given player."""
+        if self._dirty[player.value]:
+            attacks = 0
+            cell_attacks = self._cell_attacks
+            for index in bit_indexes(self._bitboards.occupancy(player)):
+                attacks |= cell_attacks[index]
+            self._player_attacks[player.value] = attacks
+            self._dirty[player.value] = False
+        return self._player_attacks[player.value]
+
+    def attacked_coordinates(self, player: Player) -> Set[BoardCoordinate]:
+        """Returns the coordinates of every cell attacked by the given player."""
+        coordinate = self._bitboards.masks.cell_index.coordinate
+        return {coordinate(index) for index in bit_indexes(self.attacks(player))}
+
+    def piece_attacks(self, index: int) -> int:
+        """Returns the mask of the cells attacked by the piece on the cell with the given index, or 0 if it is empty."""
+        return self._cell_attacks[index]
+
+    def attackers(self, index: int, player: Player) -> int:
+        """Returns the mask of the cells holding the given player's pieces that attack the cell with the given index."""
+        bit = self._bitboards.masks.bits[index]
+        cell_attacks = self._cell_attacks
+        attackers = 0
+        for source in bit_indexes(self._bitboards.occupancy(player)):
+            if cell_attacks[source] & bit:
+                attackers |= 1 << source
+        return attackers
+
+    def is_attacked(self, coord: BoardCoordinate, player: Player) -> bool:
+        """Returns True if the given coordinate is attacked by the given player."""
+        return self.attacks(player) >> self._bitboards.masks.cell_index.index(coord) & 1 == 1
+
+    def king_index(self, player: Player) -> Optional[int]:
+        """Returns the cell index of the given player's king, or None if they do not have one."""
+        kings = self._bitboards.pieces(player, PieceType.KING)
+        return kings.bit_length() - 1 if kings else None
+
+    def is_in_check(self, player: Player) -> bool:
+        """Returns True if the given player's king is attacked by either of the other players."""
+        kings = self._bitboards.pieces(player, PieceType.KING)
+        if not kings:
+            return False
+        return any(self.attacks(other) & kings for other in Player if other != player)
+
+    def checking_players(self, player: Player) -> List[Player]:
+        """Returns the players that attack the given player's king."""
+        kings = self._bitboards.pieces(player, PieceType.KING)
+        return [other for other in Player if other != player and self.attacks(other) & kings]
+
+    def make_move(
+        self,
+        move: Move,
+        promotion_type: Optional[PieceType] = None
+    ) -> AttackUndo:
+        """Update the attack map for the given move. Like BoardState.make_move() this does not check that the piece is
+        allowed to make the move.
+
+        Parameters
+        ----------
+        move: Move
+            The move to make.
+
+        promotion_type: Optional[PieceType]
+            The type of piece a pawn is promoted to if the move is a promotion. If not given the piece is not changed.
+
+        Returns
+        -------
+        AttackUndo
+            The record to pass to unmake_move() to take the move back.
+        """
+        index = self._bitboards.masks.cell_index.index
+        from_index = index(move.from_coord)
+        to_index = index(move.to_coord)
+        moved = self._cell_pieces[from_index]
+        if moved is None:
+            raise Exception("There is no piece at coordinate {}.".format(move.from_coord))
+        captured = self._cell_pieces[to_index]
+        placed = moved if promotion_type is None else PieceInfo(moved.player, promotion_type)
+
+        bitboards = self._bitboards
+        if captured is not None:
+            bitboards.remove_piece(to_index, captured.player, captured.piece_type)
+        bitboards.remove_piece(from_index, moved.player, moved.piece_type)
+        bitboards.add_piece(to_index, placed.player, placed.piece_type)
+
+        self._cell_pieces[from_index] = None
+        self._cell_pieces[to_index] = placed
+        changed = [(from_index, self._cell_attacks[from_index]), (to_index, self._cell_attacks[to_index])]
+        self._cell_attacks[from_index] = 0
+        self._cell_attacks[to_index] = bitboards.piece_attacks(to_index, placed.player, placed.piece_type)
+        self._update_sliders(from_index, to_index, changed)
+
+        undo = AttackUndo(from_index, to_index, moved, placed, captured, changed)
+        self._mark_dirty(undo)
+        return undo
+
+    def unmake_move(self, undo: AttackUndo) -> None:
+        """Take back a move made with make_move(). Moves must be taken back in the reverse order they were made.
+
+        Parameters
+        ----------
+        undo: AttackUndo
+            The record returned by make_move() for the move.
+        """
+        bitboards = self._bitboards
+        placed = undo.placed
+        moved = undo.moved
+        captured = undo.captured
+        bitboards.remove_piece(undo.to_index, placed.player, placed.piece_type)
+        bitboards.add_piece(undo.from_index, moved.player, moved.piece_type)
+        if captured is not None:
+            bitboards.add_piece(undo.to_index, captured.player, captured.piece_type)
+
+        self._cell_pieces[undo.from_index] = moved
+        self._cell_pieces[undo.to_index] = captured
+        for index, attacks in reversed(undo.changed):
+            self._cell_attacks[index] = attacks
+        self._mark_dirty(undo)
+
+    def _update_sliders(self, from_index: int, to_index: int, changed: List[Tuple[int, int]]) -> None:
+        """Recompute the attacks of every sliding piece whose rays reached the from or to cell before the move."""
+        bitboards = self._bitboards
+        bits = bitboards.masks.bits
+        touched = bits[from_index] | bits[to_index]
+        cell_attacks = self._cell_attacks
+        sliders = 0
+        for player in Player:
+            for piece_type in _SLIDER_TYPES:
+                sliders |= bitboards.pieces(player, piece_type)
+        sliders &= ~touched
+        for index in bit_indexes(sliders):
+            piece_info = self._cell_pieces[index]
+            if piece_info is not None and cell_attacks[index] & touched:
+                changed.append((index, cell_attacks[index]))
+                cell_attacks[index] = bitboards.piece_attacks(index, piece_info.player, piece_info.piece_type)
+
+    def _mark_dirty(self, undo: AttackUndo) -> None:
+        """Mark the per-player masks that the move could have changed as needing to be rebuilt."""
+        dirty = self._dirty
+        dirty[undo.moved.player.value] = True
+        if undo.captured is not None:
+            dirty[undo.captured.player.value] = True
+        for index, _ in undo.changed[2:]:
+            piece_info = self._cell_pieces[index]
+            if piece_info is not None:
+                dirty[piece_info.player.value] = True
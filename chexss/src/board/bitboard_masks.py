@@ -0,0 +1,156 @@
+"""
+bitboard_masks.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+from functools import lru_cache
+from typing import List, Tuple
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+from src.board.cell_index import CellIndex, get_cell_index
+from src.board.direction_iterator import DirectionDelta
+from src.board.direction_utils import (
+    all_direction_deltas,
+    knight_direction_deltas,
+    pawn_capture_direction_deltas,
+    pawn_move_direction_deltas
+)
+from src.board.ray_table import get_ray_table
+from src.pieces.player import Player
+
+
+# The indexes of the orthogonal and diagonal directions within all_direction_deltas().
+ORTHOGONAL_DIRECTIONS = range(0, 6)
+DIAGONAL_DIRECTIONS = range(6, 12)
+ALL_DIRECTIONS = range(0, 12)
+
+
+class BitboardMasks:
+    """This class holds the precomputed masks used by Bitboards. Bit i of a mask corresponds to the cell with index i in
+    the CellIndex of the board. For every cell we store the cells a king, knight or pawn could reach from it on an empty
+    board, and the ray of cells in each of the twelve directions of all_direction_deltas().
+
+    Because cells are numbered by increasing q and then increasing r, the indexes along a ray either all increase or
+    all decrease. So the first piece blocking a ray is the lowest set bit of the blockers for an increasing ray and the
+    highest set bit for a decreasing ray, which lets sliding attacks be computed without walking the ray. Use
+    get_bitboard_masks() to get a shared instance.
+    """
+
+    def __init__(self, board: Board) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        board: Board
+            The board to build the masks for.
+        """
+        self._cell_index: CellIndex = get_cell_index(board.dimension)
+        size = self._cell_index.size
+        index = self._cell_index.index
+        ray_table = get_ray_table(board.dimension)
+
+        self._bits: Tuple[int, ...] = tuple(1 << i for i in range(size))
+        self._all_cells: int = (1 << size) - 1
+
+        def step_masks(deltas: List[DirectionDelta]) -> Tuple[int, ...]:
+            masks = []
+            for coord in self._cell_index.coordinates:
+                mask = 0
+                for delta in deltas:
+                    target = BoardCoordinate(coord.q + delta.q, coord.r + delta.r)
+                    if board.is_valid_coordinate(target):
+                        mask |= 1 << index(target)
+                masks.append(mask)
+            return tuple(masks)
+
+        self._king: Tuple[int, ...] = step_masks(all_direction_deltas())
+        self._knight: Tuple[int, ...] = step_masks(knight_direction_deltas())
+        self._pawn_moves: Tuple[Tuple[int, ...], ...] = tuple(
+            step_masks(pawn_move_direction_deltas(player)) for player in Player)
+        self._pawn_captures: Tuple[Tuple[int, ...], ...] = tuple(
+            step_masks(pawn_capture_direction_deltas(player)) for player in Player)
+
+        # The reverse of the pawn capture masks, ie the cells a pawn would have to be on to capture on each cell.
+        pawn_attackers = [[0] * size for _ in Player]
+        for player in Player:
+            for source, mask in enumerate(self._pawn_captures[player.value]):
+                for target in range(size):
+                    if mask >> target & 1:
+                        pawn_attackers[player.value][target] |= 1 << source
+        self._pawn_attackers: Tuple[Tuple[int, ...], ...] = tuple(tuple(masks) for masks in pawn_attackers)
+
+        rays = []
+        for coord in self._cell_index.coordinates:
+            cell_rays = []
+            for ray in ray_table.rays(coord):
+                mask = 0
+                for ray_coord in ray:
+                    mask |= 1 << index(ray_coord)
+                cell_rays.append(mask)
+            rays.append(tuple(cell_rays))
+        self._rays: Tuple[Tuple[int, ...], ...] = tuple(rays)
+        self._ray_increasing: Tuple[bool, ...] = tuple(
+            delta.q > 0 or (delta.q == 0 and delta.r > 0) for delta in all_direction_deltas())
+
+    @property
+    def cell_index(self) -> CellIndex:
+        return self._cell_index
+
+    @property
+    def bits(self) -> Tuple[int, ...]:
+        """The single bit mask of each cell, ie bits[i] == 1 << i."""
+        return self._bits
+
+    @property
+    def all_cells(self) -> int:
+        """A mask with a bit set for every cell on the board."""
+        return self._all_cells
+
+    @property
+    def king(self) -> Tuple[int, ...]:
+        """The cells a king can reach from each cell."""
+        return self._king
+
+    @property
+    def knight(self) -> Tuple[int, ...]:
+        """The cells a knight can reach from each cell."""
+        return self._knight
+
+    @property
+    def pawn_moves(self) -> Tuple[Tuple[int, ...], ...]:
+        """The cells a pawn can move forward to from each cell, indexed by player value and then by cell."""
+        return self._pawn_moves
+
+    @property
+    def pawn_captures(self) -> Tuple[Tuple[int, ...], ...]:
+        """The cells a pawn can capture on from each cell, indexed by player value and then by cell."""
+        return self._pawn_captures
+
+    @property
+    def pawn_attackers(self) -> Tuple[Tuple[int, ...], ...]:
+        """The cells a pawn would have to be on to capture on each cell, indexed by player value and then by cell."""
+        return self._pawn_attackers
+
+    @property
+    def rays(self) -> Tuple[Tuple[int, ...], ...]:
+        """The ray masks from each cell, indexed by cell and then by the direction's position in
+        all_direction_deltas()."""
+        return self._rays
+
+    @property
+    def ray_increasing(self) -> Tuple[bool, ...]:
+        """Whether the cell indexes increase along each direction of all_direction_deltas()."""
+        return self._ray_increasing
+
+
+@lru_cache(maxsize=None)
+def get_bitboard_masks(dimension: int) -> BitboardMasks:
+    """Returns the BitboardMasks for a board of the given dimension. They are built the first time they are requested
+    and shared by every caller after that.
+
+    Parameters
+    ----------
+    dimension: int
+        The dimension of the board, ie the number of hexes on a side.
+    """
+    return BitboardMasks(Board(dimension))
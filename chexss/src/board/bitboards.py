@@ -0,0 +1,190 @@
+"""
+bitboards.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+from typing import Iterable, Iterator, List
+from src.board.board import Board
+from src.board.board_state import BoardState
+from src.board.bitboard_masks import (
+    ALL_DIRECTIONS,
+    DIAGONAL_DIRECTIONS,
+    ORTHOGONAL_DIRECTIONS,
+    BitboardMasks,
+    get_bitboard_masks
+)
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+
+
+def bit_indexes(mask: int) -> Iterator[int]:
+    """Yields the index of every set bit in the mask, from the lowest to the highest."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class Bitboards:
+    """This class is a bitboard representation of the pieces on a board. For each player and piece type there is a
+    single Python int with one bit per cell, where bit i corresponds to the cell with index i in the CellIndex of the
+    board. Along with the precomputed BitboardMasks this lets occupancy tests be a single AND, and lets us compute all
+    of the cells a player attacks with a handful of bit operations per piece rather than generating every move.
+    """
+
+    def __init__(self, board: Board) -> None:
+        """Constructor. The bitboards start out empty, use from_board_state() to build them from a BoardState.
+
+        Parameters
+        ----------
+        board: Board
+            The board the bitboards are for.
+        """
+        self._board = board
+        self._masks: BitboardMasks = get_bitboard_masks(board.dimension)
+        self._pieces: List[List[int]] = [[0] * len(PieceType) for _ in Player]
+        self._occupancy: List[int] = [0] * len(Player)
+        self._occupied: int = 0
+
+    @staticmethod
+    def from_board_state(board_state: BoardState) -> 'Bitboards':
+        """Create the bitboards for the pieces of the given BoardState."""
+        bitboards = Bitboards(board_state.board)
+        index = bitboards._masks.cell_index.index
+        for coord, piece_info in board_state.piece_map.items():
+            bitboards.add_piece(index(coord), piece_info.player, piece_info.piece_type)
+        return bitboards
+
+    def copy(self) -> 'Bitboards':
+        """Returns an independent copy of these bitboards."""
+        bitboards = Bitboards(self._board)
+        bitboards._pieces = [list(pieces) for pieces in self._pieces]
+        bitboards._occupancy = list(self._occupancy)
+        bitboards._occupied = self._occupied
+        return bitboards
+
+    def add_piece(self, index: int, player: Player, piece_type: PieceType) -> None:
+        """Put a piece on the empty cell with the given index."""
+        bit = self._masks.bits[index]
+        self._pieces[player.value][piece_type.value] |= bit
+        self._occupancy[player.value] |= bit
+        self._occupied |= bit
+
+    def remove_piece(self, index: int, player: Player, piece_type: PieceType) -> None:
+        """Remove the given piece from the cell with the given index."""
+        bit = ~self._masks.bits[index]
+        self._pieces[player.value][piece_type.value] &= bit
+        self._occupancy[player.value] &= bit
+        self._occupied &= bit
+
+    def pieces(self, player: Player, piece_type: PieceType) -> int:
+        """The mask of the cells holding the given player's pieces of the given type."""
+        return self._pieces[player.value][piece_type.value]
+
+    def occupancy(self, player: Player) -> int:
+        """The mask of the cells holding any of the given player's pieces."""
+        return self._occupancy[player.value]
+
+    @property
+    def occupied(self) -> int:
+        """The mask of the cells holding any piece."""
+        return self._occupied
+
+    @property
+    def masks(self) -> BitboardMasks:
+        return self._masks
+
+    @property
+    def board(self) -> Board:
+        return self._board
+
+    def location_is_occupied(self, index: int) -> bool:
+        """The bitboard equivalent of move_utils.location_is_occupied."""
+        return self._occupied & self._masks.bits[index] != 0
+
+    def is_valid_move_location(self, player: Player, index: int) -> bool:
+        """The bitboard equivalent of move_utils.is_valid_move_location. Since the index is a cell on the board we
+        only need to check that the cell does not contain a piece of the same player."""
+        return self._occupancy[player.value] & self._masks.bits[index] == 0
+
+    def is_valid_capture_location(self, player: Player, index: int) -> bool:
+        """The bitboard equivalent of move_utils.is_valid_capture_location."""
+        return (self._occupied ^ self._occupancy[player.value]) & self._masks.bits[index] != 0
+
+    def slider_attacks(self, index: int, directions: Iterable[int]) -> int:
+        """Returns the mask of the cells attacked by a piece sliding from the cell with the given index in the given
+        directions (indexes into all_direction_deltas()). Each ray stops at, and includes, its first occupied cell."""
+        rays = self._masks.rays[index]
+        increasing = self._masks.ray_increasing
+        occupied = self._occupied
+        attacks = 0
+        for direction in directions:
+            ray = rays[direction]
+            blockers = ray & occupied
+            if not blockers:
+                attacks |= ray
+            elif increasing[direction]:
+                first = blockers & -blockers
+                attacks |= ray & ((first << 1) - 1)
+            else:
+                first = 1 << (blockers.bit_length() - 1)
+                attacks |= ray & -first
+        return attacks
+
+    def piece_attacks(self, index: int, player: Player, piece_type: PieceType) -> int:
+        """Returns the mask of the cells attacked by a single piece of the given player and type on the cell with the
+        given index."""
+        masks = self._masks
+        if piece_type == PieceType.PAWN:
+            return masks.pawn_captures[player.value][index]
+        if piece_type == PieceType.KNIGHT:
+            return masks.knight[index]
+        if piece_type == PieceType.KING:
+            return masks.king[index]
+        if piece_type == PieceType.ROOK:
+            return self.slider_attacks(index, ORTHOGONAL_DIRECTIONS)
+        if piece_type == PieceType.BISHOP:
+            return self.slider_attacks(index, DIAGONAL_DIRECTIONS)
+        return self.slider_attacks(index, ALL_DIRECTIONS)
+
+    def attacks(self, player: Player) -> int:
+        """Returns the mask of every cell attacked by the given player. A cell is attacked if one of the player's pieces
+        could capture a piece on it, so this includes cells holding the player's own pieces, and for pawns only the
+        capture directions count."""
+        masks = self._masks
+        pieces = self._pieces[player.value]
+        attacks = 0
+        for index in bit_indexes(pieces[PieceType.KING.value]):
+            attacks |= masks.king[index]
+        for index in bit_indexes(pieces[PieceType.KNIGHT.value]):
+            attacks |= masks.knight[index]
+        pawn_captures = masks.pawn_captures[player.value]
+        for index in bit_indexes(pieces[PieceType.PAWN.value]):
+            attacks |= pawn_captures[index]
+        for index in bit_indexes(pieces[PieceType.QUEEN.value]):
+            attacks |= self.slider_attacks(index, ALL_DIRECTIONS)
+        for index in bit_indexes(pieces[PieceType.ROOK.value]):
+            attacks |= self.slider_attacks(index, ORTHOGONAL_DIRECTIONS)
+        for index in bit_indexes(pieces[PieceType.BISHOP.value]):
+            attacks |= self.slider_attacks(index, DIAGONAL_DIRECTIONS)
+        return attacks
+
+    def is_attacked(self, index: int, player: Player) -> bool:
+        """Returns True if the cell with the given index is attacked by the given player. Rather than computing all of
+        the player's attacks, this looks outwards from the cell for each kind of piece that could attack it."""
+        masks = self._masks
+        pieces = self._pieces[player.value]
+        if masks.knight[index] & pieces[PieceType.KNIGHT.value]:
+            return True
+        if masks.king[index] & pieces[PieceType.KING.value]:
+            return True
+        if masks.pawn_attackers[player.value][index] & pieces[PieceType.PAWN.value]:
+            return True
+        queens = pieces[PieceType.QUEEN.value]
+        orthogonal = queens | pieces[PieceType.ROOK.value]
+        if orthogonal and self.slider_attacks(index, ORTHOGONAL_DIRECTIONS) & orthogonal:
+            return True
+        diagonal = queens | pieces[PieceType.BISHOP.value]
+        if diagonal and self.slider_attacks(index, DIAGONAL_DIRECTIONS) & diagonal:
+            return True
+        return False
@@ -3,6 +3,7 @@ board.py
 Copyright © 2023 Derek Seiple
 Licensed under Creative Commons BY-NC-SA 3.0. See license file.
 """
+from functools import lru_cache
 from typing import List
 from src.board.board_coordinate import BoardCoordinate
 
@@ -56,3 +57,16 @@ class Board:
     @property
     def coordinates(self) -> List[BoardCoordinate]:
         return self._coordinates
+
+
+@lru_cache(maxsize=None)
+def get_board(dimension: int) -> Board:
+    """Returns a Board of the given dimension that is shared by every caller, so code that creates many board states
+    does not have to generate the coordinates of the board each time. The board must not be changed.
+
+    Parameters
+    ----------
+    dimension: int
+        The dimension of the board, ie the number of hexes on a side.
+    """
+    return Board(dimension)
@@ -57,10 +57,17 @@ class BoardImage:
 
     def __get_hex_image(self, col: int) -> Image:
         """Depending on the size of the board, and column each hex will be a different color. This method returns the
-        hex image needed for the given column. This is done in a way that the center hex will be "black", and the colors
-        alternate from left to right as "white", "silver", "black".
+        hex image needed for the given column.
         """
-        return self._hexes[(-col + 2) % 3].image
+        return self._hexes[self.hex_color_index(col)].image
+
+    @staticmethod
+    def hex_color_index(col: int) -> int:
+        """Returns which of the white (0), silver (1) and black (2) board colors the hexes in the given column are. This
+        is done in a way that the center hex will be "black", and the colors alternate from left to right as "white",
+        "silver", "black".
+        """
+        return (-col + 2) % 3
 
     @property
     def dimension(self) -> int:
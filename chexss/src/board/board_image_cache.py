@@ -0,0 +1,63 @@
+"""
+board_image_cache.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+from functools import lru_cache
+from typing import Tuple
+from src.board.board import Board
+from src.board.board_colors import BoardColors
+from src.board.board_image import BoardImage
+from src.board.hex_meta import HexMeta
+from src.utils.rgb_color import RgbColor
+
+
+RgbTuple = Tuple[int, int, int]
+
+
+def get_board_image(
+    board: Board,
+    hex_meta: HexMeta,
+    board_colors: BoardColors = BoardColors.CreateDefault()
+) -> BoardImage:
+    """Returns the BoardImage for the given board, hex size and colors. Each combination of board dimension, hex width
+    and colors is only drawn once per process and the same BoardImage is returned to every caller after that. The
+    BoardImage is shared, so its image must not be changed. DiagramGenerator draws on a copy, so it is safe to pass it
+    the shared BoardImage.
+
+    Parameters
+    ----------
+    board: Board
+        The board to draw.
+
+    hex_meta: HexMeta
+        The metadata about the hexes. Only the width matters since the rest of the HexMeta follows from it.
+
+    board_colors: BoardColors
+        The color of the hexes used for the board.
+    """
+    return _draw_board_image(
+        board.dimension,
+        hex_meta.width,
+        board_colors.white.rgb,
+        board_colors.silver.rgb,
+        board_colors.black.rgb
+    )
+
+
+def clear_board_image_cache() -> None:
+    """Throw away every drawn board image."""
+    _draw_board_image.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _draw_board_image(
+    dimension: int,
+    width: int,
+    white: RgbTuple,
+    silver: RgbTuple,
+    black: RgbTuple
+) -> BoardImage:
+    """Draws the board image for get_board_image(). The arguments are plain values so they can be cache keys."""
+    board_colors = BoardColors(RgbColor(*white), RgbColor(*silver), RgbColor(*black))
+    return BoardImage(Board(dimension), HexMeta(width), board_colors)
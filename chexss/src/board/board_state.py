@@ -3,12 +3,14 @@ board_state.py
 Copyright © 2023 Derek Seiple
 Licensed under Creative Commons BY-NC-SA 3.0. See license file.
 """
-from typing import Dict, List, Optional
+from typing import Dict, Optional, Set
 from src.board.board import Board
 from src.board.board_coordinate import BoardCoordinate
 from src.pieces.piece_type import PieceType
-from src.pieces.player import Player
+from src.pieces.player import Player, next_player
 from src.pieces.piece_info import PieceInfo
+from src.pieces.move import Move
+from src.board.zobrist import ZobristKeys, get_zobrist_keys
 import collections
 
 
@@ -23,7 +25,8 @@ class BoardStateBuilder:
     ) -> None:
         self._board = board
         self._piece_map: Dict[BoardCoordinate, PieceInfo] = dict()
-        self._player_piece_map: Dict[Player, List[BoardCoordinate]] = collections.defaultdict(list)
+        self._player_piece_map: Dict[Player, Set[BoardCoordinate]] = collections.defaultdict(set)
+        self._side_to_move = Player.WHITE
 
     def add_piece(
         self,
@@ -37,33 +40,128 @@ class BoardStateBuilder:
             raise Exception("There is already a piece at coordinate {}.".format(coord))
 
         self._piece_map[coord] = PieceInfo(player, piece)
-        self._player_piece_map[player].append(coord)
+        self._player_piece_map[player].add(coord)
+        return self
+
+    def set_side_to_move(
+        self,
+        player: Player
+    ) -> 'BoardStateBuilder':
+        """Set the player whose turn it is. If this is not called it is white's turn."""
+        self._side_to_move = player
         return self
 
     def build(self) -> 'BoardState':
         return BoardState(
             self._board,
             self._piece_map,
-            self._player_piece_map
+            self._player_piece_map,
+            self._side_to_move
         )
 
 
+class MoveUndo:
+    """This class records what BoardState.make_move() changed, so that BoardState.unmake_move() can put it back."""
+
+    __slots__ = ("_move", "_moved", "_captured", "_side_to_move", "_hash")
+
+    def __init__(
+        self,
+        move: Move,
+        moved: PieceInfo,
+        captured: Optional[PieceInfo],
+        side_to_move: Player,
+        hash: int
+    ) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        move: Move
+            The move that was made.
+
+        moved: PieceInfo
+            The piece that was on the from coordinate before the move. This differs from the piece on the to coordinate
+            after the move if the move promoted a pawn.
+
+        captured: Optional[PieceInfo]
+            The piece that was on the to coordinate before the move, or None if it was empty.
+
+        side_to_move: Player
+            The player whose turn it was before the move.
+
+        hash: int
+            The Zobrist hash of the board state before the move.
+        """
+        self._move = move
+        self._moved = moved
+        self._captured = captured
+        self._side_to_move = side_to_move
+        self._hash = hash
+
+    @property
+    def move(self) -> Move:
+        return self._move
+
+    @property
+    def moved(self) -> PieceInfo:
+        return self._moved
+
+    @property
+    def captured(self) -> Optional[PieceInfo]:
+        return self._captured
+
+    @property
+    def side_to_move(self) -> Player:
+        return self._side_to_move
+
+    @property
+    def hash(self) -> int:
+        return self._hash
+
+
 class BoardState:
     """This class represents the state of the board at a given point in time. It contains all of the information about
     the board at that point in time. It is used to determine what moves are valid. Do not build this class directly,
-    instead use the BoardStateBuilder class.
+    instead use the BoardStateBuilder class. Once built, the state only changes through make_move() and unmake_move(),
+    which update it in place so that searching through positions does not need to rebuild the whole board.
+
+    Every board state also knows whose turn it is and keeps a 64-bit Zobrist hash of the pieces and the player to move.
+    The hash is computed once when the state is built and then updated incrementally by each move, so it can be used
+    as a constant time key for transposition tables and repetition detection.
     """
 
     def __init__(
         self,
         board: Board,
         piece_map: Dict[BoardCoordinate, PieceInfo],
-        player_piece_map: Dict[Player, List[BoardCoordinate]]
+        player_piece_map: Dict[Player, Set[BoardCoordinate]],
+        side_to_move: Player = Player.WHITE
     ) -> None:
         """Use builder"""
         self._board = board
         self._piece_map: Dict[BoardCoordinate, PieceInfo] = piece_map
-        self._player_piece_map: Dict[Player, List[BoardCoordinate]] = player_piece_map
+        self._player_piece_map: Dict[Player, Set[BoardCoordinate]] = player_piece_map
+        for player in Player:
+            self._player_piece_map.setdefault(player, set())
+        self._side_to_move = side_to_move
+        self._zobrist_keys: ZobristKeys = get_zobrist_keys(board.dimension)
+        self._hash: int = self._zobrist_keys.hash(piece_map, side_to_move)
+
+    def __eq__(self, other: object) -> bool:
+        """Two board states are equal if they have the same pieces in the same places and the same player to move."""
+        if not isinstance(other, BoardState):
+            return False
+        return (
+            self._hash == other._hash and
+            self._board.dimension == other._board.dimension and
+            self._side_to_move == other._side_to_move and
+            self._piece_map == other._piece_map
+        )
+
+    def __hash__(self) -> int:
+        """The Zobrist hash of the board state. Note that this changes when a move is made."""
+        return self._hash
 
     @staticmethod
     def builder(board: Board) -> BoardStateBuilder:
@@ -72,6 +170,88 @@ class BoardState:
     def get_piece_info(self, board_coordinate: BoardCoordinate) -> Optional[PieceInfo]:
         return self._piece_map.get(board_coordinate)
 
+    def player_coordinates(self, player: Player) -> Set[BoardCoordinate]:
+        """Returns the coordinates of all of the pieces of the given player. The set is kept up to date by make_move()
+        and unmake_move(), so copy it if you need to change the board state while iterating over it."""
+        return self._player_piece_map[player]
+
+    def make_move(
+        self,
+        move: Move,
+        promotion_type: Optional[PieceType] = None
+    ) -> MoveUndo:
+        """Make the given move on this board state, in place and in constant time. This does not check that the piece
+        is allowed to make the move, only that there is a piece to move and that it does not capture a piece of its
+        own player. After the move it is the turn of the player after the one that moved.
+
+        Parameters
+        ----------
+        move: Move
+            The move to make.
+
+        promotion_type: Optional[PieceType]
+            The type of piece a pawn is promoted to if the move is a promotion. If not given the piece is not changed.
+
+        Returns
+        -------
+        MoveUndo
+            The record to pass to unmake_move() to take the move back.
+        """
+        moved = self._piece_map.get(move.from_coord)
+        if moved is None:
+            raise Exception("There is no piece at coordinate {}.".format(move.from_coord))
+        captured = self._piece_map.get(move.to_coord)
+        if captured is not None and captured.player == moved.player:
+            raise Exception("The piece at coordinate {} can not capture its own piece.".format(move.from_coord))
+        keys = self._zobrist_keys
+        undo = MoveUndo(move, moved, captured, self._side_to_move, self._hash)
+
+        if captured is not None:
+            self._player_piece_map[captured.player].discard(move.to_coord)
+            self._hash ^= keys.piece_key(move.to_coord, captured)
+
+        del self._piece_map[move.from_coord]
+        placed = moved if promotion_type is None else PieceInfo(moved.player, promotion_type)
+        self._piece_map[move.to_coord] = placed
+        player_coordinates = self._player_piece_map[moved.player]
+        player_coordinates.discard(move.from_coord)
+        player_coordinates.add(move.to_coord)
+
+        side_to_move = next_player(moved.player)
+        self._hash ^= (
+            keys.piece_key(move.from_coord, moved) ^
+            keys.piece_key(move.to_coord, placed) ^
+            keys.side_key(self._side_to_move) ^
+            keys.side_key(side_to_move)
+        )
+        self._side_to_move = side_to_move
+        return undo
+
+    def unmake_move(self, undo: MoveUndo) -> None:
+        """Take back a move made with make_move(). Moves must be taken back in the reverse order they were made.
+
+        Parameters
+        ----------
+        undo: MoveUndo
+            The record returned by make_move() for the move.
+        """
+        move = undo.move
+        moved = undo.moved
+        self._piece_map[move.from_coord] = moved
+        player_coordinates = self._player_piece_map[moved.player]
+        player_coordinates.discard(move.to_coord)
+        player_coordinates.add(move.from_coord)
+
+        captured = undo.captured
+        if captured is None:
+            del self._piece_map[move.to_coord]
+        else:
+            self._piece_map[move.to_coord] = captured
+            self._player_piece_map[captured.player].add(move.to_coord)
+
+        self._side_to_move = undo.side_to_move
+        self._hash = undo.hash
+
     @property
     def piece_map(self) -> Dict[BoardCoordinate, PieceInfo]:
         return self._piece_map
@@ -79,3 +259,13 @@ class BoardState:
     @property
     def board(self) -> Board:
         return self._board
+
+    @property
+    def side_to_move(self) -> Player:
+        """The player whose turn it is."""
+        return self._side_to_move
+
+    @property
+    def zobrist_hash(self) -> int:
+        """The 64-bit Zobrist hash of the pieces on the board and the player to move."""
+        return self._hash
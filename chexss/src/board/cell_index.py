@@ -0,0 +1,88 @@
+"""
+cell_index.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+from functools import lru_cache
+from typing import Tuple
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+
+
+class CellIndex:
+    """This class numbers the hexes of a board with dense integers from 0 to size - 1, so a board of dimension 7 has
+    cells 0 through 126. The cells are numbered in the same order as Board.coordinates, that is by increasing q and then
+    by increasing r. Both conversions are constant time: going from a coordinate to an index is a little arithmetic on
+    the start of each q column, and going from an index to a coordinate is a tuple lookup. Use get_cell_index() to get a
+    shared instance.
+    """
+
+    def __init__(self, board: Board) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        board: Board
+            The board to number the cells of.
+        """
+        self._dimension = board.dimension
+        self._coordinates: Tuple[BoardCoordinate, ...] = tuple(board.coordinates)
+
+        # For each q column we store the index of the cell at r == 0 (even if that cell is not on the board), so that
+        # the index of any cell in the column is just that value plus r.
+        column_starts = []
+        index = 0
+        for q in range(-self._dimension + 1, self._dimension):
+            r_min = max(-self._dimension + 1, -q - self._dimension + 1)
+            r_max = min(self._dimension - 1, -q + self._dimension - 1)
+            column_starts.append(index - r_min)
+            index += r_max - r_min + 1
+        self._column_starts: Tuple[int, ...] = tuple(column_starts)
+
+    def index(self, coord: BoardCoordinate) -> int:
+        """Returns the index of the given coordinate. The coordinate must be a valid coordinate on the board.
+
+        Parameters
+        ----------
+        coord: BoardCoordinate
+            The coordinate to get the index of.
+        """
+        return self._column_starts[coord.q + self._dimension - 1] + coord.r
+
+    def coordinate(self, index: int) -> BoardCoordinate:
+        """Returns the coordinate of the cell with the given index.
+
+        Parameters
+        ----------
+        index: int
+            The index of the cell.
+        """
+        return self._coordinates[index]
+
+    @property
+    def coordinates(self) -> Tuple[BoardCoordinate, ...]:
+        """The coordinates of the board ordered by their index."""
+        return self._coordinates
+
+    @property
+    def dimension(self) -> int:
+        """The dimension of the board, ie the number of hexes on a side."""
+        return self._dimension
+
+    @property
+    def size(self) -> int:
+        """The number of cells on the board."""
+        return len(self._coordinates)
+
+
+@lru_cache(maxsize=None)
+def get_cell_index(dimension: int) -> CellIndex:
+    """Returns the CellIndex for a board of the given dimension. It is built the first time it is requested and shared
+    by every caller after that.
+
+    Parameters
+    ----------
+    dimension: int
+        The dimension of the board, ie the number of hexes on a side.
+    """
+    return CellIndex(Board(dimension))
@@ -3,6 +3,7 @@ coordinate_converter.py
 Copyright © 2025 Derek Seiple
 Licensed under Creative Commons BY-NC-SA 3.0. See license file.
 """
+from functools import lru_cache
 from src.board.algebraic_coordinate import AlgebraicCoordinate
 from src.board.board_coordinate import BoardCoordinate
 
@@ -52,3 +53,15 @@ class CoordinateConverter:
         col: int = board.x + (2 * (self._dimension - 1))
         row: int = self._dimension - 1 - board.y
         return AlgebraicCoordinate(col, row)
+
+
+@lru_cache(maxsize=None)
+def get_coordinate_converter(dimension: int) -> CoordinateConverter:
+    """Returns a shared CoordinateConverter for a board of the given dimension.
+
+    Parameters
+    ----------
+    dimension: int
+        The dimension of the board, ie the number of hexes on a side.
+    """
+    return CoordinateConverter(dimension)
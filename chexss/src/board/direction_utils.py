@@ -5,6 +5,8 @@ Licensed under Creative Commons BY-NC-SA 3.0. See license file.
 """
 from typing import List
 from src.board.direction_iterator import DirectionDelta
+from src.board.symmetry import rotate_delta
+from src.pieces.player import Player
 
 
 def diagonal_direction_deltas() -> List[DirectionDelta]:
@@ -34,3 +36,46 @@ def orthogonal_direction_deltas() -> List[DirectionDelta]:
 def all_direction_deltas() -> List[DirectionDelta]:
     """Returns the direction deltas for all twelve directions on the board."""
     return orthogonal_direction_deltas() + diagonal_direction_deltas()
+
+
+def knight_direction_deltas() -> List[DirectionDelta]:
+    """Returns the direction deltas for the twelve "L" shaped moves of the knight."""
+    return [
+        DirectionDelta(1, -3),
+        DirectionDelta(2, -3),
+        DirectionDelta(3, -2),
+        DirectionDelta(3, -1),
+        DirectionDelta(2, 1),
+        DirectionDelta(1, 2),
+        DirectionDelta(-1, 3),
+        DirectionDelta(-2, 3),
+        DirectionDelta(-3, 2),
+        DirectionDelta(-3, 1),
+        DirectionDelta(-2, -1),
+        DirectionDelta(-1, -2)
+    ]
+
+
+def pawn_move_direction_deltas(
+    player: Player
+) -> List[DirectionDelta]:
+    """Returns the direction deltas for the "forward" moves of a pawn of the given player. These are white's turned to
+    the player's side of the board."""
+    white = [
+        DirectionDelta(0, -1),
+        DirectionDelta(1, -1)
+    ]
+    return [rotate_delta(delta, player.value) for delta in white]
+
+
+def pawn_capture_direction_deltas(
+    player: Player
+) -> List[DirectionDelta]:
+    """Returns the direction deltas for the capturing moves of a pawn of the given player. These are white's turned to
+    the player's side of the board."""
+    white = [
+        DirectionDelta(-1, -1),
+        DirectionDelta(1, -2),
+        DirectionDelta(2, -1)
+    ]
+    return [rotate_delta(delta, player.value) for delta in white]
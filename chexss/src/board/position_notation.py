@@ -0,0 +1,141 @@
+"""
+position_notation.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+from functools import lru_cache
+from typing import Dict, List, Set, Tuple
+from src.board.board import get_board
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state import BoardState
+from src.board.cell_index import get_cell_index
+from src.board.coordinate_converter import get_coordinate_converter
+from src.pieces.piece_info import PieceInfo
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+
+
+# A position is written as five fields separated by spaces:
+#
+#   <dimension> <white pieces> <silver pieces> <black pieces> <player to move>
+#
+# Each list of pieces is a comma separated list of a piece letter followed by the algebraic label of the hex the piece
+# is on, ordered by column and then by row, or "-" if the player has no pieces. The player to move is "w", "s" or "b".
+# For example a dimension 4 board with a white king on d1, a silver rook on m4 and a black king on j7, with silver to
+# move, is
+#
+#   4 Kd1 Rm4 Kj7 s
+#
+# Writing a position always gives the same string for the same position, so the strings can be compared directly.
+PIECE_LETTERS: Dict[PieceType, str] = {
+    PieceType.KING: "K",
+    PieceType.QUEEN: "Q",
+    PieceType.ROOK: "R",
+    PieceType.BISHOP: "B",
+    PieceType.KNIGHT: "N",
+    PieceType.PAWN: "P",
+}
+LETTER_PIECES: Dict[str, PieceType] = {letter: piece_type for piece_type, letter in PIECE_LETTERS.items()}
+PLAYER_LETTERS: Dict[Player, str] = {Player.WHITE: "w", Player.SILVER: "s", Player.BLACK: "b"}
+LETTER_PLAYERS: Dict[str, Player] = {letter: player for player, letter in PLAYER_LETTERS.items()}
+NO_PIECES = "-"
+
+
+@lru_cache(maxsize=None)
+def get_labels(dimension: int) -> Tuple[Tuple[str, ...], Tuple[int, ...], Dict[str, BoardCoordinate]]:
+    """Returns, for a board of the given dimension, the algebraic label of every cell ordered by cell index, the
+    position of every cell in the order the pieces are written in (by column and then by row) also ordered by cell
+    index, and the coordinate of every label. They are built once per dimension so reading and writing labels is just a
+    lookup.
+
+    Parameters
+    ----------
+    dimension: int
+        The dimension of the board, ie the number of hexes on a side.
+    """
+    converter = get_coordinate_converter(dimension)
+    coordinates = get_cell_index(dimension).coordinates
+    algebraic = [converter.board_to_algebraic(coord) for coord in coordinates]
+    ordered = sorted(range(len(coordinates)), key=lambda cell: (algebraic[cell].column, algebraic[cell].row))
+    order = [0] * len(coordinates)
+    for position, cell in enumerate(ordered):
+        order[cell] = position
+    labels = tuple(str(label) for label in algebraic)
+    return labels, tuple(order), dict(zip(labels, coordinates))
+
+
+def position_to_notation(board_state: BoardState) -> str:
+    """Returns the position notation of the given board state.
+
+    Parameters
+    ----------
+    board_state: BoardState
+        The board state to write.
+    """
+    dimension = board_state.board.dimension
+    labels, order, _ = get_labels(dimension)
+    cell_index = get_cell_index(dimension)
+    index = cell_index.index
+    coordinates = cell_index.coordinates
+    fields = [str(dimension)]
+    for player in Player:
+        cells = sorted((index(coord) for coord in board_state.player_coordinates(player)), key=order.__getitem__)
+        pieces = [
+            PIECE_LETTERS[board_state.piece_map[coordinates[cell]].piece_type] + labels[cell] for cell in cells
+        ]
+        fields.append(",".join(pieces) if pieces else NO_PIECES)
+    fields.append(PLAYER_LETTERS[board_state.side_to_move])
+    return " ".join(fields)
+
+
+def position_from_notation(
+    notation: str,
+    trusted: bool = False
+) -> BoardState:
+    """Returns the board state of the given position notation.
+
+    Parameters
+    ----------
+    notation: str
+        The position notation to read.
+
+    trusted: bool
+        If True the notation is assumed to be valid, for example because it was written by position_to_notation(), and
+        the board state is built without checking that every piece is well formed, on the board and on a hex of its
+        own. Invalid notation may then raise any exception or build an invalid board state.
+    """
+    fields = notation.split()
+    if not trusted:
+        if len(fields) != 5:
+            raise ValueError("Expected 5 fields in position notation but got {}: {}".format(len(fields), notation))
+        if not fields[0].isdigit() or int(fields[0]) == 0:
+            raise ValueError("Invalid board dimension: {}".format(fields[0]))
+        if fields[4] not in LETTER_PLAYERS:
+            raise ValueError("Invalid player to move: {}".format(fields[4]))
+
+    dimension = int(fields[0])
+    _, _, coordinates = get_labels(dimension)
+    piece_map: Dict[BoardCoordinate, PieceInfo] = dict()
+    player_piece_map: Dict[Player, Set[BoardCoordinate]] = dict()
+    for player, field in zip(Player, fields[1:4]):
+        player_coordinates: List[BoardCoordinate] = []
+        if field != NO_PIECES:
+            for piece in field.split(","):
+                if trusted:
+                    coord = coordinates[piece[1:]]
+                    piece_map[coord] = PieceInfo(player, LETTER_PIECES[piece[0]])
+                    player_coordinates.append(coord)
+                    continue
+
+                piece_type = LETTER_PIECES.get(piece[:1])
+                if piece_type is None:
+                    raise ValueError("Invalid piece {} in position notation.".format(piece))
+                checked = coordinates.get(piece[1:])
+                if checked is None:
+                    raise ValueError("{} is not a hex on a board of dimension {}.".format(piece[1:], dimension))
+                if checked in piece_map:
+                    raise ValueError("There is already a piece at {}.".format(piece[1:]))
+                piece_map[checked] = PieceInfo(player, piece_type)
+                player_coordinates.append(checked)
+        player_piece_map[player] = set(player_coordinates)
+    return BoardState(get_board(dimension), piece_map, player_piece_map, LETTER_PLAYERS[fields[4]])
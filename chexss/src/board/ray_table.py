@@ -0,0 +1,84 @@
+"""
+ray_table.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+from functools import lru_cache
+from typing import Dict, Tuple
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+from src.board.direction_iterator import DirectionIterator
+from src.board.direction_utils import all_direction_deltas
+
+
+Ray = Tuple[BoardCoordinate, ...]
+
+
+class RayTable:
+    """This class holds, for every coordinate on a board, the ray of coordinates in each of the twelve directions from
+    all_direction_deltas() until the edge of the board. The rays only depend on the dimension of the board, so they are
+    computed once up front and sliding pieces can simply scan them until they hit a blocker instead of stepping with a
+    DirectionIterator and checking each coordinate against the board. Use get_ray_table() to get a shared instance.
+    """
+
+    def __init__(self, board: Board) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        board: Board
+            The board to build the rays for.
+        """
+        self._dimension = board.dimension
+
+        # We reuse the coordinate objects from the board so every ray shares the same instances.
+        canonical: Dict[BoardCoordinate, BoardCoordinate] = {coord: coord for coord in board.coordinates}
+        directions = all_direction_deltas()
+
+        self._rays: Dict[BoardCoordinate, Tuple[Ray, ...]] = dict()
+        for coord in board.coordinates:
+            rays = []
+            for direction in directions:
+                ray = []
+                it = DirectionIterator(coord, direction)
+                next_coord = it.next()
+                while board.is_valid_coordinate(next_coord):
+                    ray.append(canonical[next_coord])
+                    next_coord = it.next()
+                rays.append(tuple(ray))
+            self._rays[coord] = tuple(rays)
+
+        # all_direction_deltas() lists the six orthogonal directions followed by the six diagonal directions.
+        self._orthogonal_rays = {coord: rays[:6] for coord, rays in self._rays.items()}
+        self._diagonal_rays = {coord: rays[6:] for coord, rays in self._rays.items()}
+
+    def rays(self, coord: BoardCoordinate) -> Tuple[Ray, ...]:
+        """Returns the rays from the given coordinate in the same order as all_direction_deltas(). Each ray is ordered
+        from the nearest coordinate to the edge of the board and does not include the coordinate itself."""
+        return self._rays[coord]
+
+    def orthogonal_rays(self, coord: BoardCoordinate) -> Tuple[Ray, ...]:
+        """Returns the rays from the given coordinate in the same order as orthogonal_direction_deltas()."""
+        return self._orthogonal_rays[coord]
+
+    def diagonal_rays(self, coord: BoardCoordinate) -> Tuple[Ray, ...]:
+        """Returns the rays from the given coordinate in the same order as diagonal_direction_deltas()."""
+        return self._diagonal_rays[coord]
+
+    @property
+    def dimension(self) -> int:
+        """The dimension of the board, ie the number of hexes on a side."""
+        return self._dimension
+
+
+@lru_cache(maxsize=None)
+def get_ray_table(dimension: int) -> RayTable:
+    """Returns the RayTable for a board of the given dimension. The table is built the first time it is requested and
+    shared by every caller after that.
+
+    Parameters
+    ----------
+    dimension: int
+        The dimension of the board, ie the number of hexes on a side.
+    """
+    return RayTable(Board(dimension))
@@ -0,0 +1,143 @@
+"""
+symmetry.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+from functools import lru_cache
+from typing import Tuple
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state import BoardState, BoardStateBuilder
+from src.board.cell_index import get_cell_index
+from src.board.direction_iterator import DirectionDelta
+from src.pieces.player import Player
+
+
+# The board looks the same to each player: turning it a third of the way around, which takes the cube coordinates
+# (q, r, s) to (r, s, q), takes white's side of the board to silver's and silver's to black's. Since the players also
+# move in that order, turning a position and giving each player's pieces to the next player gives a position that plays
+# the same way, so a position and its two turns are one position as far as searching or storing it is concerned.
+#
+# The board is also the same when mirrored, but a mirror swaps two of the players' sides and so reverses the order they
+# move in, which makes it a different game. reflect() is there for drawing and for the coordinates themselves, but it is
+# not used to compare positions.
+TURNS = 3
+
+# A table that maps the cell index of every hex to the cell index of the hex it is taken to.
+CellTable = Tuple[int, ...]
+
+
+def rotate(coord: BoardCoordinate, turns: int = 1) -> BoardCoordinate:
+    """Returns the hex the given hex is taken to by turning the board a third of the way around the given number of
+    times, from white's side towards silver's. A negative number of turns turns the other way."""
+    q, r, s = coord.q, coord.r, coord.s
+    for _ in range(turns % TURNS):
+        q, r, s = r, s, q
+    return BoardCoordinate(q, r)
+
+
+def reflect(coord: BoardCoordinate) -> BoardCoordinate:
+    """Returns the hex the given hex is taken to by mirroring the board in the line through the middle of white's base
+    row and the center, which swaps the q and s coordinates and swaps silver's side of the board with black's."""
+    return BoardCoordinate(coord.s, coord.r)
+
+
+def rotate_delta(delta: DirectionDelta, turns: int = 1) -> DirectionDelta:
+    """Returns the direction the given direction is taken to by turning the board, like rotate()."""
+    q, r, s = delta.q, delta.r, -delta.q - delta.r
+    for _ in range(turns % TURNS):
+        q, r, s = r, s, q
+    return DirectionDelta(q, r)
+
+
+def rotate_player(player: Player, turns: int = 1) -> Player:
+    """Returns the player whose side of the board the given player's side is taken to by turning the board."""
+    return Player((player.value + turns) % TURNS)
+
+
+@lru_cache(maxsize=None)
+def get_rotation_table(dimension: int, turns: int = 1) -> CellTable:
+    """Returns the table of where rotate() takes every hex of a board of the given dimension, by cell index. Turning a
+    whole position or bitboard is then one lookup per piece or bit rather than building a coordinate for each one.
+
+    Parameters
+    ----------
+    dimension: int
+        The dimension of the board.
+
+    turns: int
+        The number of times to turn the board.
+    """
+    cell_index = get_cell_index(dimension)
+    return tuple(cell_index.index(rotate(coord, turns)) for coord in cell_index.coordinates)
+
+
+@lru_cache(maxsize=None)
+def get_reflection_table(dimension: int) -> CellTable:
+    """Returns the table of where reflect() takes every hex of a board of the given dimension, by cell index.
+
+    Parameters
+    ----------
+    dimension: int
+        The dimension of the board.
+    """
+    cell_index = get_cell_index(dimension)
+    return tuple(cell_index.index(reflect(coord)) for coord in cell_index.coordinates)
+
+
+def transform_mask(mask: int, table: CellTable) -> int:
+    """Returns the bitboard mask with every bit moved to where the table takes it.
+
+    Parameters
+    ----------
+    mask: int
+        The mask to transform, with bit i for the hex with cell index i.
+
+    table: CellTable
+        A table from get_rotation_table() or get_reflection_table() for the board of the mask.
+    """
+    transformed = 0
+    while mask:
+        low = mask & -mask
+        transformed |= 1 << table[low.bit_length() - 1]
+        mask ^= low
+    return transformed
+
+
+def rotate_board_state(board_state: BoardState, turns: int = 1) -> BoardState:
+    """Returns a new board state with every piece turned with the board and given to the player whose side it turns
+    to, and with the player to move turned the same way.
+
+    Parameters
+    ----------
+    board_state: BoardState
+        The position to turn. It is not changed.
+
+    turns: int
+        The number of times to turn the board.
+    """
+    dimension = board_state.board.dimension
+    cell_index = get_cell_index(dimension)
+    table = get_rotation_table(dimension, turns % TURNS)
+    builder = BoardStateBuilder(board_state.board)
+    for coord, piece_info in board_state.piece_map.items():
+        builder.add_piece(
+            rotate_player(piece_info.player, turns),
+            cell_index.coordinate(table[cell_index.index(coord)]),
+            piece_info.piece_type)
+    builder.set_side_to_move(rotate_player(board_state.side_to_move, turns))
+    return builder.build()
+
+
+def canonical_board_state(board_state: BoardState) -> Tuple[BoardState, int]:
+    """Returns the position turned so that it is white's turn, along with the number of turns that takes. The three
+    turns of a position each have a different player to move, so every position and its turns have the same canonical
+    position, and a cache or database keyed on it, for example with encode_board_state(), needs one entry for all
+    three. Turn a move found in the canonical position back with rotate() and the negative number of turns.
+
+    Parameters
+    ----------
+    board_state: BoardState
+        The position. It is not changed.
+    """
+    turns = -board_state.side_to_move.value % TURNS
+    return rotate_board_state(board_state, turns), turns
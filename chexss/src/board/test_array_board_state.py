@@ -0,0 +1,57 @@
+"""
+test_array_board_state.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import unittest
+from src.board.array_board_state import ArrayBoardState
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state_utils import generate_initial_board_state
+from src.board.cell_index import get_cell_index
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+
+
+class TestArrayBoardState(unittest.TestCase):
+
+    def test_cell_index_round_trip(self):
+        """We test that every coordinate maps to its position in Board.coordinates and back."""
+        for dimension in [1, 2, 6, 7, 8]:
+            board = Board(dimension)
+            cell_index = get_cell_index(dimension)
+            self.assertEqual(cell_index.size, len(board.coordinates))
+            for index, coord in enumerate(board.coordinates):
+                self.assertEqual(cell_index.index(coord), index)
+                self.assertEqual(cell_index.coordinate(index), coord)
+        self.assertEqual(get_cell_index(7).size, 127)
+
+    def test_round_trip_with_board_state(self):
+        """We test that converting the initial board state and back gives the same pieces."""
+        board_state = generate_initial_board_state()
+        array_state = ArrayBoardState.from_board_state(board_state)
+        self.assertEqual(len(array_state.cells), 127)
+
+        for coord in board_state.board.coordinates:
+            expected = board_state.get_piece_info(coord)
+            actual = array_state.get_piece_info(coord)
+            if expected is None:
+                self.assertIsNone(actual)
+            else:
+                self.assertEqual(actual.player, expected.player)
+                self.assertEqual(actual.piece_type, expected.piece_type)
+
+        round_trip = array_state.to_board_state()
+        self.assertEqual(set(round_trip.piece_map.keys()), set(board_state.piece_map.keys()))
+
+    def test_copy_is_independent(self):
+        """We test that changing a copy does not change the original."""
+        array_state = ArrayBoardState(Board(4))
+        index = array_state.cell_index.index(BoardCoordinate(0, 0))
+        array_state.set_piece(index, Player.SILVER, PieceType.QUEEN)
+
+        copy = array_state.copy()
+        copy.clear(index)
+        self.assertIsNone(copy.get_piece_info(BoardCoordinate(0, 0)))
+        self.assertEqual(array_state.get_piece_info(BoardCoordinate(0, 0)).piece_type, PieceType.QUEEN)
+        self.assertEqual(array_state.get_piece_info(BoardCoordinate(0, 0)).player, Player.SILVER)
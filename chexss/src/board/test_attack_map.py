@@ -0,0 +1,81 @@
+"""
+test_attack_map.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import random
+import unittest
+from src.board.attack_map import AttackMap
+from src.board.bitboards import Bitboards
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state import BoardStateBuilder
+from src.board.board_state_utils import generate_initial_board_state
+from src.pieces.move import Move
+from src.pieces.move_generator import generate_moves
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+
+
+class TestAttackMap(unittest.TestCase):
+
+    def _assert_matches_bitboards(self, attack_map: AttackMap):
+        bitboards = attack_map.bitboards
+        for player in Player:
+            self.assertEqual(attack_map.attacks(player), bitboards.attacks(player))
+
+    def test_initial_position(self):
+        """We test that the attack map of the initial position matches the bitboard attacks."""
+        attack_map = AttackMap.from_board_state(generate_initial_board_state())
+        self._assert_matches_bitboards(attack_map)
+        for player in Player:
+            self.assertFalse(attack_map.is_in_check(player))
+
+    def test_incremental_updates(self):
+        """We test that the incremental updates match a rebuilt attack map through a game of random moves, and that
+        taking the moves back restores the original attacks."""
+        rng = random.Random(7)
+        board_state = generate_initial_board_state()
+        attack_map = AttackMap.from_board_state(board_state)
+        original = [attack_map.attacks(player) for player in Player]
+        undos = []
+        for _ in range(60):
+            moves = generate_moves(board_state, board_state.side_to_move)
+            if not moves:
+                break
+            move = rng.choice(moves)
+            promotion_type = PieceType.QUEEN if move.promotion else None
+            undos.append((board_state.make_move(move, promotion_type), attack_map.make_move(move, promotion_type)))
+            rebuilt = Bitboards.from_board_state(board_state)
+            for player in Player:
+                self.assertEqual(attack_map.attacks(player), rebuilt.attacks(player))
+
+        for board_undo, attack_undo in reversed(undos):
+            attack_map.unmake_move(attack_undo)
+            board_state.unmake_move(board_undo)
+        self.assertEqual([attack_map.attacks(player) for player in Player], original)
+        self._assert_matches_bitboards(attack_map)
+
+    def test_check_detection(self):
+        """We test that a rook attacking a king is seen as check, and that blocking the rook stops it."""
+        board_state = (
+            BoardStateBuilder(Board(5))
+            .add_piece(Player.WHITE, BoardCoordinate(0, 3), PieceType.KING)
+            .add_piece(Player.WHITE, BoardCoordinate(2, 1), PieceType.KNIGHT)
+            .add_piece(Player.BLACK, BoardCoordinate(0, -3), PieceType.ROOK)
+            .add_piece(Player.SILVER, BoardCoordinate(-3, 3), PieceType.KING)
+            .build())
+        attack_map = AttackMap.from_board_state(board_state)
+        king = BoardCoordinate(0, 3)
+        self.assertTrue(attack_map.is_in_check(Player.WHITE))
+        self.assertEqual(attack_map.checking_players(Player.WHITE), [Player.BLACK])
+        self.assertTrue(attack_map.is_attacked(king, Player.BLACK))
+        self.assertIn(king, attack_map.attacked_coordinates(Player.BLACK))
+        rook_bit = 1 << attack_map.bitboards.masks.cell_index.index(BoardCoordinate(0, -3))
+        self.assertEqual(attack_map.attackers(attack_map.king_index(Player.WHITE), Player.BLACK), rook_bit)
+
+        undo = attack_map.make_move(Move(BoardCoordinate(2, 1), BoardCoordinate(0, 2)))
+        self.assertFalse(attack_map.is_in_check(Player.WHITE))
+        attack_map.unmake_move(undo)
+        self.assertTrue(attack_map.is_in_check(Player.WHITE))
+        self.assertFalse(attack_map.is_in_check(Player.SILVER))
@@ -0,0 +1,91 @@
+"""
+test_bitboards.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import unittest
+from src.board.bitboards import Bitboards, bit_indexes
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state import BoardState, BoardStateBuilder
+from src.board.board_state_utils import generate_initial_board_state
+from src.board.direction_iterator import DirectionIterator
+from src.board.direction_utils import pawn_capture_direction_deltas
+from src.pieces.piece_type import PieceType
+from src.pieces.piece_utils import get_piece_from_type
+from src.pieces.player import Player
+
+
+class TestBitboards(unittest.TestCase):
+
+    def _expected_attacks(self, board_state: BoardState, player: Player) -> set:
+        """The cells the player attacks that are not occupied by their own pieces, worked out with the Piece classes."""
+        attacked = set()
+        for coord, piece_info in board_state.piece_map.items():
+            if piece_info.player != player:
+                continue
+            if piece_info.piece_type == PieceType.PAWN:
+                for direction in pawn_capture_direction_deltas(player):
+                    target = DirectionIterator(coord, direction).next()
+                    if board_state.board.is_valid_coordinate(target):
+                        attacked.add(target)
+            else:
+                attacked |= get_piece_from_type(piece_info.piece_type).moves(coord, board_state)
+        expected = set()
+        for coord in attacked:
+            target_info = board_state.get_piece_info(coord)
+            if target_info is None or target_info.player != player:
+                expected.add(coord)
+        return expected
+
+    def _assert_attacks_match(self, board_state: BoardState):
+        bitboards = Bitboards.from_board_state(board_state)
+        cell_index = bitboards.masks.cell_index
+        for player in Player:
+            attacks = bitboards.attacks(player) & ~bitboards.occupancy(player)
+            actual = {cell_index.coordinate(index) for index in bit_indexes(attacks)}
+            self.assertEqual(actual, self._expected_attacks(board_state, player))
+            for index in range(cell_index.size):
+                self.assertEqual(bitboards.is_attacked(index, player), bitboards.attacks(player) >> index & 1 == 1)
+
+    def test_attacks_in_initial_position(self):
+        """We test that the attacked cells match the moves of the individual pieces in the initial position."""
+        self._assert_attacks_match(generate_initial_board_state())
+
+    def test_attacks_with_open_lines(self):
+        """We test the attacked cells when sliding pieces have open lines in both index directions."""
+        board_state = (
+            BoardStateBuilder(Board(7))
+            .add_piece(Player.WHITE, BoardCoordinate(0, 0), PieceType.QUEEN)
+            .add_piece(Player.WHITE, BoardCoordinate(-3, 1), PieceType.ROOK)
+            .add_piece(Player.WHITE, BoardCoordinate(1, 4), PieceType.KING)
+            .add_piece(Player.SILVER, BoardCoordinate(0, -3), PieceType.BISHOP)
+            .add_piece(Player.SILVER, BoardCoordinate(2, -2), PieceType.KNIGHT)
+            .add_piece(Player.SILVER, BoardCoordinate(4, -1), PieceType.PAWN)
+            .add_piece(Player.BLACK, BoardCoordinate(-2, 2), PieceType.BISHOP)
+            .add_piece(Player.BLACK, BoardCoordinate(-1, -2), PieceType.PAWN)
+            .add_piece(Player.BLACK, BoardCoordinate(3, 0), PieceType.ROOK)
+            .build())
+        self._assert_attacks_match(board_state)
+
+    def test_occupancy_tests(self):
+        """We test the bitboard versions of the move_utils occupancy tests."""
+        board_state = (
+            BoardStateBuilder(Board(4))
+            .add_piece(Player.WHITE, BoardCoordinate(0, 0), PieceType.ROOK)
+            .add_piece(Player.BLACK, BoardCoordinate(1, 0), PieceType.PAWN)
+            .build())
+        bitboards = Bitboards.from_board_state(board_state)
+        index = bitboards.masks.cell_index.index
+
+        self.assertTrue(bitboards.location_is_occupied(index(BoardCoordinate(0, 0))))
+        self.assertFalse(bitboards.location_is_occupied(index(BoardCoordinate(0, 1))))
+        self.assertFalse(bitboards.is_valid_move_location(Player.WHITE, index(BoardCoordinate(0, 0))))
+        self.assertTrue(bitboards.is_valid_move_location(Player.WHITE, index(BoardCoordinate(1, 0))))
+        self.assertTrue(bitboards.is_valid_capture_location(Player.WHITE, index(BoardCoordinate(1, 0))))
+        self.assertFalse(bitboards.is_valid_capture_location(Player.BLACK, index(BoardCoordinate(1, 0))))
+        self.assertFalse(bitboards.is_valid_capture_location(Player.WHITE, index(BoardCoordinate(0, 1))))
+
+        bitboards.remove_piece(index(BoardCoordinate(1, 0)), Player.BLACK, PieceType.PAWN)
+        self.assertFalse(bitboards.location_is_occupied(index(BoardCoordinate(1, 0))))
+        self.assertEqual(bitboards.occupancy(Player.BLACK), 0)
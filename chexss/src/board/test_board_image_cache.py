@@ -0,0 +1,34 @@
+"""
+test_board_image_cache.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import unittest
+from src.board.board import Board
+from src.board.board_colors import BoardColors
+from src.board.board_image import BoardImage
+from src.board.board_image_cache import clear_board_image_cache, get_board_image
+from src.board.hex_meta import HexMeta
+from src.diagram.diagram_generator import DiagramGenerator
+from src.utils.rgb_color import RgbColor
+
+
+class TestBoardImageCache(unittest.TestCase):
+
+    def test_board_images_are_shared(self):
+        """We test that a board is drawn once for each dimension, hex width and colors and then shared."""
+        clear_board_image_cache()
+        board_image = get_board_image(Board(7), HexMeta(50))
+        self.assertIs(get_board_image(Board(7), HexMeta(50), BoardColors.CreateDefault()), board_image)
+        self.assertIsNot(get_board_image(Board(5), HexMeta(50)), board_image)
+        self.assertIsNot(get_board_image(Board(7), HexMeta(60)), board_image)
+        colors = BoardColors(RgbColor(0, 0, 0), RgbColor(1, 1, 1), RgbColor(2, 2, 2))
+        self.assertIsNot(get_board_image(Board(7), HexMeta(50), colors), board_image)
+
+    def test_matches_board_image(self):
+        """We test that the cached board looks the same as a newly drawn one and is not changed by drawing on it."""
+        board_image = get_board_image(Board(4), HexMeta(30))
+        self.assertEqual(board_image.image.tobytes(), BoardImage(Board(4), HexMeta(30)).image.tobytes())
+        generator = DiagramGenerator(board_image)
+        generator.image.paste((0, 0, 0, 255), (0, 0) + generator.image.size)
+        self.assertEqual(board_image.image.tobytes(), BoardImage(Board(4), HexMeta(30)).image.tobytes())
@@ -0,0 +1,72 @@
+"""
+test_board_state.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import unittest
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state import BoardState, BoardStateBuilder
+from src.board.board_state_utils import generate_initial_board_state
+from src.pieces.move import Move
+from src.pieces.move_generator import generate_moves
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+
+
+class TestBoardState(unittest.TestCase):
+
+    def _snapshot(self, board_state: BoardState):
+        pieces = {coord: (info.player, info.piece_type) for coord, info in board_state.piece_map.items()}
+        players = {player: set(board_state.player_coordinates(player)) for player in Player}
+        return pieces, players
+
+    def _assert_player_map_in_sync(self, board_state: BoardState):
+        for player in Player:
+            expected = {coord for coord, info in board_state.piece_map.items() if info.player == player}
+            self.assertEqual(board_state.player_coordinates(player), expected)
+
+    def test_make_and_unmake_every_move(self):
+        """We test that making and then unmaking every move in the initial position restores the position."""
+        board_state = generate_initial_board_state()
+        before = self._snapshot(board_state)
+        for player in Player:
+            for move in generate_moves(board_state, player):
+                undo = board_state.make_move(move)
+                self.assertIsNone(board_state.get_piece_info(move.from_coord))
+                self.assertEqual(board_state.get_piece_info(move.to_coord).player, player)
+                self._assert_player_map_in_sync(board_state)
+                board_state.unmake_move(undo)
+                self.assertEqual(self._snapshot(board_state), before)
+
+    def test_capture_and_promotion(self):
+        """We test that a capturing promotion updates both players and can be taken back."""
+        board_state = (
+            BoardStateBuilder(Board(7))
+            .add_piece(Player.WHITE, BoardCoordinate(5, -2), PieceType.PAWN)
+            .add_piece(Player.BLACK, BoardCoordinate(6, -4), PieceType.KNIGHT)
+            .build())
+        before = self._snapshot(board_state)
+
+        move = Move(BoardCoordinate(5, -2), BoardCoordinate(6, -4), PieceType.KNIGHT, True)
+        undo = board_state.make_move(move, PieceType.QUEEN)
+        self.assertEqual(board_state.get_piece_info(BoardCoordinate(6, -4)).piece_type, PieceType.QUEEN)
+        self.assertEqual(board_state.player_coordinates(Player.BLACK), set())
+        self.assertEqual(board_state.player_coordinates(Player.WHITE), {BoardCoordinate(6, -4)})
+        self.assertEqual(undo.captured.piece_type, PieceType.KNIGHT)
+
+        board_state.unmake_move(undo)
+        self.assertEqual(self._snapshot(board_state), before)
+
+    def test_invalid_moves_fail(self):
+        """We test that moving from an empty coordinate or capturing your own piece fails."""
+        board_state = (
+            BoardStateBuilder(Board(4))
+            .add_piece(Player.WHITE, BoardCoordinate(0, 0), PieceType.ROOK)
+            .add_piece(Player.WHITE, BoardCoordinate(1, 0), PieceType.KING)
+            .build())
+
+        with self.assertRaises(Exception):
+            board_state.make_move(Move(BoardCoordinate(0, 1), BoardCoordinate(0, 2)))
+        with self.assertRaises(Exception):
+            board_state.make_move(Move(BoardCoordinate(0, 0), BoardCoordinate(1, 0)))
@@ -0,0 +1,54 @@
+"""
+test_board_state_codec.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import unittest
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state import BoardStateBuilder
+from src.board.board_state_codec import decode_board_state, encode_board_state, encoded_size
+from src.board.board_state_utils import generate_initial_board_state
+from src.pieces.move_generator import generate_moves
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+
+
+class TestBoardStateCodec(unittest.TestCase):
+
+    def test_round_trip(self):
+        """We test that positions decode to equal board states, with the same player to move and hash."""
+        board_state = generate_initial_board_state()
+        for _ in range(6):
+            encoded = encode_board_state(board_state)
+            self.assertEqual(encoded_size(encoded), len(encoded))
+            decoded = decode_board_state(encoded)
+            self.assertEqual(decoded, board_state)
+            self.assertEqual(decoded.side_to_move, board_state.side_to_move)
+            self.assertEqual(decoded.zobrist_hash, board_state.zobrist_hash)
+            self.assertEqual(decoded.player_coordinates(Player.SILVER), board_state.player_coordinates(Player.SILVER))
+            board_state.make_move(generate_moves(board_state, board_state.side_to_move)[-1])
+
+    def test_offset(self):
+        """We test that board states can be decoded from the middle of a larger buffer."""
+        board_state = (
+            BoardStateBuilder(Board(4))
+            .add_piece(Player.BLACK, BoardCoordinate(3, -3), PieceType.QUEEN)
+            .set_side_to_move(Player.BLACK)
+            .build())
+        empty = BoardStateBuilder(Board(2)).build()
+        data = b"xyz" + encode_board_state(empty) + encode_board_state(board_state) + b"trailing"
+        offset = 3 + encoded_size(data, 3)
+        self.assertEqual(decode_board_state(data, 3), empty)
+        self.assertEqual(decode_board_state(memoryview(data), offset), board_state)
+        self.assertEqual(len(encode_board_state(board_state)), 2 + 5 + 1)
+
+    def test_invalid(self):
+        """We test that truncated or corrupt data is rejected."""
+        encoded = encode_board_state(generate_initial_board_state())
+        with self.assertRaises(ValueError):
+            decode_board_state(encoded[:-1])
+        with self.assertRaises(ValueError):
+            decode_board_state(encoded[:-1] + b"\x00")
+        with self.assertRaises(ValueError):
+            decode_board_state(b"\x00\x00")
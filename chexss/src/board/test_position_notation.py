@@ -0,0 +1,52 @@
+"""
+test_position_notation.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import unittest
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state import BoardStateBuilder
+from src.board.board_state_utils import generate_initial_board_state
+from src.board.position_notation import position_from_notation, position_to_notation
+from src.pieces.move_generator import generate_moves
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+
+
+class TestPositionNotation(unittest.TestCase):
+
+    def test_write(self):
+        """We test the notation of a small position, including a player with no pieces."""
+        board_state = (
+            BoardStateBuilder(Board(4))
+            .add_piece(Player.SILVER, BoardCoordinate(3, -3), PieceType.ROOK)
+            .add_piece(Player.WHITE, BoardCoordinate(0, 3), PieceType.KING)
+            .add_piece(Player.WHITE, BoardCoordinate(0, 0), PieceType.PAWN)
+            .set_side_to_move(Player.SILVER)
+            .build())
+        self.assertEqual(position_to_notation(board_state), "4 Pg4,Kj1 Rj7 - s")
+
+    def test_round_trip(self):
+        """We test that reading the notation of a position gives back the same position, trusted or not."""
+        board_state = generate_initial_board_state()
+        for _ in range(5):
+            notation = position_to_notation(board_state)
+            self.assertEqual(position_from_notation(notation), board_state)
+            self.assertEqual(position_from_notation(notation, trusted=True), board_state)
+            self.assertEqual(position_to_notation(position_from_notation(notation)), notation)
+            board_state.make_move(generate_moves(board_state, board_state.side_to_move)[0])
+        self.assertEqual(position_from_notation(notation).side_to_move, Player.SILVER)
+
+    def test_invalid(self):
+        """We test that invalid notation is rejected when it is not trusted."""
+        for notation in [
+            "4 Kj1 Rj7 - s extra",
+            "x Kj1 Rj7 - s",
+            "4 Kj1 Rj7 - x",
+            "4 Xj1 Rj7 - s",
+            "4 Ka1 Rj7 - s",
+            "4 Kj1 Rj1 - s",
+        ]:
+            with self.assertRaises(ValueError):
+                position_from_notation(notation)
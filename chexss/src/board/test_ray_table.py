@@ -0,0 +1,42 @@
+"""
+test_ray_table.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import unittest
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+from src.board.direction_iterator import DirectionIterator
+from src.board.direction_utils import all_direction_deltas
+from src.board.ray_table import get_ray_table
+
+
+class TestRayTable(unittest.TestCase):
+
+    def test_rays_match_direction_iterator(self):
+        """We test that every ray matches walking the direction with a DirectionIterator until the edge."""
+        board = Board(5)
+        table = get_ray_table(5)
+        for coord in board.coordinates:
+            for direction, ray in zip(all_direction_deltas(), table.rays(coord)):
+                expected = []
+                it = DirectionIterator(coord, direction)
+                next_coord = it.next()
+                while board.is_valid_coordinate(next_coord):
+                    expected.append(next_coord)
+                    next_coord = it.next()
+                self.assertEqual(list(ray), expected)
+
+    def test_orthogonal_and_diagonal_rays(self):
+        """We test the orthogonal and diagonal rays from the corner of a small board."""
+        table = get_ray_table(3)
+        coord = BoardCoordinate(2, -2)
+        self.assertEqual(table.orthogonal_rays(coord)[2], (BoardCoordinate(2, -1), BoardCoordinate(2, 0)))
+        self.assertEqual(table.diagonal_rays(coord)[2], (BoardCoordinate(1, 0), BoardCoordinate(0, 2)))
+        self.assertEqual(table.orthogonal_rays(coord)[0], ())
+        self.assertEqual(table.rays(coord), table.orthogonal_rays(coord) + table.diagonal_rays(coord))
+
+    def test_table_is_shared(self):
+        """We test that the table is only built once per dimension."""
+        self.assertIs(get_ray_table(7), get_ray_table(7))
+        self.assertEqual(get_ray_table(7).dimension, 7)
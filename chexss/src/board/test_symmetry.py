@@ -0,0 +1,111 @@
+"""
+test_symmetry.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import random
+import unittest
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state_codec import encode_board_state
+from src.board.board_state_utils import generate_initial_board_state
+from src.board.cell_index import get_cell_index
+from src.board.direction_utils import pawn_capture_direction_deltas, pawn_move_direction_deltas
+from src.board.symmetry import (
+    canonical_board_state,
+    get_reflection_table,
+    get_rotation_table,
+    reflect,
+    rotate,
+    rotate_board_state,
+    rotate_player,
+    transform_mask
+)
+from src.pieces.move_generator import generate_moves
+from src.pieces.player import Player
+
+
+class TestSymmetry(unittest.TestCase):
+
+    def test_rotate(self):
+        """We test that turning the board takes white's king to silver's and silver's to black's."""
+        white_king = BoardCoordinate(-4, 6)
+        self.assertEqual(rotate(white_king), BoardCoordinate(6, -2))
+        self.assertEqual(rotate(white_king, 2), BoardCoordinate(-2, -4))
+        self.assertEqual(rotate(white_king, -1), BoardCoordinate(-2, -4))
+        self.assertEqual(rotate(white_king, 3), white_king)
+        self.assertEqual(rotate_player(Player.BLACK), Player.WHITE)
+        self.assertEqual(rotate_player(Player.WHITE, -1), Player.BLACK)
+
+    def test_reflect(self):
+        """We test that mirroring keeps white's base row and swaps silver's side with black's."""
+        self.assertEqual(reflect(BoardCoordinate(-4, 6)), BoardCoordinate(-2, 6))
+        self.assertEqual(reflect(BoardCoordinate(6, -2)), BoardCoordinate(-4, -2))
+        for coord in get_cell_index(4).coordinates:
+            self.assertEqual(reflect(reflect(coord)), coord)
+
+    def test_pawn_directions(self):
+        """We test that the pawn directions turned from white's are the ones each player's pawns have always had."""
+        moves = {
+            Player.WHITE: [(0, -1), (1, -1)],
+            Player.SILVER: [(-1, 1), (-1, 0)],
+            Player.BLACK: [(1, 0), (0, 1)],
+        }
+        captures = {
+            Player.WHITE: [(-1, -1), (1, -2), (2, -1)],
+            Player.SILVER: [(-1, 2), (-2, 1), (-1, -1)],
+            Player.BLACK: [(2, -1), (1, 1), (-1, 2)],
+        }
+        for player in Player:
+            self.assertEqual([(delta.q, delta.r) for delta in pawn_move_direction_deltas(player)], moves[player])
+            self.assertEqual([(delta.q, delta.r) for delta in pawn_capture_direction_deltas(player)], captures[player])
+
+    def test_tables(self):
+        """We test that the tables move every hex of the board to another and agree with the coordinates."""
+        cell_index = get_cell_index(5)
+        for table, transform in ((get_rotation_table(5), rotate), (get_reflection_table(5), reflect)):
+            self.assertEqual(sorted(table), list(range(cell_index.size)))
+            for index, coord in enumerate(cell_index.coordinates):
+                self.assertEqual(cell_index.coordinate(table[index]), transform(coord))
+        mask = (1 << 0) | (1 << 7) | (1 << 30)
+        turned = transform_mask(mask, get_rotation_table(5))
+        self.assertEqual(bin(turned).count("1"), 3)
+        self.assertEqual(transform_mask(transform_mask(turned, get_rotation_table(5)), get_rotation_table(5)), mask)
+
+    def test_initial_position(self):
+        """We test that the initial position turns into itself."""
+        board_state = generate_initial_board_state()
+        for turns in range(3):
+            turned = rotate_board_state(board_state, turns)
+            self.assertEqual(turned.piece_map, board_state.piece_map)
+            self.assertEqual(turned.side_to_move, rotate_player(Player.WHITE, turns))
+
+    def test_turned_moves(self):
+        """We test that a turned position has the same moves as the position turned with it."""
+        board_state = generate_initial_board_state()
+        rng = random.Random(25)
+        for _ in range(40):
+            player = board_state.side_to_move
+            moves = generate_moves(board_state, player)
+            turned = rotate_board_state(board_state)
+            turned_moves = generate_moves(turned, rotate_player(player))
+            self.assertEqual(
+                {(rotate(move.from_coord), rotate(move.to_coord), move.captured) for move in moves},
+                {(move.from_coord, move.to_coord, move.captured) for move in turned_moves})
+            board_state.make_move(rng.choice(moves))
+
+    def test_canonical_board_state(self):
+        """We test that the turns of a position have the same canonical position, with white to move."""
+        board_state = generate_initial_board_state()
+        rng = random.Random(3)
+        for _ in range(20):
+            board_state.make_move(rng.choice(generate_moves(board_state, board_state.side_to_move)))
+            expected = None
+            for turns in range(3):
+                canonical, canonical_turns = canonical_board_state(rotate_board_state(board_state, turns))
+                self.assertEqual(canonical.side_to_move, Player.WHITE)
+                self.assertEqual(rotate_board_state(canonical, -canonical_turns).side_to_move, rotate_player(
+                    board_state.side_to_move, turns))
+                encoded = encode_board_state(canonical)
+                if expected is None:
+                    expected = encoded
+                self.assertEqual(encoded, expected)
@@ -0,0 +1,65 @@
+"""
+test_zobrist.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import random
+import unittest
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state_utils import generate_initial_board_state
+from src.board.zobrist import get_zobrist_keys
+from src.pieces.move import Move
+from src.pieces.move_generator import generate_moves
+from src.pieces.player import Player
+
+
+class TestZobrist(unittest.TestCase):
+
+    def test_incremental_hash_matches_full_hash(self):
+        """We test that the hash kept up to date by make_move and unmake_move matches hashing from scratch."""
+        board_state = generate_initial_board_state()
+        keys = get_zobrist_keys(board_state.board.dimension)
+        rng = random.Random(7)
+        undos = []
+        hashes = [board_state.zobrist_hash]
+        for _ in range(60):
+            moves = generate_moves(board_state, board_state.side_to_move)
+            undos.append(board_state.make_move(rng.choice(moves)))
+            self.assertEqual(board_state.zobrist_hash, keys.hash(board_state.piece_map, board_state.side_to_move))
+            hashes.append(board_state.zobrist_hash)
+
+        while undos:
+            hashes.pop()
+            board_state.unmake_move(undos.pop())
+            self.assertEqual(board_state.zobrist_hash, hashes[-1])
+        self.assertEqual(board_state, generate_initial_board_state())
+
+    def test_transpositions_are_equal(self):
+        """We test that reaching the same position by different move orders gives equal states and hashes."""
+        first = generate_initial_board_state()
+        second = generate_initial_board_state()
+        white_moves = [
+            Move(BoardCoordinate(-2, 3), BoardCoordinate(-2, 2)),
+            Move(BoardCoordinate(-1, 3), BoardCoordinate(-1, 2)),
+        ]
+        silver_move = Move(BoardCoordinate(3, -1), BoardCoordinate(2, -1))
+        black_move = Move(BoardCoordinate(-1, -2), BoardCoordinate(0, -2))
+
+        for board_state, order in [(first, white_moves), (second, list(reversed(white_moves)))]:
+            board_state.make_move(order[0])
+            board_state.make_move(silver_move)
+            board_state.make_move(black_move)
+            board_state.make_move(order[1])
+
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual(first.side_to_move, Player.SILVER)
+
+    def test_side_to_move_changes_hash(self):
+        """We test that the same pieces with a different player to move hash differently."""
+        board_state = generate_initial_board_state()
+        keys = get_zobrist_keys(board_state.board.dimension)
+        self.assertNotEqual(
+            keys.hash(board_state.piece_map, Player.WHITE),
+            keys.hash(board_state.piece_map, Player.SILVER))
+        self.assertEqual(board_state.zobrist_hash, keys.hash(board_state.piece_map, Player.WHITE))
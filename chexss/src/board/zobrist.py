@@ -0,0 +1,78 @@
+"""
+zobrist.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import random
+from functools import lru_cache
+from typing import Dict, Tuple
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+from src.pieces.piece_info import PieceInfo
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+
+
+# The keys are generated from a fixed seed so that hashes are the same in every process and on every run, which lets
+# them be stored and compared across processes.
+ZOBRIST_SEED = 0x43686578737321
+
+
+class ZobristKeys:
+    """This class holds the random 64-bit keys used for Zobrist hashing of board states. There is a key for every
+    combination of cell, player and piece type, and a key for each player to move. The hash of a position is the XOR of
+    the keys of every piece on the board and the key of the player to move, which means a move can update the hash by
+    XORing in and out just the keys that changed. Use get_zobrist_keys() to get a shared instance.
+    """
+
+    def __init__(self, board: Board) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        board: Board
+            The board to generate keys for.
+        """
+        rng = random.Random(ZOBRIST_SEED + board.dimension)
+        piece_count = len(Player) * len(PieceType)
+        self._piece_keys: Dict[BoardCoordinate, Tuple[int, ...]] = {
+            coord: tuple(rng.getrandbits(64) for _ in range(piece_count)) for coord in board.coordinates
+        }
+        self._side_keys: Tuple[int, ...] = tuple(rng.getrandbits(64) for _ in Player)
+
+    def piece_key(self, coord: BoardCoordinate, piece_info: PieceInfo) -> int:
+        """Returns the key for the given piece on the given coordinate."""
+        return self._piece_keys[coord][piece_info.player.value * len(PieceType) + piece_info.piece_type.value]
+
+    def side_key(self, player: Player) -> int:
+        """Returns the key for the given player being the player to move."""
+        return self._side_keys[player.value]
+
+    def hash(self, piece_map: Dict[BoardCoordinate, PieceInfo], side_to_move: Player) -> int:
+        """Returns the hash of the given pieces with the given player to move, computed from scratch.
+
+        Parameters
+        ----------
+        piece_map: Dict[BoardCoordinate, PieceInfo]
+            The pieces on the board.
+
+        side_to_move: Player
+            The player whose turn it is.
+        """
+        value = self._side_keys[side_to_move.value]
+        for coord, piece_info in piece_map.items():
+            value ^= self.piece_key(coord, piece_info)
+        return value
+
+
+@lru_cache(maxsize=None)
+def get_zobrist_keys(dimension: int) -> ZobristKeys:
+    """Returns the ZobristKeys for a board of the given dimension. They are generated the first time they are requested
+    and shared by every caller after that.
+
+    Parameters
+    ----------
+    dimension: int
+        The dimension of the board, ie the number of hexes on a side.
+    """
+    return ZobristKeys(Board(dimension))
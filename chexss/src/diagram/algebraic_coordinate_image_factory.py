@@ -3,11 +3,12 @@ algebraic_coordinate_image_factory.py
 Copyright © 2023 Derek Seiple
 Licensed under Creative Commons BY-NC-SA 3.0. See license file.
 """
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 from src.board.board_coordinate import BoardCoordinate
 from src.board.hex_meta import HexMeta
+from src.diagram.font_cache import LABEL_FONT, get_font
 from src.diagram.image_factory import ImageFactory
-from src.board.coordinate_converter import CoordinateConverter
+from src.board.coordinate_converter import get_coordinate_converter
 
 
 class AlgebraicCoordinateImageFactory(ImageFactory):
@@ -21,9 +22,8 @@ class AlgebraicCoordinateImageFactory(ImageFactory):
     ) -> Image.Image:
         img = Image.new("RGBA", (hex_meta.width, hex_meta.height), (255, 255, 255, 0))
         draw = ImageDraw.Draw(img)
-        convert = CoordinateConverter(board_dimension)
-        text = str(convert.board_to_algebraic(coordinate))
-        font = ImageFont.truetype("Arial Bold.ttf", int(hex_meta.height / 4))
+        text = str(get_coordinate_converter(board_dimension).board_to_algebraic(coordinate))
+        font = get_font(LABEL_FONT, int(hex_meta.height / 4))
         (_, _, text_w, text_h) = draw.textbbox((0, 0), text, font=font)
         x = round((hex_meta.width - text_w) / 2)
         y = round((hex_meta.height - text_h) / 2)
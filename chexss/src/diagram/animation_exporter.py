@@ -0,0 +1,284 @@
+"""
+animation_exporter.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import struct
+import zlib
+from abc import abstractmethod
+from io import BytesIO
+from PIL import GifImagePlugin, Image
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state import BoardState
+from src.board.hex_meta import HexMeta
+from src.diagram.diagram_generator import DiagramGenerator
+from src.diagram.diagram_generator_utils import get_diagram_generator_from_board_state
+from src.diagram.piece_image_factory import PieceImageFactory
+from src.pieces.piece_info import PieceInfo
+
+
+class AnimationWriter:
+    """This class is an abstract base class for writing the frames of an animation to a file one at a time. The first
+    frame is the full image, and each later frame is a rectangle of the image at an offset that is drawn over the frames
+    before it, so only the part of the image that changed needs to be written."""
+
+    @abstractmethod
+    def write_frame(
+        self,
+        image: Image.Image,
+        offset: Tuple[int, int],
+        duration: int
+    ) -> None:
+        """Write a frame of the animation.
+
+        Parameters
+        ----------
+        image: Image.Image
+            The RGBA image of the frame, or of the part of the frame that changed.
+
+        offset: Tuple[int, int]
+            Where the image goes in the animation. The first frame must be the full image at (0, 0).
+
+        duration: int
+            How long the frame is shown for in milliseconds.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self) -> None:
+        """Finish writing the animation. This does not close the underlying file."""
+        raise NotImplementedError
+
+
+class GifWriter(AnimationWriter):
+    """Writes an animated GIF. Each frame gets its own 256 color palette, and transparent pixels are drawn over the
+    given background color since GIF has no partial transparency."""
+
+    def __init__(
+        self,
+        output: BinaryIO,
+        loop: int = 0,
+        background: Tuple[int, int, int] = (255, 255, 255)
+    ) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        output: BinaryIO
+            The file to write the animation to.
+
+        loop: int
+            The number of times the animation plays, where 0 means forever.
+
+        background: Tuple[int, int, int]
+            The color drawn behind transparent pixels.
+        """
+        self._output = output
+        self._loop = loop
+        self._background = background
+        self._started = False
+
+    def write_frame(
+        self,
+        image: Image.Image,
+        offset: Tuple[int, int],
+        duration: int
+    ) -> None:
+        frame = Image.new("RGBA", image.size, self._background + (255,))
+        frame.alpha_composite(image)
+        quantized = frame.convert("RGB").quantize(256)
+        if not self._started:
+            header, _ = GifImagePlugin.getheader(quantized.copy(), info={"loop": self._loop})
+            self._output.write(b"".join(header))
+            self._started = True
+        for data in GifImagePlugin.getdata(quantized, offset, duration=duration, include_color_table=True):
+            self._output.write(data)
+
+    def close(self) -> None:
+        self._output.write(b";")
+
+
+class ApngWriter(AnimationWriter):
+    """Writes an animated PNG. The number of frames is not known until the animation is finished, so it is written as
+    zero and filled in by close(), which means the output must be seekable."""
+
+    _SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+    def __init__(
+        self,
+        output: BinaryIO,
+        loop: int = 0
+    ) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        output: BinaryIO
+            The file to write the animation to. This must be seekable.
+
+        loop: int
+            The number of times the animation plays, where 0 means forever.
+        """
+        if not output.seekable():
+            raise ValueError("An APNG can only be written to a seekable file.")
+        self._output = output
+        self._loop = loop
+        self._frames = 0
+        self._sequence = 0
+        self._animation_control: Optional[int] = None
+
+    def write_frame(
+        self,
+        image: Image.Image,
+        offset: Tuple[int, int],
+        duration: int
+    ) -> None:
+        header, data = self._encode(image)
+        if self._animation_control is None:
+            self._output.write(self._SIGNATURE)
+            self._write_chunk(b"IHDR", header)
+            self._animation_control = self._output.tell()
+            self._write_chunk(b"acTL", struct.pack(">II", 0, self._loop))
+
+        # Frames are drawn straight over the previous ones (APNG_BLEND_OP_SOURCE) and left in place afterwards
+        # (APNG_DISPOSE_OP_NONE).
+        frame_control = struct.pack(
+            ">IIIIIHHBB", self._sequence, image.width, image.height, offset[0], offset[1], min(duration, 0xFFFF), 1000,
+            0, 0)
+        self._write_chunk(b"fcTL", frame_control)
+        self._sequence += 1
+        for chunk in data:
+            if self._frames == 0:
+                self._write_chunk(b"IDAT", chunk)
+            else:
+                self._write_chunk(b"fdAT", struct.pack(">I", self._sequence) + chunk)
+                self._sequence += 1
+        self._frames += 1
+
+    def close(self) -> None:
+        self._write_chunk(b"IEND", b"")
+        if self._animation_control is not None:
+            end = self._output.tell()
+            self._output.seek(self._animation_control)
+            self._write_chunk(b"acTL", struct.pack(">II", self._frames, self._loop))
+            self._output.seek(end)
+
+    def _write_chunk(self, chunk_type: bytes, data: bytes) -> None:
+        self._output.write(struct.pack(">I", len(data)))
+        self._output.write(chunk_type)
+        self._output.write(data)
+        self._output.write(struct.pack(">I", zlib.crc32(chunk_type + data)))
+
+    @staticmethod
+    def _encode(image: Image.Image) -> Tuple[bytes, List[bytes]]:
+        """Encode the image with Pillow and return its IHDR chunk data and the data of its IDAT chunks."""
+        encoded = BytesIO()
+        image.convert("RGBA").save(encoded, format="PNG")
+        png = encoded.getvalue()
+        header = b""
+        data = []
+        position = len(ApngWriter._SIGNATURE)
+        while position < len(png):
+            length, chunk_type = struct.unpack(">I4s", png[position:position + 8])
+            chunk = png[position + 8:position + 8 + length]
+            if chunk_type == b"IHDR":
+                header = chunk
+            elif chunk_type == b"IDAT":
+                data.append(chunk)
+            position += 12 + length
+        return header, data
+
+
+def export_animation(
+    positions: Iterable[BoardState],
+    output: BinaryIO,
+    hex_meta: HexMeta,
+    image_format: str = "GIF",
+    frame_duration: int = 1000,
+    loop: int = 0
+) -> int:
+    """Writes an animation of the given sequence of positions, for example every ply of a game, one frame per position.
+    The positions are drawn incrementally: only the hexes whose pieces changed since the previous position are redrawn,
+    and only the rectangle around them is written as the next frame. Frames are written as soon as the next position is
+    read, so no more than one full frame is held in memory no matter how long the game is. A position that is the same
+    as the one before it makes the previous frame stay up longer instead of adding a frame.
+
+    Parameters
+    ----------
+    positions: Iterable[BoardState]
+        The positions to animate, at least one. The same BoardState can be yielded again after a move is made on it.
+
+    output: BinaryIO
+        The file to write the animation to. It must be seekable for APNG.
+
+    hex_meta: HexMeta
+        The size of the hexes in the animation.
+
+    image_format: str
+        Either "GIF" or "APNG".
+
+    frame_duration: int
+        How long each position is shown for in milliseconds.
+
+    loop: int
+        The number of times the animation plays, where 0 means forever.
+
+    Returns
+    -------
+    int
+        The number of frames written.
+    """
+    writer: AnimationWriter
+    if image_format.upper() == "GIF":
+        writer = GifWriter(output, loop)
+    elif image_format.upper() == "APNG":
+        writer = ApngWriter(output, loop)
+    else:
+        raise ValueError("Unknown animation format: {}".format(image_format))
+
+    generator: Optional[DiagramGenerator] = None
+    previous: Dict[BoardCoordinate, PieceInfo] = dict()
+    pending: Optional[Tuple[Image.Image, Tuple[int, int]]] = None
+    pending_duration = 0
+    frames = 0
+    for board_state in positions:
+        current = dict(board_state.piece_map)
+        if generator is None:
+            generator = get_diagram_generator_from_board_state(board_state, hex_meta)
+            pending = (generator.image.copy(), (0, 0))
+            pending_duration = frame_duration
+            previous = current
+            continue
+
+        changed = [coord for coord in set(previous) | set(current) if previous.get(coord) != current.get(coord)]
+        previous = current
+        if not changed:
+            pending_duration += frame_duration
+            continue
+
+        if pending is not None:
+            writer.write_frame(pending[0], pending[1], pending_duration)
+            frames += 1
+        generator.restore(changed)
+        for coord in changed:
+            piece_info = current.get(coord)
+            if piece_info is not None:
+                generator.draw(PieceImageFactory(piece_info), [coord])
+        boxes = [generator.hex_box(coord) for coord in changed]
+        box = (
+            min(b[0] for b in boxes),
+            min(b[1] for b in boxes),
+            min(max(b[2] for b in boxes), generator.image.width),
+            min(max(b[3] for b in boxes), generator.image.height)
+        )
+        pending = (generator.image.crop(box), (box[0], box[1]))
+        pending_duration = frame_duration
+
+    # Nothing has been written yet, and an animation without a frame would not be a valid file.
+    if pending is None:
+        raise ValueError("There are no positions to animate.")
+    writer.write_frame(pending[0], pending[1], pending_duration)
+    frames += 1
+    writer.close()
+    return frames
@@ -0,0 +1,146 @@
+"""
+batch_renderer.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from io import BytesIO
+from typing import Deque, Iterable, Iterator, Optional, Tuple
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state import BoardState, BoardStateBuilder
+from src.board.hex_meta import HexMeta
+from src.diagram.capturing_move_image_factory import CapturingMoveImageFactory
+from src.diagram.diagram_generator_utils import get_diagram_generator_from_board_state
+from src.diagram.valid_move_image_factory import ValidMoveImageFactory
+from src.pieces.piece_color import PieceColor
+from src.pieces.piece_image_cache import get_piece_image
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+
+
+# A board state and its highlighted cells flattened to plain ints, which is much cheaper to send to a worker process
+# than a pickled BoardState: (dimension, ((q, r, player, piece type), ...), ((q, r), ...)).
+_Job = Tuple[int, Tuple[Tuple[int, int, int, int], ...], Tuple[Tuple[int, int], ...]]
+
+
+class DiagramRequest:
+    """A board state to render along with the cells to highlight on it."""
+
+    def __init__(
+        self,
+        board_state: BoardState,
+        highlights: Iterable[BoardCoordinate] = ()
+    ) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        board_state: BoardState
+            The board state to render.
+
+        highlights: Iterable[BoardCoordinate]
+            The cells to mark on the diagram, for example the moves of a piece. Empty cells are marked with a dot and
+            occupied cells with a cross, the same way the available moves diagrams mark moves and captures.
+        """
+        self._board_state = board_state
+        self._highlights = tuple(highlights)
+
+    @property
+    def board_state(self) -> BoardState:
+        return self._board_state
+
+    @property
+    def highlights(self) -> Tuple[BoardCoordinate, ...]:
+        return self._highlights
+
+
+def render_diagrams(
+    requests: Iterable[DiagramRequest],
+    hex_meta: HexMeta,
+    image_format: str = "PNG",
+    max_workers: Optional[int] = None
+) -> Iterator[bytes]:
+    """Renders a diagram for each request across a pool of worker processes and yields the encoded images in the same
+    order as the requests. Requests are read and results are yielded as the work progresses, so this can be used on a
+    long stream of positions, for example every ply of every game in a record, without holding them all in memory.
+
+    Each worker renders every piece when it starts and draws the board for its first diagram, and the piece and board
+    image caches keep them for the rest of the batch, so the work per diagram is only compositing and encoding.
+
+    Parameters
+    ----------
+    requests: Iterable[DiagramRequest]
+        The board states to render, along with the cells to highlight on each of them.
+
+    hex_meta: HexMeta
+        The size of the hexes in the diagrams.
+
+    image_format: str
+        The Pillow format to encode the images in.
+
+    max_workers: Optional[int]
+        The number of worker processes. If None, one per CPU is used. If 0 the diagrams are rendered in this process.
+    """
+    jobs = (_to_job(request) for request in requests)
+    if max_workers == 0:
+        for job in jobs:
+            yield _render_job(job, hex_meta.width, image_format)
+        return
+
+    workers = max_workers if max_workers is not None else os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_warm_worker,
+        initargs=(hex_meta.width,)
+    ) as executor:
+        # Only keep a few jobs per worker in flight, so we read the requests at the rate the workers can render them.
+        in_flight = 4 * workers
+        pending: Deque[Future] = deque()
+        for job in jobs:
+            pending.append(executor.submit(_render_job, job, hex_meta.width, image_format))
+            if len(pending) >= in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _to_job(request: DiagramRequest) -> _Job:
+    """Flatten the request into the form that is sent to the workers."""
+    board_state = request.board_state
+    pieces = tuple(
+        (coord.q, coord.r, piece_info.player.value, piece_info.piece_type.value)
+        for coord, piece_info in board_state.piece_map.items()
+    )
+    highlights = tuple((coord.q, coord.r) for coord in request.highlights)
+    return board_state.board.dimension, pieces, highlights
+
+
+def _warm_worker(width: int) -> None:
+    """Render every piece at the given hex width so the first diagrams of a worker are as fast as the rest."""
+    hex_meta = HexMeta(width)
+    for color in (PieceColor.White(), PieceColor.Silver(), PieceColor.Black()):
+        for piece_type in PieceType:
+            get_piece_image(piece_type, color, hex_meta)
+
+
+def _render_job(job: _Job, width: int, image_format: str) -> bytes:
+    """Render a single job and return the encoded image."""
+    dimension, pieces, highlights = job
+    builder = BoardStateBuilder(Board(dimension))
+    for q, r, player, piece_type in pieces:
+        builder.add_piece(Player(player), BoardCoordinate(q, r), PieceType(piece_type))
+    board_state = builder.build()
+
+    hex_meta = HexMeta(width)
+    generator = get_diagram_generator_from_board_state(board_state, hex_meta)
+    if highlights:
+        coords = [BoardCoordinate(q, r) for q, r in highlights]
+        generator.draw(ValidMoveImageFactory(), [coord for coord in coords if coord not in board_state.piece_map])
+        generator.draw(CapturingMoveImageFactory(), [coord for coord in coords if coord in board_state.piece_map])
+
+    output = BytesIO()
+    generator.image.save(output, format=image_format)
+    return output.getvalue()
@@ -3,6 +3,7 @@ capturing_move_image_factory.py
 Copyright © 2023 Derek Seiple
 Licensed under Creative Commons BY-NC-SA 3.0. See license file.
 """
+from functools import lru_cache
 from PIL import Image, ImageDraw
 from src.board.board_coordinate import BoardCoordinate
 from src.board.hex_meta import HexMeta
@@ -11,7 +12,8 @@ from src.diagram.image_factory import ImageFactory
 
 class CapturingMoveImageFactory(ImageFactory):
     """This class is used to create an X image that can be used to indicate a capturing move, which can be layered on
-    top of an existing diagram.
+    top of an existing diagram. The X only depends on the size of the hex, so it is drawn once for each size and the
+    same image is returned for every coordinate.
     """
 
     def __call__(
@@ -20,17 +22,28 @@ class CapturingMoveImageFactory(ImageFactory):
         coordinate: BoardCoordinate,
         hex_meta: HexMeta
     ) -> Image.Image:
-        img = Image.new("RGBA", (hex_meta.width, hex_meta.height), (255, 255, 255, 0))
-        draw = ImageDraw.Draw(img)
-        # define a square 1/4 the size of the hex width
-        square_size = round(hex_meta.width / 4)
-        # define the top left corner of the square
-        x = round((hex_meta.width - square_size) / 2)
-        y = round((hex_meta.height - square_size) / 2)
-        # define the bottom right corner of the square
-        x1 = x + square_size
-        y1 = y + square_size
-        draw.line([(x, y), (x1, y1)], fill="red", width=round(square_size/4))
-        draw.line([(x1, y), (x, y1)], fill="red", width=round(square_size/4))
+        return _capturing_move_stamp(hex_meta.width)
 
-        return img
+    @property
+    def coordinate_independent(self) -> bool:
+        return True
+
+
+@lru_cache(maxsize=None)
+def _capturing_move_stamp(width: int) -> Image.Image:
+    """Draws the X for a hex of the given width. The image is shared by every call, so it must not be changed."""
+    hex_meta = HexMeta(width)
+    img = Image.new("RGBA", (hex_meta.width, hex_meta.height), (255, 255, 255, 0))
+    draw = ImageDraw.Draw(img)
+    # define a square 1/4 the size of the hex width
+    square_size = round(hex_meta.width / 4)
+    # define the top left corner of the square
+    x = round((hex_meta.width - square_size) / 2)
+    y = round((hex_meta.height - square_size) / 2)
+    # define the bottom right corner of the square
+    x1 = x + square_size
+    y1 = y + square_size
+    draw.line([(x, y), (x1, y1)], fill="red", width=round(square_size/4))
+    draw.line([(x1, y), (x, y1)], fill="red", width=round(square_size/4))
+
+    return img
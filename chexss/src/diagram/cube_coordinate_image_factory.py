@@ -3,9 +3,10 @@ cube_coordinate_image_factory.py
 Copyright © 2023 Derek Seiple
 Licensed under Creative Commons BY-NC-SA 3.0. See license file.
 """
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 from src.board.board_coordinate import BoardCoordinate
 from src.board.hex_meta import HexMeta
+from src.diagram.font_cache import LABEL_FONT, get_font
 from src.diagram.image_factory import ImageFactory
 
 
@@ -19,7 +20,7 @@ class CubeCoordinateImageFactory(ImageFactory):
         hex_meta: HexMeta
     ) -> Image.Image:
         img = Image.new("RGBA", (hex_meta.width, hex_meta.height), (255, 255, 255, 0))
-        font = ImageFont.truetype("Arial Bold.ttf", int(0.2 * hex_meta.height))
+        font = get_font(LABEL_FONT, int(0.2 * hex_meta.height))
         draw = ImageDraw.Draw(img)
 
         q_text = "{}".format(coordinate.q)
@@ -3,12 +3,17 @@ diagram_generator.py
 Copyright © 2023 Derek Seiple
 Licensed under Creative Commons BY-NC-SA 3.0. See license file.
 """
-from PIL import Image
-from typing import List
+from functools import lru_cache
+from PIL import Image, ImageDraw
+from typing import List, Tuple
 from src.diagram.image_factory import ImageFactory
 from src.board.board_image import BoardImage
 from src.board.board_coordinate import BoardCoordinate
 from src.board.board_coordinate_utils import board_coordinate_image_location
+from src.board.hex_meta import HexMeta
+from src.diagram.piece_image_factory import PieceImageFactory
+from src.pieces.move import Move
+from src.pieces.piece_info import PieceInfo
 
 
 class DiagramGenerator:
@@ -38,12 +43,94 @@ class DiagramGenerator:
         coordinates: List[BoardCoordinate]
             The coordinates on the board to draw the images at with the image factory.
         """
+        dimension = self._board_image.dimension
+        hex_meta = self._board_image.hex_meta
+        if image_factory.coordinate_independent:
+            if not coordinates:
+                return
+            # The same image goes on every coordinate, so only ask the factory for it once.
+            image = image_factory(dimension, coordinates[0], hex_meta)
+            for coordinate in coordinates:
+                self._image.alpha_composite(image, board_coordinate_image_location(dimension, coordinate, hex_meta))
+            return
+
         for coordinate in coordinates:
             self._image.alpha_composite(
-                image_factory(self._board_image.dimension, coordinate, self._board_image.hex_meta),
-                board_coordinate_image_location(self._board_image.dimension, coordinate, self._board_image.hex_meta)
+                image_factory(dimension, coordinate, hex_meta),
+                board_coordinate_image_location(dimension, coordinate, hex_meta)
             )
 
+    def draw_layer(
+        self,
+        layer: Image.Image
+    ) -> None:
+        """Draw an image the size of the whole board on top of the diagram, for example a layer from
+        get_label_layer().
+
+        Parameters
+        ----------
+        layer: Image.Image
+            The image to draw. It must be the same size as the board image.
+        """
+        self._image.alpha_composite(layer)
+
+    def restore(
+        self,
+        coordinates: List[BoardCoordinate]
+    ) -> None:
+        """For each coordinate in the list, put the hex back to how it looks on the board image, removing anything that
+        was drawn on it. Only the pixels inside the hex are restored, so the neighbouring hexes are left alone.
+
+        Parameters
+        ----------
+        coordinates: List[BoardCoordinate]
+            The coordinates on the board to restore.
+        """
+        mask = _hex_mask(self._board_image.hex_meta.width)
+        board: Image.Image = self._board_image.image
+        for coordinate in coordinates:
+            box = self.hex_box(coordinate)
+            self._image.paste(board.crop(box), box, mask)
+
+    def apply_move(
+        self,
+        move: Move,
+        piece_info: PieceInfo
+    ) -> None:
+        """Update the diagram for the given move without redrawing the rest of the board. The from and to hexes are
+        restored to the board image, which removes the moved piece, any captured piece and anything else drawn on them,
+        and then the piece is drawn on the to hex.
+
+        Parameters
+        ----------
+        move: Move
+            The move to show.
+
+        piece_info: PieceInfo
+            The piece that is on the to coordinate after the move. This is the promoted piece if the move promoted a
+            pawn.
+        """
+        self.restore([move.from_coord, move.to_coord])
+        self.draw(PieceImageFactory(piece_info), [move.to_coord])
+
+    def hex_box(
+        self,
+        coordinate: BoardCoordinate
+    ) -> Tuple[int, int, int, int]:
+        """Returns the (left, top, right, bottom) box of the image that the hex at the given coordinate is drawn in."""
+        hex_meta = self._board_image.hex_meta
+        x, y = board_coordinate_image_location(self._board_image.dimension, coordinate, hex_meta)
+        return x, y, x + hex_meta.width, y + hex_meta.height
+
     @property
     def image(self) -> Image.Image:
         return self._image
+
+
+@lru_cache(maxsize=None)
+def _hex_mask(width: int) -> Image.Image:
+    """Returns a mask that is opaque inside a hex of the given width and transparent outside of it."""
+    hex_meta = HexMeta(width)
+    mask = Image.new("L", (hex_meta.width, hex_meta.height), 0)
+    ImageDraw.Draw(mask).polygon(hex_meta.coords, fill=255, outline=255)
+    return mask
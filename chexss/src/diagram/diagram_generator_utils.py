@@ -5,7 +5,7 @@ Licensed under Creative Commons BY-NC-SA 3.0. See license file.
 """
 from src.board.board_state import BoardState
 from src.diagram.diagram_generator import DiagramGenerator
-from src.board.board_image import BoardImage
+from src.board.board_image_cache import get_board_image
 from src.diagram.piece_image_factory import PieceImageFactory
 from src.board.hex_meta import HexMeta
 from src.pieces.piece_utils import get_piece_from_type
@@ -29,7 +29,7 @@ def get_diagram_generator_from_board_state(
     DiagramGenerator
         The diagram generator object.
     """
-    board_image = BoardImage(board_state.board, hex_meta)
+    board_image = get_board_image(board_state.board, hex_meta)
     diagram_generator = DiagramGenerator(board_image)
     for coord, piece_info in board_state.piece_map.items():
         diagram_generator.draw(PieceImageFactory(piece_info), [coord])
@@ -0,0 +1,27 @@
+"""
+font_cache.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+from functools import lru_cache
+from PIL import ImageFont
+
+
+# The font used for the coordinate labels.
+LABEL_FONT = "Arial Bold.ttf"
+
+
+@lru_cache(maxsize=None)
+def get_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Returns the TrueType font at the given path and size. Loading a font reads and parses the whole font file, so
+    each font is only loaded once per process and shared by every caller after that.
+
+    Parameters
+    ----------
+    path: str
+        The path or file name of the font. Pillow also looks for it in the system font directories.
+
+    size: int
+        The size of the font in pixels.
+    """
+    return ImageFont.truetype(path, size)
@@ -22,3 +22,9 @@ class ImageFactory:
     ) -> Image.Image:
         """Return an image for the board, and size at the given coordinate."""
         raise NotImplementedError
+
+    @property
+    def coordinate_independent(self) -> bool:
+        """True if the image does not depend on the coordinate it is drawn at. DiagramGenerator.draw() then only asks
+        for the image once and draws the same image at every coordinate."""
+        return False
@@ -0,0 +1,62 @@
+"""
+label_layer.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+from functools import lru_cache
+from PIL import Image
+from typing import Type
+from src.board.board import Board
+from src.board.board_coordinate_utils import board_coordinate_image_location
+from src.board.board_image_cache import get_board_image
+from src.board.hex_meta import HexMeta
+from src.diagram.image_factory import ImageFactory
+
+
+def get_label_layer(
+    image_factory_type: Type[ImageFactory],
+    dimension: int,
+    hex_meta: HexMeta
+) -> Image.Image:
+    """Returns a transparent image the size of the board with the image of the given factory drawn on every hex, for
+    example the coordinate labels of AlgebraicCoordinateImageFactory or CubeCoordinateImageFactory. The labels of a hex
+    only depend on the board and hex size, so each layer is only drawn once per process and can then be put on any
+    number of diagrams with DiagramGenerator.draw_layer(). The image is shared, so it must not be changed.
+
+    Parameters
+    ----------
+    image_factory_type: Type[ImageFactory]
+        The class of the factory that draws the label of a hex. It is constructed with no arguments.
+
+    dimension: int
+        The dimension of the board, ie the number of hexes on a side.
+
+    hex_meta: HexMeta
+        The metadata about the hexes. Only the width matters since the rest of the HexMeta follows from it.
+    """
+    return _draw_label_layer(image_factory_type, dimension, hex_meta.width)  # type: ignore [arg-type]
+
+
+def clear_label_layer_cache() -> None:
+    """Throw away every drawn label layer."""
+    _draw_label_layer.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _draw_label_layer(
+    image_factory_type: Type[ImageFactory],
+    dimension: int,
+    width: int
+) -> Image.Image:
+    """Draws the layer for get_label_layer()."""
+    board = Board(dimension)
+    hex_meta = HexMeta(width)
+    board_image: Image.Image = get_board_image(board, hex_meta).image
+    layer = Image.new("RGBA", board_image.size, (255, 255, 255, 0))
+    image_factory = image_factory_type()
+    for coord in board.coordinates:
+        layer.alpha_composite(
+            image_factory(dimension, coord, hex_meta),
+            board_coordinate_image_location(dimension, coord, hex_meta)
+        )
+    return layer
@@ -8,11 +8,13 @@ from src.board.board_coordinate import BoardCoordinate
 from src.board.hex_meta import HexMeta
 from src.diagram.image_factory import ImageFactory
 from src.pieces.piece_info import PieceInfo
-from src.pieces.piece_utils import get_piece_from_type, get_color_from_player
+from src.pieces.piece_image_cache import get_piece_image
+from src.pieces.piece_utils import get_color_from_player
 
 
 class PieceImageFactory(ImageFactory):
-    """This class is used to create images for pieces on the board, based ont he given piece info."""
+    """This class is used to create images for pieces on the board, based ont he given piece info. The images come from
+    get_piece_image(), so each piece is only rendered once no matter how many diagrams it is drawn on."""
 
     def __init__(
         self,
@@ -26,6 +28,9 @@ class PieceImageFactory(ImageFactory):
         coordinate: BoardCoordinate,
         hex_meta: HexMeta
     ) -> Image.Image:
-        piece = get_piece_from_type(self._piece_info.piece_type)
         color = get_color_from_player(self._piece_info.player)
-        return piece.image(hex_meta, color)
+        return get_piece_image(self._piece_info.piece_type, color, hex_meta)
+
+    @property
+    def coordinate_independent(self) -> bool:
+        return True
@@ -0,0 +1,174 @@
+"""
+svg_diagram_generator.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+from typing import Callable, Dict, List, Tuple
+from src.board.board import Board
+from src.board.board_colors import BoardColors
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_coordinate_utils import board_coordinate_image_location
+from src.board.board_image import BoardImage
+from src.board.board_state import BoardState
+from src.board.hex_meta import HexMeta
+from src.pieces.bishop_image import BishopImage
+from src.pieces.king_image import KingImage
+from src.pieces.knight_image import KnightImage
+from src.pieces.pawn_image import PawnImage
+from src.pieces.piece_info import PieceInfo
+from src.pieces.piece_type import PieceType
+from src.pieces.piece_utils import get_color_from_player
+from src.pieces.queen_image import QueenImage
+from src.pieces.rook_image import RookImage
+
+
+# For each piece type: the function returning its SVG for a main and accent color, the size of that SVG, and how much
+# of the width of a hex the piece fills. These are the same values the raster piece images use.
+_PIECE_SVGS: Dict[PieceType, Tuple[Callable[[str, str], str], int, float]] = {
+    PieceType.KING: (KingImage.svg, KingImage.SVG_SIZE, KingImage.SCALE_FACTOR),
+    PieceType.QUEEN: (QueenImage.svg, QueenImage.SVG_SIZE, QueenImage.SCALE_FACTOR),
+    PieceType.ROOK: (RookImage.svg, RookImage.SVG_SIZE, RookImage.SCALE_FACTOR),
+    PieceType.BISHOP: (BishopImage.svg, BishopImage.SVG_SIZE, BishopImage.SCALE_FACTOR),
+    PieceType.KNIGHT: (KnightImage.svg, KnightImage.SVG_SIZE, KnightImage.SCALE_FACTOR),
+    PieceType.PAWN: (PawnImage.svg, PawnImage.SVG_SIZE, PawnImage.SCALE_FACTOR),
+}
+
+
+class SvgDiagramGenerator:
+    """This class is the vector counterpart of DiagramGenerator. Instead of compositing Pillow images it builds a single
+    SVG document: a hex polygon for each board color and the SVG of each kind of piece are written once in a <defs>
+    section and placed on the board with <use>. The document is laid out exactly like the raster diagrams, so it can be
+    scaled to any size, is a fraction of the size of the equivalent PNG, and building it does not rasterize anything.
+    """
+
+    def __init__(
+        self,
+        board: Board,
+        hex_meta: HexMeta,
+        board_colors: BoardColors = BoardColors.CreateDefault()
+    ) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        board: Board
+            The board to draw.
+
+        hex_meta: HexMeta
+            The metadata about the hexes. This sets the size of the document in user units.
+
+        board_colors: BoardColors
+            The color of the hexes used for the board.
+        """
+        self._dimension = board.dimension
+        self._hex_meta = hex_meta
+        self._width: int = hex_meta.width * (2 * self._dimension - 1)
+        self._height: int = int(hex_meta.height / 2) * (3 * self._dimension - 1)
+        self._defs: Dict[str, str] = dict()
+        self._elements: List[str] = []
+
+        # Like the pieces, the hex of each color is defined once and then placed on every cell of that color.
+        points = " ".join("{},{}".format(x, y) for x, y in hex_meta.coords)
+        for index, color in enumerate([board_colors.white, board_colors.silver, board_colors.black]):
+            self._defs["hex-{}".format(index)] = '<polygon id="hex-{0}" points="{1}" fill="{2}" stroke="{2}"/>'.format(
+                index, points, color)
+        for coord in board.coordinates:
+            x, y = board_coordinate_image_location(self._dimension, coord, hex_meta)
+            self._elements.append('<use xlink:href="#hex-{}" x="{}" y="{}"/>'.format(
+                BoardImage.hex_color_index(coord.x), x, y))
+
+    def draw_piece(
+        self,
+        piece_info: PieceInfo,
+        coordinate: BoardCoordinate
+    ) -> None:
+        """Draw the given piece on the hex at the given coordinate.
+
+        Parameters
+        ----------
+        piece_info: PieceInfo
+            The piece to draw.
+
+        coordinate: BoardCoordinate
+            The coordinate on the board to draw the piece at.
+        """
+        svg, svg_size, scale_factor = _PIECE_SVGS[piece_info.piece_type]
+        piece_id = "{}-{}".format(piece_info.player.name, piece_info.piece_type.name).lower()
+        if piece_id not in self._defs:
+            color = get_color_from_player(piece_info.player)
+            document = svg(str(color.main_color), str(color.accent_color))
+            # Drop the XML declaration, give the root element an id so it can be used from the board and squeeze out
+            # the indentation, which is only whitespace between attributes and path commands.
+            element = " ".join(document[document.index("<svg") + len("<svg"):].split())
+            self._defs[piece_id] = '<svg id="{}" {}'.format(piece_id, element)
+
+        hex_meta = self._hex_meta
+        scaled_dim = round(float(hex_meta.width) * scale_factor)
+        x, y = board_coordinate_image_location(self._dimension, coordinate, hex_meta)
+        x += round((hex_meta.width - scaled_dim) / 2)
+        y += round((hex_meta.height - scaled_dim) / 2)
+        self._elements.append('<use xlink:href="#{}" transform="translate({},{}) scale({:g})"/>'.format(
+            piece_id, x, y, scaled_dim / svg_size))
+
+    def draw_valid_moves(
+        self,
+        coordinates: List[BoardCoordinate]
+    ) -> None:
+        """Mark each of the coordinates with a dot, like ValidMoveImageFactory."""
+        hex_meta = self._hex_meta
+        radius = round(hex_meta.width / 8) / 2
+        for coordinate in coordinates:
+            x, y = board_coordinate_image_location(self._dimension, coordinate, hex_meta)
+            self._elements.append('<circle cx="{:g}" cy="{:g}" r="{:g}" fill="red"/>'.format(
+                x + hex_meta.width / 2, y + hex_meta.height / 2, radius))
+
+    def draw_captures(
+        self,
+        coordinates: List[BoardCoordinate]
+    ) -> None:
+        """Mark each of the coordinates with an X, like CapturingMoveImageFactory."""
+        hex_meta = self._hex_meta
+        square_size = round(hex_meta.width / 4)
+        for coordinate in coordinates:
+            x, y = board_coordinate_image_location(self._dimension, coordinate, hex_meta)
+            x0 = x + round((hex_meta.width - square_size) / 2)
+            y0 = y + round((hex_meta.height - square_size) / 2)
+            x1 = x0 + square_size
+            y1 = y0 + square_size
+            self._elements.append(
+                '<path d="M {},{} L {},{} M {},{} L {},{}" stroke="red" stroke-width="{}"/>'.format(
+                    x0, y0, x1, y1, x1, y0, x0, y1, round(square_size / 4)))
+
+    @property
+    def svg(self) -> str:
+        """The SVG document of the diagram."""
+        return "\n".join([
+            '<?xml version="1.0" encoding="UTF-8" standalone="no"?>',
+            '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+            'width="{0}" height="{1}" viewBox="0 0 {0} {1}">'.format(self._width, self._height),
+            "<defs>",
+            *self._defs.values(),
+            "</defs>",
+            *self._elements,
+            "</svg>",
+        ])
+
+
+def get_svg_diagram_generator_from_board_state(
+    board_state: BoardState,
+    hex_meta: HexMeta
+) -> SvgDiagramGenerator:
+    """Returns an SvgDiagramGenerator with the pieces of the given board state drawn on it.
+
+    Parameters
+    ----------
+    board_state: BoardState
+        The board state to generate a diagram from.
+
+    hex_meta: HexMeta
+        The hex meta object to use for the diagram.
+    """
+    generator = SvgDiagramGenerator(board_state.board, hex_meta)
+    for coord, piece_info in board_state.piece_map.items():
+        generator.draw_piece(piece_info, coord)
+    return generator
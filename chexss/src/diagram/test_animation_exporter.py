@@ -0,0 +1,75 @@
+"""
+test_animation_exporter.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import unittest
+from io import BytesIO
+from PIL import Image
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state import BoardState, BoardStateBuilder
+from src.board.hex_meta import HexMeta
+from src.diagram.animation_exporter import export_animation
+from src.diagram.diagram_generator_utils import get_diagram_generator_from_board_state
+from src.pieces.move import Move
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+
+
+class TestAnimationExporter(unittest.TestCase):
+
+    def _board_state(self) -> BoardState:
+        return (
+            BoardStateBuilder(Board(4))
+            .add_piece(Player.WHITE, BoardCoordinate(0, 2), PieceType.ROOK)
+            .add_piece(Player.SILVER, BoardCoordinate(2, -1), PieceType.KNIGHT)
+            .add_piece(Player.BLACK, BoardCoordinate(-1, -2), PieceType.BISHOP)
+            .build())
+
+    def _positions(self, board_state: BoardState):
+        yield board_state
+        for move in [
+            Move(BoardCoordinate(0, 2), BoardCoordinate(0, -1)),
+            Move(BoardCoordinate(2, -1), BoardCoordinate(1, 1)),
+            Move(BoardCoordinate(-1, -2), BoardCoordinate(0, -1), PieceType.ROOK),
+        ]:
+            board_state.make_move(move)
+            yield board_state
+        # Yielding the same position again only makes the last frame longer.
+        yield board_state
+
+    def test_apng(self):
+        """We test that the APNG has a frame per position and ends on the same image as a full diagram of the final
+        position."""
+        board_state = self._board_state()
+        output = BytesIO()
+        hex_meta = HexMeta(30)
+        self.assertEqual(export_animation(self._positions(board_state), output, hex_meta, "APNG", 200), 4)
+
+        animation = Image.open(BytesIO(output.getvalue()))
+        self.assertEqual(animation.n_frames, 4)
+        animation.seek(3)
+        expected = get_diagram_generator_from_board_state(board_state, hex_meta).image
+        self.assertEqual(animation.convert("RGBA").tobytes(), expected.tobytes())
+
+    def test_gif(self):
+        """We test that the GIF has a frame per position and the size of the board."""
+        board_state = self._board_state()
+        output = BytesIO()
+        hex_meta = HexMeta(30)
+        self.assertEqual(export_animation(self._positions(board_state), output, hex_meta, "GIF", 200), 4)
+
+        animation = Image.open(BytesIO(output.getvalue()))
+        self.assertEqual(animation.n_frames, 4)
+        self.assertEqual(animation.size, get_diagram_generator_from_board_state(board_state, hex_meta).image.size)
+        animation.seek(3)
+        self.assertEqual(animation.info["duration"], 400)
+
+    def test_no_positions(self):
+        """We test that an animation without any positions is an error rather than an invalid file."""
+        for image_format in ("GIF", "APNG"):
+            output = BytesIO()
+            with self.assertRaises(ValueError):
+                export_animation([], output, HexMeta(30), image_format)
+            self.assertEqual(output.getvalue(), b"")
@@ -0,0 +1,47 @@
+"""
+test_batch_renderer.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import unittest
+from io import BytesIO
+from PIL import Image
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state import BoardStateBuilder
+from src.board.hex_meta import HexMeta
+from src.diagram.batch_renderer import DiagramRequest, render_diagrams
+from src.diagram.diagram_generator_utils import get_diagram_generator_from_board_state
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+
+
+class TestBatchRenderer(unittest.TestCase):
+
+    def _requests(self):
+        requests = []
+        for q in range(-2, 3):
+            board_state = (
+                BoardStateBuilder(Board(4))
+                .add_piece(Player.WHITE, BoardCoordinate(q, 0), PieceType.ROOK)
+                .add_piece(Player.BLACK, BoardCoordinate(0, -3), PieceType.KING)
+                .build())
+            requests.append(DiagramRequest(board_state, [BoardCoordinate(q, 1), BoardCoordinate(0, -3)]))
+        return requests
+
+    def test_renders_in_order(self):
+        """We test that the worker pool returns the same images, in the same order, as rendering in this process."""
+        hex_meta = HexMeta(30)
+        inline = list(render_diagrams(self._requests(), hex_meta, max_workers=0))
+        pooled = list(render_diagrams(iter(self._requests()), hex_meta, max_workers=2))
+        self.assertEqual(len(inline), 5)
+        self.assertEqual(pooled, inline)
+        self.assertEqual(len(set(inline)), 5)
+
+    def test_matches_diagram_generator(self):
+        """We test that a diagram without highlights is the same image the diagram generator draws."""
+        board_state = self._requests()[0].board_state
+        hex_meta = HexMeta(30)
+        encoded = next(render_diagrams([DiagramRequest(board_state)], hex_meta, max_workers=0))
+        expected = get_diagram_generator_from_board_state(board_state, hex_meta).image
+        self.assertEqual(Image.open(BytesIO(encoded)).tobytes(), expected.tobytes())
@@ -11,6 +11,10 @@ from src.pieces.piece_type import PieceType
 from src.board.board import Board
 from src.board.hex_meta import HexMeta
 from src.diagram.diagram_generator_utils import get_diagram_generator_from_board_state
+from src.pieces.move import Move
+from src.diagram.capturing_move_image_factory import CapturingMoveImageFactory
+from src.diagram.diagram_generator import DiagramGenerator
+from src.diagram.valid_move_image_factory import ValidMoveImageFactory
 
 
 class TestDiagramGenerator(unittest.TestCase):
@@ -27,3 +31,44 @@ class TestDiagramGenerator(unittest.TestCase):
             .build())
 
         get_diagram_generator_from_board_state(board_state, HexMeta(50))
+
+    def test_apply_move(self):
+        """We test that applying moves to a diagram gives the same image as drawing the final position from scratch."""
+        board_state: BoardState = (
+            BoardStateBuilder(Board(7))
+            .add_piece(Player.WHITE, BoardCoordinate(1, -4), PieceType.KING)
+            .add_piece(Player.WHITE, BoardCoordinate(0, -4), PieceType.QUEEN)
+            .add_piece(Player.SILVER, BoardCoordinate(0, -3), PieceType.KNIGHT)
+            .add_piece(Player.BLACK, BoardCoordinate(2, -4), PieceType.KNIGHT)
+            .build())
+        hex_meta = HexMeta(50)
+        generator = get_diagram_generator_from_board_state(board_state, hex_meta)
+
+        for move in [
+            Move(BoardCoordinate(0, -4), BoardCoordinate(0, -3), PieceType.KNIGHT),
+            Move(BoardCoordinate(2, -4), BoardCoordinate(1, -2)),
+        ]:
+            board_state.make_move(move)
+            generator.apply_move(move, board_state.piece_map[move.to_coord])
+
+        expected = get_diagram_generator_from_board_state(board_state, hex_meta)
+        self.assertEqual(generator.image.tobytes(), expected.image.tobytes())
+
+    def test_draw_coordinate_independent(self):
+        """We test that the move markers are drawn once per hex size and that drawing the shared image gives the same
+        diagram as drawing each coordinate on its own."""
+        board_state: BoardState = BoardStateBuilder(Board(5)).build()
+        hex_meta = HexMeta(40)
+        coordinates = [BoardCoordinate(0, 0), BoardCoordinate(1, -2), BoardCoordinate(-3, 2)]
+        for factory in [ValidMoveImageFactory(), CapturingMoveImageFactory()]:
+            self.assertTrue(factory.coordinate_independent)
+            self.assertIs(factory(5, coordinates[0], hex_meta), factory(5, coordinates[1], HexMeta(40)))
+            self.assertIsNot(factory(5, coordinates[0], hex_meta), factory(5, coordinates[0], HexMeta(50)))
+
+            generator: DiagramGenerator = get_diagram_generator_from_board_state(board_state, hex_meta)
+            generator.draw(factory, coordinates)
+            expected: DiagramGenerator = get_diagram_generator_from_board_state(board_state, hex_meta)
+            for coordinate in coordinates:
+                expected.image.alpha_composite(
+                    factory(5, coordinate, hex_meta).copy(), generator.hex_box(coordinate)[:2])
+            self.assertEqual(generator.image.tobytes(), expected.image.tobytes())
@@ -0,0 +1,74 @@
+"""
+test_label_layer.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import os
+import unittest
+from unittest import mock
+from PIL import ImageFont
+from src.board.board import Board
+from src.board.board_image_cache import get_board_image
+from src.board.hex_meta import HexMeta
+from src.diagram.algebraic_coordinate_image_factory import AlgebraicCoordinateImageFactory
+from src.diagram.cube_coordinate_image_factory import CubeCoordinateImageFactory
+from src.diagram.diagram_generator import DiagramGenerator
+from src.diagram.font_cache import LABEL_FONT, get_font
+from src.diagram.label_layer import clear_label_layer_cache, get_label_layer
+
+
+# A small free font kept next to the tests, so they do not depend on the label font being installed.
+TEST_FONT = os.path.join(os.path.dirname(__file__), "test_data", "Aileron-Regular.ttf")
+_truetype = ImageFont.truetype
+
+
+def load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Stands in for ImageFont.truetype() and loads the test font in place of the one asked for."""
+    return _truetype(TEST_FONT, size)
+
+
+class TestLabelLayer(unittest.TestCase):
+
+    def setUp(self):
+        clear_label_layer_cache()
+        get_font.cache_clear()
+        patcher = mock.patch("src.diagram.font_cache.ImageFont.truetype", side_effect=load_font)
+        self._truetype = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(get_font.cache_clear)
+        self.addCleanup(clear_label_layer_cache)
+
+    def test_layer_matches_drawing_every_hex(self):
+        """We test that drawing a cached layer of coordinate labels gives the same diagram as labelling every hex."""
+        board = Board(5)
+        hex_meta = HexMeta(40)
+        for factory_type in (AlgebraicCoordinateImageFactory, CubeCoordinateImageFactory):
+            layer = get_label_layer(factory_type, board.dimension, hex_meta)
+            self.assertIs(get_label_layer(factory_type, board.dimension, HexMeta(40)), layer)
+
+            expected = DiagramGenerator(get_board_image(board, hex_meta))
+            expected.draw(factory_type(), board.coordinates)
+            actual = DiagramGenerator(get_board_image(board, hex_meta))
+            actual.draw_layer(layer)
+            self.assertEqual(actual.image.tobytes(), expected.image.tobytes())
+
+    def test_font_loaded_once(self):
+        """We test that each font is loaded once per path and size, however many hexes and layers are labelled."""
+        hex_meta = HexMeta(40)
+        for dimension in (4, 5):
+            get_label_layer(AlgebraicCoordinateImageFactory, dimension, hex_meta)
+            get_label_layer(CubeCoordinateImageFactory, dimension, hex_meta)
+        get_label_layer(AlgebraicCoordinateImageFactory, 4, HexMeta(60))
+        loads = [call.args for call in self._truetype.call_args_list]
+        self.assertEqual(len(loads), len(set(loads)))
+        self.assertEqual(set(loads), {
+            (LABEL_FONT, int(hex_meta.height / 4)),
+            (LABEL_FONT, int(0.2 * hex_meta.height)),
+            (LABEL_FONT, int(HexMeta(60).height / 4)),
+        })
+
+    def test_cache_clear(self):
+        """We test that clearing the cache draws the layer again."""
+        layer = get_label_layer(CubeCoordinateImageFactory, 4, HexMeta(40))
+        clear_label_layer_cache()
+        self.assertIsNot(get_label_layer(CubeCoordinateImageFactory, 4, HexMeta(40)), layer)
@@ -0,0 +1,38 @@
+"""
+test_svg_diagram_generator.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import unittest
+import xml.etree.ElementTree as ElementTree
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state_utils import generate_initial_board_state
+from src.board.hex_meta import HexMeta
+from src.diagram.svg_diagram_generator import get_svg_diagram_generator_from_board_state
+
+SVG = "{http://www.w3.org/2000/svg}"
+XLINK = "{http://www.w3.org/1999/xlink}"
+
+
+class TestSvgDiagramGenerator(unittest.TestCase):
+
+    def test_initial_position(self):
+        """We test that the initial position is a valid SVG document with a hex per cell, a <use> per piece and each
+        kind of piece defined once."""
+        board_state = generate_initial_board_state()
+        generator = get_svg_diagram_generator_from_board_state(board_state, HexMeta(50))
+        generator.draw_valid_moves([BoardCoordinate(0, 0), BoardCoordinate(1, 0)])
+        generator.draw_captures([BoardCoordinate(-6, 6)])
+
+        root = ElementTree.fromstring(generator.svg.encode("utf-8"))
+        self.assertEqual(root.get("width"), str(50 * 13))
+        uses = [use.get(XLINK + "href")[1:] for use in root.findall(SVG + "use")]
+        hexes = [use for use in uses if use.startswith("hex-")]
+        pieces = [use for use in uses if not use.startswith("hex-")]
+        self.assertEqual(len(hexes), len(board_state.board.coordinates))
+        self.assertEqual(len(pieces), len(board_state.piece_map))
+        defined = {element.get("id") for element in root.find(SVG + "defs")}
+        self.assertEqual(len(defined), 3 + 18)
+        self.assertEqual(set(uses), defined)
+        self.assertEqual(len(root.findall(SVG + "circle")), 2)
+        self.assertEqual(len(root.findall(SVG + "path")), 1)
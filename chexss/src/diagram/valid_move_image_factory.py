@@ -3,6 +3,7 @@ valid_move_image_factory.py
 Copyright © 2025 Derek Seiple
 Licensed under Creative Commons BY-NC-SA 3.0. See license file.
 """
+from functools import lru_cache
 from PIL import Image, ImageDraw
 from src.board.board_coordinate import BoardCoordinate
 from src.board.hex_meta import HexMeta
@@ -11,7 +12,8 @@ from src.diagram.image_factory import ImageFactory
 
 class ValidMoveImageFactory(ImageFactory):
     """This class is used to create a circle image that can be used to indicate a valid move, which can be layered on
-    top of an existing diagram.
+    top of an existing diagram. The circle only depends on the size of the hex, so it is drawn once for each size and
+    the same image is returned for every coordinate.
     """
 
     def __call__(
@@ -20,15 +22,26 @@ class ValidMoveImageFactory(ImageFactory):
         coordinate: BoardCoordinate,
         hex_meta: HexMeta
     ) -> Image.Image:
-        img = Image.new("RGBA", (hex_meta.width, hex_meta.height), (255, 255, 255, 0))
-        draw = ImageDraw.Draw(img)
-        # define a circle 1/8 the size of the hex width
-        circle_size = round(hex_meta.width / 8)
-        # Bounding box of the circle
-        left = (hex_meta.width - circle_size) / 2
-        top = (hex_meta.height - circle_size) / 2
-        right = left + circle_size
-        bottom = top + circle_size
-        # Draw the circle
-        draw.ellipse([(left, top), (right, bottom)], fill="red", width=round(circle_size / 4))
-        return img
+        return _valid_move_stamp(hex_meta.width)
+
+    @property
+    def coordinate_independent(self) -> bool:
+        return True
+
+
+@lru_cache(maxsize=None)
+def _valid_move_stamp(width: int) -> Image.Image:
+    """Draws the circle for a hex of the given width. The image is shared by every call, so it must not be changed."""
+    hex_meta = HexMeta(width)
+    img = Image.new("RGBA", (hex_meta.width, hex_meta.height), (255, 255, 255, 0))
+    draw = ImageDraw.Draw(img)
+    # define a circle 1/8 the size of the hex width
+    circle_size = round(hex_meta.width / 8)
+    # Bounding box of the circle
+    left = (hex_meta.width - circle_size) / 2
+    top = (hex_meta.height - circle_size) / 2
+    right = left + circle_size
+    bottom = top + circle_size
+    # Draw the circle
+    draw.ellipse([(left, top), (right, bottom)], fill="red", width=round(circle_size / 4))
+    return img
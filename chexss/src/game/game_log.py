@@ -0,0 +1,87 @@
+"""
+game_log.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+from functools import lru_cache
+from typing import Iterable, Iterator, Tuple
+from src.board.board_state import BoardState
+from src.board.board_state_utils import generate_initial_board_state
+from src.board.position_notation import position_from_notation, position_to_notation
+from src.game.game_record import Ply
+from src.game.move_notation import move_from_notation, move_to_notation
+
+
+# A game log is a text file with one game on each line. A line is the moves of the game in move notation separated by
+# spaces. A game that does not start from the initial position starts with its position in position notation between
+# square brackets, for example "[4 Pg4,Kj1 Rj7 - w] j1-i2 j7-k6". Empty lines and lines starting with "#" are ignored.
+COMMENT = "#"
+POSITION_START = "["
+POSITION_END = "]"
+
+# The number of the game in the log starting at zero, the number of plies made in the game so far, and the position.
+GamePosition = Tuple[int, int, BoardState]
+
+
+@lru_cache(maxsize=None)
+def _initial_notation() -> str:
+    return position_to_notation(generate_initial_board_state())
+
+
+def game_to_notation(
+    initial_state: BoardState,
+    plies: Iterable[Ply]
+) -> str:
+    """Returns the line of a game log for the given game.
+
+    Parameters
+    ----------
+    initial_state: BoardState
+        The position the game starts from.
+
+    plies: Iterable[Ply]
+        The moves of the game in the order they were made, each with the promotion type that was passed to
+        BoardState.make_move() for it.
+    """
+    dimension = initial_state.board.dimension
+    fields = [move_to_notation(move, promotion_type, dimension) for move, promotion_type in plies]
+    position = position_to_notation(initial_state)
+    if position != _initial_notation():
+        fields.insert(0, POSITION_START + position + POSITION_END)
+    return " ".join(fields)
+
+
+def read_game_log(lines: Iterable[str]) -> Iterator[GamePosition]:
+    """Reads the games of a game log one move at a time and yields every position of every game, starting with the
+    position each game starts from. Only the current line is held in memory and each move is parsed just before it is
+    made, so a log of any size can be streamed through, for example straight from an open file.
+
+    The board state that is yielded for a game is the same object for every ply of that game, and the next move is made
+    on it in place as soon as the caller asks for the next position. Copy it, for example with encode_board_state(), to
+    keep a position.
+
+    Parameters
+    ----------
+    lines: Iterable[str]
+        The lines of the game log.
+    """
+    game = 0
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith(COMMENT):
+            continue
+        try:
+            if line.startswith(POSITION_START):
+                end = line.index(POSITION_END)
+                board_state = position_from_notation(line[1:end])
+                line = line[end + 1:]
+            else:
+                board_state = generate_initial_board_state()
+            yield game, 0, board_state
+            for ply, notation in enumerate(line.split(), 1):
+                move, promotion_type = move_from_notation(notation, board_state)
+                board_state.make_move(move, promotion_type)
+                yield game, ply, board_state
+        except ValueError as error:
+            raise ValueError("Line {}: {}".format(line_number, error)) from error
+        game += 1
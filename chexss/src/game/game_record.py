@@ -0,0 +1,240 @@
+"""
+game_record.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import mmap
+import os
+import struct
+from array import array
+from typing import BinaryIO, Iterable, Optional, Tuple
+from src.board.board_state import BoardState
+from src.board.board_state_codec import decode_board_state, encode_board_state
+from src.board.cell_index import CellIndex, get_cell_index
+from src.pieces.move import Move, pack_move, unpack_move
+from src.pieces.piece_type import PieceType
+
+
+# A game record file starts with MAGIC, followed by the games one after another. Each game is laid out as:
+#
+#   4 bytes                 the number of bytes in the rest of the game
+#   2 bytes                 the number of plies in the game
+#   4 bytes per ply         the move of each ply, packed with pack_ply()
+#   the rest                the position the game starts from, encoded with encode_board_state()
+#
+# All integers are little endian. The moves come before the starting position so that the move of any ply is at a fixed
+# offset from the start of its game, and the length prefix lets a reader hop from game to game without decoding any of
+# them. Games are only ever appended, so a file can keep growing while it is being read.
+MAGIC = b"CHXSGR01"
+_LENGTH = struct.Struct("<I")
+_GAME_HEADER = struct.Struct("<IH")
+_PLY = struct.Struct("<I")
+MAX_PLIES = 0xFFFF
+
+# pack_move() uses the low 28 bits, which leaves room for the type of piece a pawn is promoted to plus one.
+_PROMOTION_TYPE_SHIFT = 28
+
+Ply = Tuple[Move, Optional[PieceType]]
+
+
+def pack_ply(
+    move: Move,
+    promotion_type: Optional[PieceType],
+    cell_index: CellIndex
+) -> int:
+    """Packs a move, and the type of piece a pawn is promoted to by the move, into a single int that fits in 32 bits.
+
+    Parameters
+    ----------
+    move: Move
+        The move to pack.
+
+    promotion_type: Optional[PieceType]
+        The promotion type passed to BoardState.make_move() for the move, if any.
+
+    cell_index: CellIndex
+        The cell index of the board the move is on.
+    """
+    promotion = 0 if promotion_type is None else promotion_type.value + 1
+    return pack_move(move, cell_index) | promotion << _PROMOTION_TYPE_SHIFT
+
+
+def unpack_ply(value: int, cell_index: CellIndex) -> Ply:
+    """Unpacks a move and promotion type packed with pack_ply()."""
+    promotion = value >> _PROMOTION_TYPE_SHIFT
+    return (
+        unpack_move(value & ((1 << _PROMOTION_TYPE_SHIFT) - 1), cell_index),
+        None if promotion == 0 else PieceType(promotion - 1)
+    )
+
+
+class GameRecordWriter:
+    """This class appends games to a game record file, creating the file if it does not exist. Each game is written
+    with a single write, so a reader never sees part of a game unless the writer dies in the middle of one, and a game
+    cut short that way is ignored by GameRecordReader.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        path: str
+            The game record file to append to.
+        """
+        self._file: BinaryIO = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+            self._file.flush()
+
+    def append(
+        self,
+        initial_state: BoardState,
+        plies: Iterable[Ply]
+    ) -> None:
+        """Append a game to the file.
+
+        Parameters
+        ----------
+        initial_state: BoardState
+            The position the game starts from.
+
+        plies: Iterable[Ply]
+            The moves of the game in the order they were made, each with the promotion type that was passed to
+            BoardState.make_move() for it.
+        """
+        cell_index = get_cell_index(initial_state.board.dimension)
+        moves = [pack_ply(move, promotion_type, cell_index) for move, promotion_type in plies]
+        if len(moves) > MAX_PLIES:
+            raise ValueError("A game can have at most {} plies but got {}.".format(MAX_PLIES, len(moves)))
+        state = encode_board_state(initial_state)
+        length = _GAME_HEADER.size - _LENGTH.size + len(moves) * _PLY.size + len(state)
+        self._file.write(
+            _GAME_HEADER.pack(length, len(moves)) + struct.pack("<{}I".format(len(moves)), *moves) + state)
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> 'GameRecordWriter':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+class GameRecordReader:
+    """This class gives random access to the games in a game record file by memory mapping it. Opening the file only
+    walks the length prefixes to find where each game starts; a game is not decoded until it is asked for, and the move
+    of any ply is read straight out of the map. Call refresh() to pick up games appended since the file was opened.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        path: str
+            The game record file to read.
+        """
+        self._file: BinaryIO = open(path, "rb")
+        self._map: Optional[mmap.mmap] = None
+        self._offsets = array("Q")
+        self._end = len(MAGIC)
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Map the file again and index any games that were appended to it since it was last mapped."""
+        size = os.fstat(self._file.fileno()).st_size
+        if size < len(MAGIC):
+            raise ValueError("The file is not a game record file.")
+        if self._map is not None:
+            self._map.close()
+        self._map = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            raise ValueError("The file is not a game record file.")
+
+        position = self._end
+        while position + _LENGTH.size <= size:
+            length, = _LENGTH.unpack_from(self._map, position)
+            if position + _LENGTH.size + length > size:
+                # The last game was not completely written.
+                break
+            self._offsets.append(position)
+            position += _LENGTH.size + length
+        self._end = position
+
+    def __len__(self) -> int:
+        """The number of games in the file."""
+        return len(self._offsets)
+
+    def plies(self, game: int) -> int:
+        """Returns the number of plies in the given game."""
+        return _GAME_HEADER.unpack_from(self._mapped, self._offsets[game])[1]
+
+    def ply(self, game: int, ply: int) -> Ply:
+        """Returns the move made at the given ply of the given game, and the promotion type it was made with.
+
+        Parameters
+        ----------
+        game: int
+            The index of the game in the file.
+
+        ply: int
+            The index of the ply in the game, starting at zero.
+        """
+        if not 0 <= ply < self.plies(game):
+            raise IndexError("Game {} has no ply {}.".format(game, ply))
+        offset = self._offsets[game] + _GAME_HEADER.size + ply * _PLY.size
+        value, = _PLY.unpack_from(self._mapped, offset)
+        return unpack_ply(value, get_cell_index(self._mapped[self._state_offset(game)]))
+
+    def initial_state(self, game: int) -> BoardState:
+        """Returns the position the given game starts from."""
+        return decode_board_state(self._mapped, self._state_offset(game))
+
+    def position(self, game: int, ply: int) -> BoardState:
+        """Returns the position of the given game after the given number of plies have been made, so ply zero is the
+        starting position and plies(game) is the final position.
+
+        Parameters
+        ----------
+        game: int
+            The index of the game in the file.
+
+        ply: int
+            The number of plies to make from the starting position.
+        """
+        plies = self.plies(game)
+        if not 0 <= ply <= plies:
+            raise IndexError("Game {} has no ply {}.".format(game, ply))
+        board_state = self.initial_state(game)
+        cell_index = get_cell_index(board_state.board.dimension)
+        mapped = self._mapped
+        offset = self._offsets[game] + _GAME_HEADER.size
+        for value, in _PLY.iter_unpack(mapped[offset:offset + ply * _PLY.size]):
+            move, promotion_type = unpack_ply(value, cell_index)
+            board_state.make_move(move, promotion_type)
+        return board_state
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self) -> 'GameRecordReader':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @property
+    def _mapped(self) -> mmap.mmap:
+        if self._map is None:
+            raise Exception("The game record file is closed.")
+        return self._map
+
+    def _state_offset(self, game: int) -> int:
+        offset = self._offsets[game]
+        return offset + _GAME_HEADER.size + _GAME_HEADER.unpack_from(self._mapped, offset)[1] * _PLY.size
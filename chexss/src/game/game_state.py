@@ -0,0 +1,240 @@
+"""
+game_state.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+from typing import List, Optional
+from src.board.attack_map import AttackMap, AttackUndo
+from src.board.bitboard_masks import ALL_DIRECTIONS, ORTHOGONAL_DIRECTIONS
+from src.board.board_state import BoardState, MoveUndo
+from src.pieces.move import Move
+from src.pieces.move_generator import generate_moves
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player, next_player, previous_player
+
+
+class GameUndo:
+    """This class records what GameState.make_move() changed, so that GameState.unmake_move() can put it back."""
+
+    __slots__ = ("_move_undo", "_attack_undo")
+
+    def __init__(
+        self,
+        move_undo: MoveUndo,
+        attack_undo: AttackUndo
+    ) -> None:
+        self._move_undo = move_undo
+        self._attack_undo = attack_undo
+
+    @property
+    def move_undo(self) -> MoveUndo:
+        return self._move_undo
+
+    @property
+    def attack_undo(self) -> AttackUndo:
+        return self._attack_undo
+
+
+class GameState:
+    """This class adds the rules of the game on top of a BoardState. Piece.moves() and generate_moves() only know how
+    the pieces move; legal_moves() filters those moves by the rules in RULES.md for the player to move, here called P,
+    with N the player who moves next and L the player who moves last, ie the one who moved before P:
+
+    * A move must not leave a king that N can capture. This covers P's own king, but also L's king, since N would take
+      it before L gets to move.
+    * If P has a move that leaves their king attacked by nobody, they must make one of those. Only if they can not
+      defend themselves may they leave their king attacked by L and rely on N to defend it.
+    * If L attacks N's king after the move and N is left without a move, L would win, so P must not make such a move
+      if they have any other. Leaving N checkmated by P's own pieces is allowed, which is how P steals a mate.
+
+    The player to move is out of moves when there are no legal moves, and is checkmated if they are also in check.
+
+    Rather than making every move and generating every reply, the filter keeps an AttackMap of the position that is
+    updated incrementally, and works out up front which of P's pieces shield a king from a sliding piece. Any other
+    piece can only block attacks by moving, so unless someone is already in check its moves are legal without being
+    made. Only king moves, moves of shielding pieces and positions with a king in check are checked by making the move
+    on the attack map.
+    """
+
+    def __init__(self, board_state: BoardState) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        board_state: BoardState
+            The position of the game. The game state takes ownership of it and keeps it up to date, so only change it
+            through make_move() and unmake_move().
+        """
+        self._board_state = board_state
+        self._attack_map = AttackMap.from_board_state(board_state)
+
+    @property
+    def board_state(self) -> BoardState:
+        return self._board_state
+
+    @property
+    def attack_map(self) -> AttackMap:
+        return self._attack_map
+
+    @property
+    def side_to_move(self) -> Player:
+        """The player whose turn it is."""
+        return self._board_state.side_to_move
+
+    def make_move(
+        self,
+        move: Move,
+        promotion_type: Optional[PieceType] = None
+    ) -> GameUndo:
+        """Make the given move, updating the board state and the attack map. Like BoardState.make_move() this does not
+        check that the move is legal, use legal_moves() for that.
+
+        Parameters
+        ----------
+        move: Move
+            The move to make.
+
+        promotion_type: Optional[PieceType]
+            The type of piece a pawn is promoted to if the move is a promotion. If not given the piece is not changed.
+
+        Returns
+        -------
+        GameUndo
+            The record to pass to unmake_move() to take the move back.
+        """
+        move_undo = self._board_state.make_move(move, promotion_type)
+        return GameUndo(move_undo, self._attack_map.make_move(move, promotion_type))
+
+    def unmake_move(self, undo: GameUndo) -> None:
+        """Take back a move made with make_move(). Moves must be taken back in the reverse order they were made."""
+        self._attack_map.unmake_move(undo.attack_undo)
+        self._board_state.unmake_move(undo.move_undo)
+
+    def is_in_check(self, player: Player) -> bool:
+        """Returns True if the given player's king is attacked by either of the other players."""
+        return self._attack_map.is_in_check(player)
+
+    def legal_moves(self) -> List[Move]:
+        """Returns the legal moves of the player to move. A pawn move onto a promotion hex is checked as if the pawn is
+        not promoted, which makes no difference to which kings are attacked after the move.
+        """
+        player = self.side_to_move
+        next_mover = next_player(player)
+        last_mover = previous_player(player)
+        attack_map = self._attack_map
+        bitboards = attack_map.bitboards
+        own_king = bitboards.pieces(player, PieceType.KING)
+        next_king = bitboards.pieces(next_mover, PieceType.KING)
+        last_king = bitboards.pieces(last_mover, PieceType.KING)
+
+        # The rules only look at three kinds of attack: N on the kings of P and L, L on the king of P, and L on the king
+        # of N. If none of them is happening now, a move can only start one by taking a piece out of the way of a
+        # sliding piece, so only the moves of the pieces that are in the way need to be checked.
+        attacked = (
+            attack_map.attacks(next_mover) & (own_king | last_king) != 0 or
+            attack_map.attacks(last_mover) & (own_king | next_king) != 0
+        )
+        shielding = 0
+        if not attacked:
+            shielding = (
+                self._shielding(player, own_king, next_mover) |
+                self._shielding(player, last_king, next_mover) |
+                self._shielding(player, own_king, last_mover) |
+                self._shielding(player, next_king, last_mover)
+            )
+
+        # The king and the shielding pieces are the only pieces whose moves need to be made to be checked.
+        made = shielding | own_king
+        index = bitboards.masks.cell_index.index
+        safe: List[Move] = []
+        defended: List[Move] = []
+        stranding: List[Move] = []
+        for move in generate_moves(self._board_state, player):
+            from_bit = 1 << index(move.from_coord)
+            if not attacked and not made & from_bit:
+                safe.append(move)
+                defended.append(move)
+                continue
+
+            undo = self.make_move(move)
+            king = bitboards.pieces(player, PieceType.KING)
+            if attack_map.attacks(next_mover) & (king | bitboards.pieces(last_mover, PieceType.KING)) == 0:
+                safe.append(move)
+                if attack_map.attacks(last_mover) & king == 0:
+                    defended.append(move)
+                if (
+                    attack_map.attacks(last_mover) & bitboards.pieces(next_mover, PieceType.KING) and
+                    not self._has_safe_move(next_mover)
+                ):
+                    stranding.append(move)
+            self.unmake_move(undo)
+
+        candidates = defended if defended else safe
+        if stranding:
+            stranded = set(stranding)
+            escapes = [move for move in candidates if move not in stranded]
+            if escapes:
+                return escapes
+        return candidates
+
+    def is_game_over(self) -> bool:
+        """Returns True if the player to move has no legal moves."""
+        return not self.legal_moves()
+
+    def mating_player(self) -> Optional[Player]:
+        """Returns the player who checkmated the player to move, or None if they are not checkmated. If both of the
+        other players attack the king, the win goes to the one who moved most recently."""
+        player = self.side_to_move
+        if not self.is_in_check(player) or self.legal_moves():
+            return None
+        checking = self._attack_map.checking_players(player)
+        last_mover = previous_player(player)
+        return last_mover if last_mover in checking else next_player(player)
+
+    def _shielding(self, player: Player, king: int, attacker: Player) -> int:
+        """Returns the mask of the given player's pieces that are the only piece between the given king and a sliding
+        piece of the attacker that moves along that line."""
+        if not king:
+            return 0
+        bitboards = self._attack_map.bitboards
+        masks = bitboards.masks
+        rays = masks.rays[king.bit_length() - 1]
+        increasing = masks.ray_increasing
+        occupied = bitboards.occupied
+        own = bitboards.occupancy(player)
+        queens = bitboards.pieces(attacker, PieceType.QUEEN)
+        orthogonal_sliders = queens | bitboards.pieces(attacker, PieceType.ROOK)
+        diagonal_sliders = queens | bitboards.pieces(attacker, PieceType.BISHOP)
+        shielding = 0
+        for direction in ALL_DIRECTIONS:
+            blockers = rays[direction] & occupied
+            if not blockers:
+                continue
+            first = blockers & -blockers if increasing[direction] else 1 << (blockers.bit_length() - 1)
+            if not first & own:
+                continue
+            blockers ^= first
+            if not blockers:
+                continue
+            second = blockers & -blockers if increasing[direction] else 1 << (blockers.bit_length() - 1)
+            sliders = orthogonal_sliders if direction in ORTHOGONAL_DIRECTIONS else diagonal_sliders
+            if second & sliders:
+                shielding |= first
+        return shielding
+
+    def _has_safe_move(self, player: Player) -> bool:
+        """Returns True if the given player, who is about to move, has a move that leaves no king that the player after
+        them can capture. Whether a player has any legal move only depends on this, since the other rules only choose
+        between moves that are safe."""
+        attack_map = self._attack_map
+        bitboards = attack_map.bitboards
+        next_mover = next_player(player)
+        last_mover = previous_player(player)
+        for move in generate_moves(self._board_state, player):
+            undo = self.make_move(move)
+            kings = bitboards.pieces(player, PieceType.KING) | bitboards.pieces(last_mover, PieceType.KING)
+            safe = attack_map.attacks(next_mover) & kings == 0
+            self.unmake_move(undo)
+            if safe:
+                return True
+        return False
@@ -0,0 +1,121 @@
+"""
+move_notation.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+from typing import Optional
+from src.board.algebraic_coordinate import AlgebraicCoordinate
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state import BoardState
+from src.board.coordinate_converter import get_coordinate_converter
+from src.board.position_notation import LETTER_PIECES, PIECE_LETTERS
+from src.game.game_record import Ply
+from src.pieces.move import Move
+from src.pieces.move_generator import generate_piece_moves, get_move_tables
+from src.pieces.piece_type import PieceType
+
+
+# A move is written as the label of the hex the piece moves from, a "-" for a move to an empty hex or an "x" for a
+# capture, and the label of the hex it moves to. A pawn that is promoted adds "=" and the letter of the piece it is
+# promoted to. For example "k3-l4", "m7xo7" and "q11-r12=Q". Since a label always ends in its row number, the "x" of a
+# capture can not be confused with the "x" column.
+MOVE = "-"
+CAPTURE = "x"
+PROMOTION = "="
+
+
+def move_to_notation(
+    move: Move,
+    promotion_type: Optional[PieceType],
+    dimension: int
+) -> str:
+    """Returns the notation of the given move.
+
+    Parameters
+    ----------
+    move: Move
+        The move to write.
+
+    promotion_type: Optional[PieceType]
+        The type of piece a pawn is promoted to by the move, if any.
+
+    dimension: int
+        The dimension of the board the move is on.
+    """
+    converter = get_coordinate_converter(dimension)
+    notation = "{}{}{}".format(
+        converter.board_to_algebraic(move.from_coord),
+        CAPTURE if move.is_capture else MOVE,
+        converter.board_to_algebraic(move.to_coord))
+    if promotion_type is not None:
+        notation += PROMOTION + PIECE_LETTERS[promotion_type]
+    return notation
+
+
+def _parse_coordinate(label: str, board_state: BoardState) -> BoardCoordinate:
+    if not label or not label[0].isalpha() or not label[-1].isdigit():
+        raise ValueError("Invalid hex label: {}".format(label))
+    converter = get_coordinate_converter(board_state.board.dimension)
+    algebraic = AlgebraicCoordinate.from_string(label)
+    coord = converter.algebraic_to_board(algebraic)
+    # Half of the column and row combinations fall between hexes, and those do not convert back to the same label.
+    if not board_state.board.is_valid_coordinate(coord) or converter.board_to_algebraic(coord) != algebraic:
+        raise ValueError("{} is not a hex on the board.".format(label))
+    return coord
+
+
+def move_from_notation(
+    notation: str,
+    board_state: BoardState
+) -> Ply:
+    """Returns the move written in the given notation, and the type of piece it promotes a pawn to if any. The board
+    state is the position the move is made from, which fills in the captured piece and whether the move is onto a
+    promotion hex, and checks that the move is consistent with the position: there is a piece of the player to move on
+    the from hex that can move to the to hex, a capture is written with an "x" and only a pawn on a promotion hex is
+    promoted. Like generate_moves() this does not check the rules about kings, use GameState.legal_moves() for that.
+
+    Parameters
+    ----------
+    notation: str
+        The notation of the move.
+
+    board_state: BoardState
+        The position the move is made from.
+    """
+    promotion_type: Optional[PieceType] = None
+    if PROMOTION in notation:
+        notation, letter = notation.split(PROMOTION, 1)
+        promotion_type = LETTER_PIECES.get(letter)
+        if promotion_type is None:
+            raise ValueError("Invalid promotion piece: {}".format(letter))
+
+    # The separator is the first character after the digits of the from label.
+    separator = len(notation)
+    for i in range(1, len(notation)):
+        if notation[i - 1].isdigit() and not notation[i].isdigit():
+            separator = i
+            break
+    if separator >= len(notation) or notation[separator] not in (MOVE, CAPTURE):
+        raise ValueError("Invalid move: {}".format(notation))
+    from_coord = _parse_coordinate(notation[:separator], board_state)
+    to_coord = _parse_coordinate(notation[separator + 1:], board_state)
+
+    moved = board_state.get_piece_info(from_coord)
+    if moved is None or moved.player != board_state.side_to_move:
+        raise ValueError("{} does not have a piece on {}.".format(
+            board_state.side_to_move.name.lower(), notation[:separator]))
+    captured = board_state.get_piece_info(to_coord)
+    is_capture = notation[separator] == CAPTURE
+    if (captured is not None) != is_capture or (captured is not None and captured.player == moved.player):
+        raise ValueError("{} does not match the piece on {}.".format(notation, notation[separator + 1:]))
+    promotion = (
+        moved.piece_type == PieceType.PAWN and
+        to_coord in get_move_tables(board_state.board.dimension).promotion[moved.player.value]
+    )
+    if promotion_type is not None and not promotion:
+        raise ValueError("{} can not promote a piece.".format(notation))
+    move = Move(from_coord, to_coord, None if captured is None else captured.piece_type, promotion)
+    if move not in generate_piece_moves(board_state, from_coord):
+        raise ValueError("The piece on {} can not move to {}.".format(
+            notation[:separator], notation[separator + 1:]))
+    return move, promotion_type
@@ -0,0 +1,62 @@
+"""
+test_game_log.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import unittest
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state import BoardStateBuilder
+from src.board.board_state_codec import decode_board_state, encode_board_state
+from src.board.board_state_utils import generate_initial_board_state
+from src.game.game_log import game_to_notation, read_game_log
+from src.pieces.move_generator import generate_moves
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+
+
+class TestGameLog(unittest.TestCase):
+
+    def test_round_trip(self):
+        """We test that a recorded game reads back as the same positions, one ply at a time."""
+        board_state = generate_initial_board_state()
+        plies = []
+        expected = [encode_board_state(board_state)]
+        for _ in range(7):
+            moves = generate_moves(board_state, board_state.side_to_move)
+            plies.append((moves[-1], None))
+            board_state.make_move(moves[-1])
+            expected.append(encode_board_state(board_state))
+        line = game_to_notation(generate_initial_board_state(), plies)
+        self.assertFalse(line.startswith("["))
+
+        endgame = (
+            BoardStateBuilder(Board(4))
+            .add_piece(Player.WHITE, BoardCoordinate(0, 3), PieceType.KING)
+            .add_piece(Player.SILVER, BoardCoordinate(3, -3), PieceType.ROOK)
+            .build())
+        log = ["# two games", line, "", "[4 Kj1 Rj7 - w] j1-i2 j7-k6"]
+        positions = read_game_log(iter(log))
+        for ply, encoded in enumerate(expected):
+            game, played, state = next(positions)
+            self.assertEqual((game, played), (0, ply))
+            self.assertEqual(encode_board_state(state), encoded)
+        game, ply, first = next(positions)
+        self.assertEqual((game, ply), (1, 0))
+        self.assertEqual(first, endgame)
+        self.assertEqual([(game, ply) for game, ply, _ in positions], [(1, 1), (1, 2)])
+        self.assertEqual(first.get_piece_info(BoardCoordinate(3, -2)).piece_type, PieceType.ROOK)
+
+        final = [encode_board_state(state) for _, _, state in read_game_log([line])]
+        self.assertEqual(final, expected)
+        self.assertEqual(decode_board_state(final[-1]).side_to_move, Player.SILVER)
+
+    def test_invalid(self):
+        """We test that an invalid move is reported with its line number."""
+        with self.assertRaisesRegex(ValueError, "Line 2"):
+            list(read_game_log(["i3-j4", "i3xj4"]))
+
+    def test_impossible_move(self):
+        """We test that a move the piece can not make stops the log with the line number of the move."""
+        with self.assertRaisesRegex(ValueError, "^Line 3: "):
+            list(read_game_log(["# a corrupt game", "i3-j4", "k1-m7"]))
@@ -0,0 +1,108 @@
+"""
+test_game_record.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import os
+import tempfile
+import unittest
+from typing import List, Tuple
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state import BoardState, BoardStateBuilder
+from src.board.board_state_codec import decode_board_state, encode_board_state
+from src.board.board_state_utils import generate_initial_board_state
+from src.board.cell_index import get_cell_index
+from src.game.game_record import GameRecordReader, GameRecordWriter, Ply, pack_ply, unpack_ply
+from src.pieces.move import Move
+from src.pieces.move_generator import generate_moves
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+
+
+class TestGameRecord(unittest.TestCase):
+
+    def setUp(self):
+        handle, self._path = tempfile.mkstemp(suffix=".chexss")
+        os.close(handle)
+        os.remove(self._path)
+
+    def tearDown(self):
+        if os.path.exists(self._path):
+            os.remove(self._path)
+
+    def _play(self, board_state: BoardState, plies: int) -> Tuple[List[Ply], List[BoardState]]:
+        """Makes the given number of plies on the board state and returns them along with every position."""
+        moves: List[Ply] = []
+        positions = [decode_board_state(encode_board_state(board_state))]
+        for ply in range(plies):
+            generated = generate_moves(board_state, board_state.side_to_move)
+            moves.append((generated[ply % len(generated)], None))
+            board_state.make_move(moves[-1][0])
+            positions.append(decode_board_state(encode_board_state(board_state)))
+        return moves, positions
+
+    def test_pack_ply(self):
+        """We test that a move with a promotion type survives being packed and unpacked."""
+        cell_index = get_cell_index(7)
+        ply: Ply = (Move(BoardCoordinate(0, -5), BoardCoordinate(0, -6), PieceType.ROOK, True), PieceType.QUEEN)
+        self.assertEqual(unpack_ply(pack_ply(*ply, cell_index), cell_index), ply)
+        self.assertLess(pack_ply(*ply, cell_index), 1 << 32)
+
+    def test_board_too_large(self):
+        """We test that the largest board a ply can be packed on works, and a larger one is rejected."""
+        cell_index = get_cell_index(37)
+        ply: Ply = (Move(cell_index.coordinate(cell_index.size - 1), cell_index.coordinate(0)), None)
+        self.assertEqual(unpack_ply(pack_ply(*ply, cell_index), cell_index), ply)
+
+        cell_index = get_cell_index(38)
+        board_state = (
+            BoardStateBuilder(Board(38))
+            .add_piece(Player.WHITE, cell_index.coordinate(0), PieceType.ROOK)
+            .build())
+        ply = (Move(cell_index.coordinate(0), cell_index.coordinate(cell_index.size - 1)), None)
+        with GameRecordWriter(self._path) as writer:
+            with self.assertRaises(ValueError):
+                writer.append(board_state, [ply])
+        with GameRecordReader(self._path) as reader:
+            self.assertEqual(len(reader), 0)
+
+    def test_random_access(self):
+        """We test that any ply of any game can be read back, including games appended after the reader opened."""
+        plies, positions = self._play(generate_initial_board_state(), 9)
+        with GameRecordWriter(self._path) as writer:
+            writer.append(positions[0], plies)
+            writer.append(BoardStateBuilder(Board(3)).build(), [])
+
+        promotion = (
+            BoardStateBuilder(Board(4))
+            .add_piece(Player.WHITE, BoardCoordinate(0, -2), PieceType.PAWN)
+            .build())
+        with GameRecordReader(self._path) as reader:
+            self.assertEqual(len(reader), 2)
+            self.assertEqual(reader.plies(0), 9)
+            self.assertEqual(reader.plies(1), 0)
+            for ply, position in enumerate(positions):
+                self.assertEqual(reader.position(0, ply), position)
+            self.assertEqual(reader.ply(0, 4), plies[4])
+            self.assertEqual(reader.initial_state(1), BoardStateBuilder(Board(3)).build())
+            with self.assertRaises(IndexError):
+                reader.ply(0, 9)
+
+            with GameRecordWriter(self._path) as writer:
+                writer.append(promotion, [(Move(BoardCoordinate(0, -2), BoardCoordinate(0, -3)), PieceType.KNIGHT)])
+            self.assertEqual(len(reader), 2)
+            reader.refresh()
+            self.assertEqual(len(reader), 3)
+            final = reader.position(2, 1)
+            self.assertEqual(final.get_piece_info(BoardCoordinate(0, -3)).piece_type, PieceType.KNIGHT)
+
+    def test_truncated(self):
+        """We test that a game that was not completely written is ignored."""
+        with GameRecordWriter(self._path) as writer:
+            writer.append(generate_initial_board_state(), [])
+            writer.append(generate_initial_board_state(), [])
+        with open(self._path, "r+b") as file:
+            file.truncate(os.path.getsize(self._path) - 1)
+        with GameRecordReader(self._path) as reader:
+            self.assertEqual(len(reader), 1)
@@ -0,0 +1,149 @@
+"""
+test_game_state.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import random
+import unittest
+from typing import List, Set
+from src.board.bitboards import Bitboards
+from src.board.board import Board
+from src.board.board_state import BoardState, BoardStateBuilder
+from src.board.board_state_utils import generate_initial_board_state
+from src.board.position_notation import position_from_notation
+from src.game.game_state import GameState
+from src.game.move_notation import move_from_notation, move_to_notation
+from src.pieces.move import Move
+from src.pieces.move_generator import generate_moves
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player, next_player, previous_player
+
+
+def _notations(moves: List[Move]) -> Set[str]:
+    return {move_to_notation(move, None, 5) for move in moves}
+
+
+def _kings(bitboards: Bitboards, *players: Player) -> int:
+    kings = 0
+    for player in players:
+        kings |= bitboards.pieces(player, PieceType.KING)
+    return kings
+
+
+def _has_safe_move(board_state: BoardState, player: Player) -> bool:
+    for move in generate_moves(board_state, player):
+        undo = board_state.make_move(move)
+        bitboards = Bitboards.from_board_state(board_state)
+        safe = bitboards.attacks(next_player(player)) & _kings(bitboards, player, previous_player(player)) == 0
+        board_state.unmake_move(undo)
+        if safe:
+            return True
+    return False
+
+
+def _brute_force_legal_moves(board_state: BoardState) -> List[Move]:
+    """The rules of GameState.legal_moves() applied by making every move and rebuilding every attack from scratch."""
+    player = board_state.side_to_move
+    next_mover = next_player(player)
+    last_mover = previous_player(player)
+    safe, defended, stranding = [], [], []
+    for move in generate_moves(board_state, player):
+        undo = board_state.make_move(move)
+        bitboards = Bitboards.from_board_state(board_state)
+        if bitboards.attacks(next_mover) & _kings(bitboards, player, last_mover) == 0:
+            safe.append(move)
+            if bitboards.attacks(last_mover) & _kings(bitboards, player) == 0:
+                defended.append(move)
+            if bitboards.attacks(last_mover) & _kings(bitboards, next_mover) and not _has_safe_move(
+                    board_state, next_mover):
+                stranding.append(move)
+        board_state.unmake_move(undo)
+    candidates = defended or safe
+    return [move for move in candidates if move not in stranding] or candidates
+
+
+class TestGameState(unittest.TestCase):
+
+    def test_pinned_piece(self):
+        """We test that a piece can not move out of the way of a rook of the next player attacking its king."""
+        notation = "5 Ni5,Kk3 Rf8,Km9 Ka5 w"
+        moves = GameState(position_from_notation(notation)).legal_moves()
+        self.assertTrue(moves)
+        self.assertFalse([move for move in moves if move_to_notation(move, None, 5).startswith("i5")])
+
+    def test_shielding_last_players_king(self):
+        """We test that a piece can not move out of the way of a rook of the next player attacking the king of the
+        player who moves last, since the next player would capture it."""
+        notation = "5 Ni5,Kp4 Rf8,Km9 Kk3 w"
+        moves = GameState(position_from_notation(notation)).legal_moves()
+        self.assertEqual(_notations(moves), {"p4-m5", "p4-o3", "p4-o5", "p4-p6", "p4-q5"})
+
+    def test_must_defend_self(self):
+        """We test that a player in check who can get out of check must do so."""
+        game_state = GameState(position_from_notation("5 Pf2,Ki5 Km9 Ka5,Rf8 w"))
+        self.assertTrue(game_state.is_in_check(Player.WHITE))
+        moves = game_state.legal_moves()
+        self.assertTrue(moves)
+        for move in moves:
+            self.assertEqual(move_to_notation(move, None, 5)[:2], "i5")
+            undo = game_state.make_move(move)
+            self.assertFalse(game_state.is_in_check(Player.WHITE))
+            game_state.unmake_move(undo)
+
+    def test_rely_on_next_player(self):
+        """We test that a player in check who can not get out of check may rely on the next player to defend them."""
+        game_state = GameState(position_from_notation("5 Qg1,Kg3,Qh8,Qi3 Qe1,Bf2,Ni9,Pl6,Km7 Qc5,Rf4,Km9 b"))
+        self.assertTrue(game_state.is_in_check(Player.BLACK))
+        moves = game_state.legal_moves()
+        self.assertTrue(moves)
+        self.assertIsNone(game_state.mating_player())
+        for move in moves:
+            undo = game_state.make_move(move)
+            self.assertTrue(game_state.is_in_check(Player.BLACK))
+            game_state.unmake_move(undo)
+
+    def test_must_not_strand_next_player(self):
+        """We test that a player may not leave the next player checkmated by the player who moves last."""
+        board_state = position_from_notation("5 Kg1 Kp4 Kk3,Rk5,No7 w")
+        game_state = GameState(board_state)
+        self.assertEqual(_notations(game_state.legal_moves()), {"g1-d2", "g1-e1", "g1-f2", "g1-g3", "g1-i1"})
+
+        game_state.make_move(move_from_notation("g1-h2", board_state)[0])
+        self.assertTrue(game_state.is_game_over())
+        self.assertEqual(game_state.mating_player(), Player.BLACK)
+
+    def test_stolen_mate(self):
+        """We test that a player may block a check on the next player with a piece that checkmates them instead."""
+        board_state = position_from_notation("5 Kc5,Rf4,Ph2 Km9 Qi9,Ko7 w")
+        game_state = GameState(board_state)
+        move = move_from_notation("f4-k9", board_state)[0]
+        self.assertIn(move, game_state.legal_moves())
+        game_state.make_move(move)
+        self.assertEqual(game_state.mating_player(), Player.WHITE)
+
+    def test_matches_brute_force(self):
+        """We test that the legal moves match making every move and rebuilding every attack, in random positions full
+        of checks and through the start of a game."""
+        rng = random.Random(1)
+        board = Board(5)
+        piece_types = [PieceType.QUEEN, PieceType.ROOK, PieceType.BISHOP, PieceType.KNIGHT, PieceType.PAWN]
+        for _ in range(150):
+            coordinates = list(board.coordinates)
+            rng.shuffle(coordinates)
+            builder = BoardStateBuilder(board).set_side_to_move(rng.choice(list(Player)))
+            for player in Player:
+                builder.add_piece(player, coordinates.pop(), PieceType.KING)
+                for _ in range(rng.randint(0, 4)):
+                    builder.add_piece(player, coordinates.pop(), rng.choice(piece_types))
+            board_state = builder.build()
+            game_state = GameState(builder.build())
+            self.assertEqual(set(game_state.legal_moves()), set(_brute_force_legal_moves(board_state)))
+
+        game_state = GameState(generate_initial_board_state())
+        board_state = generate_initial_board_state()
+        for _ in range(30):
+            moves = game_state.legal_moves()
+            self.assertEqual(set(moves), set(_brute_force_legal_moves(board_state)))
+            move = rng.choice(moves)
+            game_state.make_move(move)
+            board_state.make_move(move)
@@ -0,0 +1,47 @@
+"""
+test_move_notation.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import unittest
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state import BoardStateBuilder
+from src.board.board_state_utils import generate_initial_board_state
+from src.game.move_notation import move_from_notation, move_to_notation
+from src.pieces.move import Move
+from src.pieces.move_generator import generate_moves
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+
+
+class TestMoveNotation(unittest.TestCase):
+
+    def test_round_trip(self):
+        """We test that every move of the first few plies of a game reads back as the same move."""
+        board_state = generate_initial_board_state()
+        for _ in range(6):
+            moves = generate_moves(board_state, board_state.side_to_move)
+            for move in moves:
+                notation = move_to_notation(move, None, 7)
+                self.assertEqual(move_from_notation(notation, board_state), (move, None))
+            board_state.make_move(moves[len(moves) // 2])
+
+    def test_capture_and_promotion(self):
+        """We test the notation of a pawn that captures onto a promotion hex and is promoted."""
+        board_state = (
+            BoardStateBuilder(Board(4))
+            .add_piece(Player.WHITE, BoardCoordinate(2, -1), PieceType.PAWN)
+            .add_piece(Player.SILVER, BoardCoordinate(3, -3), PieceType.ROOK)
+            .build())
+        move = Move(BoardCoordinate(2, -1), BoardCoordinate(3, -3), PieceType.ROOK, True)
+        self.assertIn(move, generate_moves(board_state, Player.WHITE))
+        self.assertEqual(move_to_notation(move, PieceType.QUEEN, 4), "j5xj7=Q")
+        self.assertEqual(move_from_notation("j5xj7=Q", board_state), (move, PieceType.QUEEN))
+
+    def test_invalid(self):
+        """We test that moves that do not match the position are rejected."""
+        board_state = generate_initial_board_state()
+        for notation in ["i3", "i3+j4", "i4-j5", "i3-j4=X", "i3xj4", "i3-j4=Q", "ra7-b6", "q9-r10", "g1xf2", "k1-m7"]:
+            with self.assertRaises(ValueError):
+                move_from_notation(notation, board_state)
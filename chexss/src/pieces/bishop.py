@@ -11,10 +11,9 @@ from src.pieces.piece import Piece
 from src.pieces.piece_color import PieceColor
 from src.board.hex_meta import HexMeta
 from src.pieces.bishop_image import BishopImage
-from src.board.direction_utils import diagonal_direction_deltas
-from src.board.direction_iterator import DirectionIterator
+from src.board.ray_table import get_ray_table
 from src.pieces.piece_type import PieceType
-from src.pieces.move_utils import is_valid_move_location, location_is_occupied
+from src.pieces.move_utils import sliding_moves
 
 
 class Bishop(Piece):
@@ -41,17 +40,6 @@ class Bishop(Piece):
         blocking the path and the space does not contain another piece of the same player."""
         player = Piece.get_player_and_validate_piece_type(coord, board_state, PieceType.BISHOP)
 
-        # Loop through all of the directions and add the valid moves to the set
-        moves = set()
-        directions = diagonal_direction_deltas()
-        for direction in directions:
-            it = DirectionIterator(coord, direction)
-            next_coord = it.next()
-            while is_valid_move_location(player, next_coord, board_state):
-                moves.add(next_coord)
-                if location_is_occupied(next_coord, board_state):
-                    # If the location is occupied, we can't move past it so we break out of the loop
-                    break
-                next_coord = it.next()
-
-        return moves
+        # Scan the precomputed rays in each direction until they are blocked
+        rays = get_ray_table(board_state.board.dimension).diagonal_rays(coord)
+        return sliding_moves(player, rays, board_state)
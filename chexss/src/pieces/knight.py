@@ -4,7 +4,7 @@ Copyright © 2023 Derek Seiple
 Licensed under Creative Commons BY-NC-SA 3.0. See license file.
 """
 from PIL import Image
-from typing import Set, List
+from typing import Set
 from src.board.board_state import BoardState
 from src.board.board_coordinate import BoardCoordinate
 from src.pieces.piece import Piece
@@ -12,7 +12,8 @@ from src.pieces.piece_color import PieceColor
 from src.board.hex_meta import HexMeta
 from src.pieces.knight_image import KnightImage
 from src.pieces.piece_type import PieceType
-from src.board.direction_iterator import DirectionDelta, DirectionIterator
+from src.board.direction_iterator import DirectionIterator
+from src.board.direction_utils import knight_direction_deltas
 from src.pieces.move_utils import is_valid_move_location
 
 
@@ -41,7 +42,7 @@ class Knight(Piece):
 
         # Loop through all of the directions and add the valid moves to the set
         moves = set()
-        directions = self.__knight_direction_deltas()
+        directions = knight_direction_deltas()
         for direction in directions:
             it = DirectionIterator(coord, direction)
             for _ in range(1):
@@ -50,20 +51,3 @@ class Knight(Piece):
                     moves.add(next_coord)
 
         return moves
-
-    def __knight_direction_deltas(self) -> List[DirectionDelta]:
-        """Returns the direction deltas for the knight's moves."""
-        return [
-            DirectionDelta(1, -3),
-            DirectionDelta(2, -3),
-            DirectionDelta(3, -2),
-            DirectionDelta(3, -1),
-            DirectionDelta(2, 1),
-            DirectionDelta(1, 2),
-            DirectionDelta(-1, 3),
-            DirectionDelta(-2, 3),
-            DirectionDelta(-3, 2),
-            DirectionDelta(-3, 1),
-            DirectionDelta(-2, -1),
-            DirectionDelta(-1, -2)
-        ]
@@ -11,6 +11,10 @@ from src.board.hex_meta import HexMeta
 
 
 class KnightImage:
+    # The width and height of the SVG, and how much of the width of a hex the piece is scaled to fill.
+    SVG_SIZE = 45
+    SCALE_FACTOR = 0.9
+
     def __init__(
         self,
         meta: HexMeta,
@@ -32,9 +36,8 @@ class KnightImage:
 
         This will create a knight image with the given colors and the size will match the size of the HexMeta.
         """
-        scale_factor = 0.9
-        scaled_dim = round(float(meta.width) * scale_factor)
-        png = svg2png(bytestring=self.__get_svg(main_color, accent_color), scale=(scaled_dim / 45.0))
+        scaled_dim = round(float(meta.width) * self.SCALE_FACTOR)
+        png = svg2png(bytestring=self.svg(main_color, accent_color), scale=(scaled_dim / self.SVG_SIZE))
         self._image = Image.new("RGBA", (meta.width, meta.height), (255, 255, 255, 0))
         offset = (round((meta.width - scaled_dim) / 2), round((meta.height - scaled_dim) / 2))
         self._image.paste(Image.open(BytesIO(png)), offset)
@@ -44,7 +47,8 @@ class KnightImage:
         """The Pillow image of the knight."""
         return self._image
 
-    def __get_svg(self, main_color: str, accent_color: str) -> str:
+    @staticmethod
+    def svg(main_color: str, accent_color: str) -> str:
         """Return the SVG string for the knight image.
         The SVG code was adapted from here: https://commons.wikimedia.org/wiki/Chess_pieces#/media/File:Chess_nlt45.svg
         """
@@ -0,0 +1,142 @@
+"""
+move.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+from typing import Optional
+from src.board.board_coordinate import BoardCoordinate
+from src.board.cell_index import CellIndex
+from src.pieces.piece_type import PieceType
+
+
+# A move can be packed into a single int: 12 bits for each cell index, 3 bits for the captured piece type plus one (zero
+# meaning no capture) and 1 bit for the promotion flag. Since a move never starts and ends on the same cell, a packed
+# value of zero never represents a real move and can be used to mean "no move". The 12 bits hold the cell indexes of
+# boards of dimension 37 or less.
+NO_MOVE = 0
+_CELL_BITS = 12
+_CELL_MASK = (1 << _CELL_BITS) - 1
+_CAPTURED_SHIFT = 2 * _CELL_BITS
+_PROMOTION_SHIFT = _CAPTURED_SHIFT + 3
+
+
+class Move:
+    """This class represents a single move of a piece from one coordinate to another. Along with the coordinates it
+    records the type of piece that is captured by the move (if any) and whether the move takes a pawn onto a promotion
+    hex. Moves are created in large numbers during move generation, so the class uses __slots__ to keep them small.
+    """
+
+    __slots__ = ("_from_coord", "_to_coord", "_captured", "_promotion")
+
+    def __init__(
+        self,
+        from_coord: BoardCoordinate,
+        to_coord: BoardCoordinate,
+        captured: Optional[PieceType] = None,
+        promotion: bool = False
+    ) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        from_coord: BoardCoordinate
+            The coordinate the piece moves from.
+
+        to_coord: BoardCoordinate
+            The coordinate the piece moves to.
+
+        captured: Optional[PieceType]
+            The type of the piece on to_coord that is captured by the move, or None if to_coord is empty.
+
+        promotion: bool
+            True if the move takes a pawn onto the base row of another player, where it can be promoted.
+        """
+        self._from_coord = from_coord
+        self._to_coord = to_coord
+        self._captured = captured
+        self._promotion = promotion
+
+    def __str__(self) -> str:
+        return "{} -> {}".format(self._from_coord, self._to_coord)
+
+    def __repr__(self) -> str:
+        return "Move({}, {}, captured={}, promotion={})".format(
+            self._from_coord, self._to_coord, self._captured, self._promotion)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Move):
+            return False
+        return (
+            self._from_coord == other._from_coord and
+            self._to_coord == other._to_coord and
+            self._captured == other._captured and
+            self._promotion == other._promotion
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._from_coord, self._to_coord, self._captured, self._promotion))
+
+    @property
+    def from_coord(self) -> BoardCoordinate:
+        return self._from_coord
+
+    @property
+    def to_coord(self) -> BoardCoordinate:
+        return self._to_coord
+
+    @property
+    def captured(self) -> Optional[PieceType]:
+        return self._captured
+
+    @property
+    def promotion(self) -> bool:
+        return self._promotion
+
+    @property
+    def is_capture(self) -> bool:
+        return self._captured is not None
+
+
+def pack_move(move: Move, cell_index: CellIndex) -> int:
+    """Packs the move into a single non-negative int that fits in 32 bits. Raises a ValueError if the board has too many
+    cells for their indexes to fit.
+
+    Parameters
+    ----------
+    move: Move
+        The move to pack.
+
+    cell_index: CellIndex
+        The cell index of the board the move is on.
+    """
+    if cell_index.size > 1 << _CELL_BITS:
+        raise ValueError("Can not pack a move on a board of dimension {}.".format(cell_index.dimension))
+    captured = 0 if move.captured is None else move.captured.value + 1
+    return (
+        cell_index.index(move.from_coord) |
+        cell_index.index(move.to_coord) << _CELL_BITS |
+        captured << _CAPTURED_SHIFT |
+        int(move.promotion) << _PROMOTION_SHIFT
+    )
+
+
+def unpack_move(value: int, cell_index: CellIndex) -> Move:
+    """Unpacks a move packed with pack_move().
+
+    Parameters
+    ----------
+    value: int
+        The packed move. This must not be NO_MOVE.
+
+    cell_index: CellIndex
+        The cell index of the board the move is on.
+    """
+    if value == NO_MOVE:
+        raise ValueError("Can not unpack NO_MOVE.")
+    captured = value >> _CAPTURED_SHIFT & 0b111
+    return Move(
+        cell_index.coordinate(value & _CELL_MASK),
+        cell_index.coordinate(value >> _CELL_BITS & _CELL_MASK),
+        None if captured == 0 else PieceType(captured - 1),
+        value >> _PROMOTION_SHIFT & 1 == 1
+    )
@@ -0,0 +1,207 @@
+"""
+move_generator.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state import BoardState
+from src.board.direction_iterator import DirectionDelta
+from src.board.direction_utils import knight_direction_deltas, pawn_capture_direction_deltas, pawn_move_direction_deltas
+from src.board.ray_table import RayTable, get_ray_table
+from src.pieces.move import Move
+from src.pieces.move_utils import is_promotion_location
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+
+
+StepTable = Dict[BoardCoordinate, Tuple[BoardCoordinate, ...]]
+
+
+class MoveTables:
+    """This class holds everything about how the pieces move that only depends on the dimension of the board: the rays
+    for the sliding pieces, the cells a king, knight or pawn can step to from each cell, and the promotion hexes of each
+    player. Use get_move_tables() to get a shared instance.
+    """
+
+    def __init__(self, board: Board) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        board: Board
+            The board to build the tables for.
+        """
+        self._ray_table: RayTable = get_ray_table(board.dimension)
+        canonical: Dict[BoardCoordinate, BoardCoordinate] = {coord: coord for coord in board.coordinates}
+
+        def step_table(deltas: List[DirectionDelta]) -> StepTable:
+            table: StepTable = dict()
+            for coord in board.coordinates:
+                targets = []
+                for delta in deltas:
+                    target = canonical.get(BoardCoordinate(coord.q + delta.q, coord.r + delta.r))
+                    if target is not None:
+                        targets.append(target)
+                table[coord] = tuple(targets)
+            return table
+
+        # The king moves one step along each of the rays.
+        self._king: StepTable = {
+            coord: tuple(ray[0] for ray in self._ray_table.rays(coord) if ray) for coord in board.coordinates
+        }
+        self._knight: StepTable = step_table(knight_direction_deltas())
+        self._pawn_moves: Tuple[StepTable, ...] = tuple(
+            step_table(pawn_move_direction_deltas(player)) for player in Player)
+        self._pawn_captures: Tuple[StepTable, ...] = tuple(
+            step_table(pawn_capture_direction_deltas(player)) for player in Player)
+
+        empty_state = BoardState(board, dict(), dict())
+        self._promotion: Tuple[FrozenSet[BoardCoordinate], ...] = tuple(
+            frozenset(coord for coord in board.coordinates if is_promotion_location(player, coord, empty_state))
+            for player in Player)
+
+    @property
+    def ray_table(self) -> RayTable:
+        return self._ray_table
+
+    @property
+    def king(self) -> StepTable:
+        return self._king
+
+    @property
+    def knight(self) -> StepTable:
+        return self._knight
+
+    @property
+    def pawn_moves(self) -> Tuple[StepTable, ...]:
+        """The pawn move steps from each cell, indexed by player value."""
+        return self._pawn_moves
+
+    @property
+    def pawn_captures(self) -> Tuple[StepTable, ...]:
+        """The pawn capture steps from each cell, indexed by player value."""
+        return self._pawn_captures
+
+    @property
+    def promotion(self) -> Tuple[FrozenSet[BoardCoordinate], ...]:
+        """The promotion hexes, indexed by player value."""
+        return self._promotion
+
+
+@lru_cache(maxsize=None)
+def get_move_tables(dimension: int) -> MoveTables:
+    """Returns the MoveTables for a board of the given dimension. They are built the first time they are requested and
+    shared by every caller after that.
+
+    Parameters
+    ----------
+    dimension: int
+        The dimension of the board, ie the number of hexes on a side.
+    """
+    return MoveTables(Board(dimension))
+
+
+def generate_moves(
+    board_state: BoardState,
+    player: Player
+) -> List[Move]:
+    """Returns all of the pseudo-legal moves of the given player in one pass over their pieces. These are the same moves
+    the Piece classes return from Piece.moves(), but generated straight from the precomputed MoveTables without creating
+    a Piece for each piece on the board. Like Piece.moves() this does not take into account the game rules like putting
+    your own king in check.
+
+    Parameters
+    ----------
+    board_state: BoardState
+        The state of the board.
+
+    player: Player
+        The player to generate the moves for.
+
+    Returns
+    -------
+    List[Move]
+        The moves of the player. Captures record the type of the captured piece, and pawn moves onto a promotion hex
+        are flagged.
+    """
+    tables = get_move_tables(board_state.board.dimension)
+    piece_map = board_state.piece_map
+    moves: List[Move] = []
+    for coord in board_state.player_coordinates(player):
+        _append_piece_moves(tables, board_state, coord, piece_map[coord].piece_type, player, moves)
+    return moves
+
+
+def generate_piece_moves(
+    board_state: BoardState,
+    coord: BoardCoordinate
+) -> List[Move]:
+    """Returns the pseudo-legal moves of the piece on the given hex, the same moves generate_moves() returns for it.
+    This is much cheaper than generating the moves of every piece when only one of them is needed.
+
+    Parameters
+    ----------
+    board_state: BoardState
+        The state of the board.
+
+    coord: BoardCoordinate
+        The hex of the piece. There are no moves if the hex is empty.
+    """
+    moves: List[Move] = []
+    piece_info = board_state.get_piece_info(coord)
+    if piece_info is not None:
+        tables = get_move_tables(board_state.board.dimension)
+        _append_piece_moves(tables, board_state, coord, piece_info.piece_type, piece_info.player, moves)
+    return moves
+
+
+def _append_piece_moves(
+    tables: MoveTables,
+    board_state: BoardState,
+    coord: BoardCoordinate,
+    piece_type: PieceType,
+    player: Player,
+    moves: List[Move]
+) -> None:
+    """Appends the moves of the given player's piece on the given hex to the list of moves."""
+    get_piece_info = board_state.get_piece_info
+
+    if piece_type == PieceType.PAWN:
+        promotion = tables.promotion[player.value]
+        for target in tables.pawn_moves[player.value][coord]:
+            if get_piece_info(target) is None:
+                moves.append(Move(coord, target, None, target in promotion))
+        for target in tables.pawn_captures[player.value][coord]:
+            target_info = get_piece_info(target)
+            if target_info is not None and target_info.player != player:
+                moves.append(Move(coord, target, target_info.piece_type, target in promotion))
+        return
+
+    if piece_type == PieceType.KING or piece_type == PieceType.KNIGHT:
+        steps = tables.king[coord] if piece_type == PieceType.KING else tables.knight[coord]
+        for target in steps:
+            target_info = get_piece_info(target)
+            if target_info is None:
+                moves.append(Move(coord, target))
+            elif target_info.player != player:
+                moves.append(Move(coord, target, target_info.piece_type))
+        return
+
+    if piece_type == PieceType.ROOK:
+        rays = tables.ray_table.orthogonal_rays(coord)
+    elif piece_type == PieceType.BISHOP:
+        rays = tables.ray_table.diagonal_rays(coord)
+    else:
+        rays = tables.ray_table.rays(coord)
+    for ray in rays:
+        for target in ray:
+            target_info = get_piece_info(target)
+            if target_info is None:
+                moves.append(Move(coord, target))
+                continue
+            if target_info.player != player:
+                moves.append(Move(coord, target, target_info.piece_type))
+            break
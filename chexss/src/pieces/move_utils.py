@@ -3,9 +3,11 @@ move_utils.py
 Copyright © 2023 Derek Seiple
 Licensed under Creative Commons BY-NC-SA 3.0. See license file.
 """
+from typing import Iterable, Set
 from src.pieces.player import Player
 from src.board.board_coordinate import BoardCoordinate
 from src.board.board_state import BoardState
+from src.board.ray_table import Ray
 
 
 def is_valid_move_location(player: Player, coord: BoardCoordinate, board_sate: BoardState) -> bool:
@@ -46,3 +48,33 @@ def location_is_occupied(coord: BoardCoordinate, board_sate: BoardState) -> bool
     """This is a utility function that checks if the given coordinate is occupied by a piece."""
     piece_info = board_sate.get_piece_info(coord)
     return piece_info is not None
+
+
+def sliding_moves(player: Player, rays: Iterable[Ray], board_sate: BoardState) -> Set[BoardCoordinate]:
+    """This is a utility function for pieces that slide along rays, like the rook, bishop and queen. Each ray is scanned
+    from the piece outwards (see RayTable), adding every empty coordinate, and stopping at the first occupied
+    coordinate. That coordinate is included only if it contains a piece of another player."""
+    moves = set()
+    for ray in rays:
+        for coord in ray:
+            piece_info = board_sate.get_piece_info(coord)
+            if piece_info is None:
+                moves.add(coord)
+                continue
+            if piece_info.player != player:
+                moves.add(coord)
+            # The location is occupied, so we can't move past it.
+            break
+    return moves
+
+
+def is_promotion_location(player: Player, coord: BoardCoordinate, board_sate: BoardState) -> bool:
+    """This is a utility function that checks if the given coordinate is a hex where a pawn of the given player can be
+    promoted. The promotion hexes are the base rows of the two other players. White's base row is where r is largest,
+    silver's is where q is largest and black's is where s is largest."""
+    edge = board_sate.board.dimension - 1
+    return (
+        (player != Player.WHITE and coord.r == edge) or
+        (player != Player.SILVER and coord.q == edge) or
+        (player != Player.BLACK and coord.s == edge)
+    )
@@ -4,7 +4,7 @@ Copyright © 2023 Derek Seiple
 Licensed under Creative Commons BY-NC-SA 3.0. See license file.
 """
 from PIL import Image
-from typing import Set, List
+from typing import Set
 from src.board.board_state import BoardState
 from src.board.board_coordinate import BoardCoordinate
 from src.pieces.piece import Piece
@@ -12,8 +12,8 @@ from src.pieces.piece_color import PieceColor
 from src.board.hex_meta import HexMeta
 from src.pieces.pawn_image import PawnImage
 from src.pieces.piece_type import PieceType
-from src.pieces.player import Player
-from src.board.direction_iterator import DirectionDelta, DirectionIterator
+from src.board.direction_iterator import DirectionIterator
+from src.board.direction_utils import pawn_move_direction_deltas, pawn_capture_direction_deltas
 from src.pieces.move_utils import is_valid_capture_location, location_is_occupied
 
 
@@ -44,7 +44,7 @@ class Pawn(Piece):
 
         # the "forward" direction deltas depend on the player
         moves = set()
-        move_directions = self.__move_direction_deltas(player)
+        move_directions = pawn_move_direction_deltas(player)
         for direction in move_directions:
             it = DirectionIterator(coord, direction)
             for _ in range(1):
@@ -56,7 +56,7 @@ class Pawn(Piece):
                 ):
                     moves.add(next_coord)
         # the "capture" direction deltas likewise depend on the player
-        capture_directions = self.__capture_direction_deltas(player)
+        capture_directions = pawn_capture_direction_deltas(player)
         for direction in capture_directions:
             it = DirectionIterator(coord, direction)
             for _ in range(1):
@@ -66,50 +66,3 @@ class Pawn(Piece):
                     moves.add(next_coord)
 
         return moves
-
-    def __move_direction_deltas(
-        self,
-        player: Player
-    ) -> List[DirectionDelta]:
-        if player == Player.WHITE:
-            return [
-                DirectionDelta(0, -1),
-                DirectionDelta(1, -1)
-            ]
-        elif player == Player.SILVER:
-            return [
-                DirectionDelta(-1, 1),
-                DirectionDelta(-1, 0)
-            ]
-        elif player == Player.BLACK:
-            return [
-                DirectionDelta(1, 0),
-                DirectionDelta(0, 1)
-            ]
-        else:
-            raise Exception("Invalid player.")
-
-    def __capture_direction_deltas(
-        self,
-        player: Player
-    ) -> List[DirectionDelta]:
-        if player == Player.WHITE:
-            return [
-                DirectionDelta(-1, -1),
-                DirectionDelta(1, -2),
-                DirectionDelta(2, -1)
-            ]
-        elif player == Player.SILVER:
-            return [
-                DirectionDelta(-1, 2),
-                DirectionDelta(-2, 1),
-                DirectionDelta(-1, -1)
-            ]
-        elif player == Player.BLACK:
-            return [
-                DirectionDelta(2, -1),
-                DirectionDelta(1, 1),
-                DirectionDelta(-1, 2)
-            ]
-        else:
-            raise Exception("Invalid player.")
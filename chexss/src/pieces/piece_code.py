@@ -0,0 +1,62 @@
+"""
+piece_code.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+from typing import List, Optional
+from src.pieces.piece_info import PieceInfo
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+
+
+# A piece is encoded in a single small integer. The low three bits hold the piece type plus one, and the next two bits
+# hold the player, so a code of zero always means an empty cell and every code fits in a byte.
+EMPTY_CODE = 0
+PIECE_TYPE_MASK = 0b111
+PLAYER_SHIFT = 3
+MAX_CODE = (len(Player) << PLAYER_SHIFT) | PIECE_TYPE_MASK
+
+
+def encode_piece(player: Player, piece_type: PieceType) -> int:
+    """Returns the code for a piece of the given type belonging to the given player.
+
+    Parameters
+    ----------
+    player: Player
+        The player the piece belongs to.
+
+    piece_type: PieceType
+        The type of the piece.
+    """
+    return (player.value << PLAYER_SHIFT) | (piece_type.value + 1)
+
+
+def encode_piece_info(piece_info: PieceInfo) -> int:
+    """Returns the code for the given piece info."""
+    return encode_piece(piece_info.player, piece_info.piece_type)
+
+
+def _build_decode_table() -> List[Optional[PieceInfo]]:
+    table: List[Optional[PieceInfo]] = [None] * (MAX_CODE + 1)
+    for player in Player:
+        for piece_type in PieceType:
+            table[encode_piece(player, piece_type)] = PieceInfo(player, piece_type)
+    return table
+
+
+# Decoding is a list lookup that hands out shared PieceInfo objects, so no allocation happens on the hot path.
+_DECODE_TABLE = _build_decode_table()
+
+
+def decode_piece(code: int) -> Optional[PieceInfo]:
+    """Returns the piece info for the given code, or None if the code is for an empty cell.
+
+    Parameters
+    ----------
+    code: int
+        The code of the piece, as returned by encode_piece.
+    """
+    piece_info = _DECODE_TABLE[code] if 0 <= code <= MAX_CODE else None
+    if piece_info is None and code != EMPTY_CODE:
+        raise ValueError("Invalid piece code: {}".format(code))
+    return piece_info
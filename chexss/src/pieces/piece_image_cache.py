@@ -0,0 +1,62 @@
+"""
+piece_image_cache.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+from functools import lru_cache
+from PIL import Image
+from typing import Tuple
+from src.board.hex_meta import HexMeta
+from src.pieces.piece_color import PieceColor
+from src.pieces.piece_type import PieceType
+from src.pieces.piece_utils import get_piece_from_type
+from src.utils.rgb_color import RgbColor
+
+
+# The pixels of a rendered piece along with its mode and size, which is what the cache keeps.
+_RenderedPiece = Tuple[str, Tuple[int, int], bytes]
+
+
+def get_piece_image(
+    piece_type: PieceType,
+    color: PieceColor,
+    meta: HexMeta
+) -> Image.Image:
+    """Returns the image of the given piece sized to fit a hex of the given size. Rendering a piece runs its SVG through
+    cairosvg, so each combination of piece type, colors and hex width is only rendered once per process and its pixels
+    are shared by every caller after that. Each call returns a new read-only image over the shared pixels: pasting it
+    onto a diagram does not copy them, while pasting or drawing onto it makes Pillow give that image its own copy
+    first, so a caller can never change the piece that later callers get.
+
+    Parameters
+    ----------
+    piece_type: PieceType
+        The type of piece.
+
+    color: PieceColor
+        The colors to draw the piece in.
+
+    meta: HexMeta
+        The size of the hex the piece is drawn on. Only the width matters since the rest of the HexMeta follows from it.
+    """
+    mode, size, pixels = _render_piece_image(piece_type, color.main_color.rgb, color.accent_color.rgb, meta.width)
+    # An image made over a buffer with these arguments is marked read-only and copied by Pillow before it is changed.
+    return Image.frombuffer(mode, size, pixels, "raw", mode, 0, 1)
+
+
+def clear_piece_image_cache() -> None:
+    """Throw away every rendered piece image."""
+    _render_piece_image.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _render_piece_image(
+    piece_type: PieceType,
+    main_color: Tuple[int, int, int],
+    accent_color: Tuple[int, int, int],
+    width: int
+) -> _RenderedPiece:
+    """Renders the piece image for get_piece_image(). The colors are passed as rgb tuples so they can be cache keys."""
+    color = PieceColor(RgbColor(*main_color), RgbColor(*accent_color))
+    image: Image.Image = get_piece_from_type(piece_type).image(HexMeta(width), color)
+    return image.mode, image.size, image.tobytes()
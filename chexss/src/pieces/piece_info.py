@@ -17,6 +17,14 @@ class PieceInfo:
         self._player = player
         self._piece_type = piece_type
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PieceInfo):
+            return False
+        return self._player == other._player and self._piece_type == other._piece_type
+
+    def __hash__(self) -> int:
+        return hash((self._player, self._piece_type))
+
     @property
     def player(self) -> Player:
         return self._player
@@ -10,3 +10,18 @@ class Player(Enum):
     WHITE = 0
     SILVER = 1
     BLACK = 2
+
+
+# The turn order is white, then silver, then black.
+_NEXT_PLAYERS = (Player.SILVER, Player.BLACK, Player.WHITE)
+_PREVIOUS_PLAYERS = (Player.BLACK, Player.WHITE, Player.SILVER)
+
+
+def next_player(player: Player) -> Player:
+    """Returns the player who moves after the given player."""
+    return _NEXT_PLAYERS[player.value]
+
+
+def previous_player(player: Player) -> Player:
+    """Returns the player who moves before the given player."""
+    return _PREVIOUS_PLAYERS[player.value]
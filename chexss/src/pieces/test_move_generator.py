@@ -0,0 +1,80 @@
+"""
+test_move_generator.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import unittest
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state import BoardState, BoardStateBuilder
+from src.board.board_state_utils import generate_initial_board_state
+from src.pieces.move import Move
+from src.pieces.move_generator import generate_moves, generate_piece_moves
+from src.pieces.piece_type import PieceType
+from src.pieces.piece_utils import get_piece_from_type
+from src.pieces.player import Player
+
+
+class TestMoveGenerator(unittest.TestCase):
+
+    def _assert_matches_pieces(self, board_state: BoardState):
+        """Check the generated moves against the moves returned by each of the Piece classes."""
+        for player in Player:
+            expected = set()
+            for coord, piece_info in board_state.piece_map.items():
+                if piece_info.player == player:
+                    piece = get_piece_from_type(piece_info.piece_type)
+                    expected |= {(coord, target) for target in piece.moves(coord, board_state)}
+
+            moves = generate_moves(board_state, player)
+            self.assertEqual(len(moves), len(expected))
+            self.assertEqual({(move.from_coord, move.to_coord) for move in moves}, expected)
+            for move in moves:
+                target_info = board_state.get_piece_info(move.to_coord)
+                self.assertEqual(move.captured, None if target_info is None else target_info.piece_type)
+
+    def test_initial_position(self):
+        """We test that the generated moves in the initial position match the Piece classes."""
+        self._assert_matches_pieces(generate_initial_board_state())
+
+    def test_position_with_captures(self):
+        """We test a position where every kind of piece has captures available."""
+        board_state = (
+            BoardStateBuilder(Board(7))
+            .add_piece(Player.WHITE, BoardCoordinate(0, 0), PieceType.QUEEN)
+            .add_piece(Player.WHITE, BoardCoordinate(1, 1), PieceType.KING)
+            .add_piece(Player.WHITE, BoardCoordinate(-2, 1), PieceType.KNIGHT)
+            .add_piece(Player.WHITE, BoardCoordinate(-1, 0), PieceType.PAWN)
+            .add_piece(Player.SILVER, BoardCoordinate(0, -3), PieceType.ROOK)
+            .add_piece(Player.SILVER, BoardCoordinate(-2, -1), PieceType.BISHOP)
+            .add_piece(Player.SILVER, BoardCoordinate(2, -1), PieceType.PAWN)
+            .add_piece(Player.BLACK, BoardCoordinate(-1, 2), PieceType.KNIGHT)
+            .add_piece(Player.BLACK, BoardCoordinate(3, -3), PieceType.BISHOP)
+            .add_piece(Player.BLACK, BoardCoordinate(1, -2), PieceType.PAWN)
+            .build())
+        self._assert_matches_pieces(board_state)
+
+    def test_promotion_is_flagged(self):
+        """We test that pawn moves onto the base row of another player are flagged as promotions."""
+        board_state = (
+            BoardStateBuilder(Board(7))
+            .add_piece(Player.WHITE, BoardCoordinate(5, -2), PieceType.PAWN)
+            .add_piece(Player.BLACK, BoardCoordinate(6, -4), PieceType.KNIGHT)
+            .build())
+
+        moves = set(generate_moves(board_state, Player.WHITE))
+        self.assertEqual(moves, {
+            Move(BoardCoordinate(5, -2), BoardCoordinate(5, -3), None, False),
+            Move(BoardCoordinate(5, -2), BoardCoordinate(6, -3), None, True),
+            Move(BoardCoordinate(5, -2), BoardCoordinate(6, -4), PieceType.KNIGHT, True),
+        })
+
+    def test_piece_moves(self):
+        """We test that the moves of a single piece are the moves generated for that piece in the whole position."""
+        board_state = generate_initial_board_state()
+        for player in Player:
+            moves = generate_moves(board_state, player)
+            for coord in board_state.player_coordinates(player):
+                self.assertEqual(
+                    generate_piece_moves(board_state, coord), [move for move in moves if move.from_coord == coord])
+        self.assertEqual(generate_piece_moves(board_state, BoardCoordinate(0, 0)), [])
@@ -0,0 +1,47 @@
+"""
+test_piece_image_cache.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import unittest
+from PIL import ImageDraw
+from src.board.board_coordinate import BoardCoordinate
+from src.board.hex_meta import HexMeta
+from src.diagram.piece_image_factory import PieceImageFactory
+from src.pieces.piece_color import PieceColor
+from src.pieces.piece_info import PieceInfo
+from src.pieces.piece_image_cache import _render_piece_image, clear_piece_image_cache, get_piece_image
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+
+
+class TestPieceImageCache(unittest.TestCase):
+
+    def test_images_are_shared(self):
+        """We test that a piece is rendered once for each type, color and size and then shared."""
+        clear_piece_image_cache()
+        meta = HexMeta(50)
+        image = get_piece_image(PieceType.ROOK, PieceColor.White(), meta)
+        self.assertEqual(image.size, (meta.width, meta.height))
+        self.assertEqual(get_piece_image(PieceType.ROOK, PieceColor.White(), HexMeta(50)).tobytes(), image.tobytes())
+        self.assertEqual(_render_piece_image.cache_info().misses, 1)
+        get_piece_image(PieceType.ROOK, PieceColor.Black(), meta)
+        get_piece_image(PieceType.KNIGHT, PieceColor.White(), meta)
+        self.assertEqual(_render_piece_image.cache_info().misses, 3)
+        larger = HexMeta(80)
+        self.assertEqual(get_piece_image(PieceType.ROOK, PieceColor.White(), larger).size, (80, larger.height))
+
+    def test_images_can_not_be_changed(self):
+        """We test that drawing on a returned image does not change the image returned to the next caller."""
+        meta = HexMeta(50)
+        image = get_piece_image(PieceType.ROOK, PieceColor.White(), meta)
+        original = image.tobytes()
+        ImageDraw.Draw(image).rectangle((0, 0, 20, 20), fill=(255, 0, 0, 255))
+        self.assertNotEqual(image.tobytes(), original)
+        self.assertEqual(get_piece_image(PieceType.ROOK, PieceColor.White(), meta).tobytes(), original)
+
+        factory = PieceImageFactory(PieceInfo(Player.WHITE, PieceType.ROOK))
+        pasted = factory(4, BoardCoordinate(0, 0), meta)
+        pasted.paste((0, 0, 255, 255), (0, 0, 10, 10))
+        pasted.putpixel((30, 30), (0, 255, 0, 255))
+        self.assertEqual(factory(4, BoardCoordinate(0, 0), meta).tobytes(), original)
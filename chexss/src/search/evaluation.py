@@ -0,0 +1,177 @@
+"""
+evaluation.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+from abc import abstractmethod
+from functools import lru_cache
+from typing import Dict, List, Tuple
+from src.board.cell_index import get_cell_index
+from src.board.symmetry import rotate
+from src.game.game_state import GameState, GameUndo
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+from src.search.transposition_table import Scores
+
+
+PIECE_VALUES: Dict[PieceType, int] = {
+    PieceType.KING: 0,
+    PieceType.QUEEN: 900,
+    PieceType.ROOK: 500,
+    PieceType.BISHOP: 330,
+    PieceType.KNIGHT: 320,
+    PieceType.PAWN: 100,
+}
+
+# The piece-square bonuses are worked out from where a hex is as seen from white's side of the board, in two measures:
+# how far it is from the edge of the board towards the center, and how far it is from white's base row towards the
+# far side. These are the points per step of each of them.
+CENTER_WEIGHTS: Dict[PieceType, int] = {
+    PieceType.KING: -6,
+    PieceType.QUEEN: 3,
+    PieceType.ROOK: 2,
+    PieceType.BISHOP: 5,
+    PieceType.KNIGHT: 8,
+    PieceType.PAWN: 2,
+}
+ADVANCE_WEIGHTS: Dict[PieceType, int] = {
+    PieceType.KING: -4,
+    PieceType.QUEEN: 0,
+    PieceType.ROOK: 0,
+    PieceType.BISHOP: 0,
+    PieceType.KNIGHT: 0,
+    PieceType.PAWN: 8,
+}
+
+# The value of a piece of each type on each hex, indexed by player value, piece type value and cell index.
+PieceSquareTables = Tuple[Tuple[Tuple[int, ...], ...], ...]
+
+
+@lru_cache(maxsize=None)
+def get_piece_square_tables(dimension: int) -> PieceSquareTables:
+    """Returns the value of every piece on every hex of a board of the given dimension, which is its value in
+    PIECE_VALUES plus its piece-square bonus. The bonus is the same for every player, turned to their side of the
+    board.
+
+    Parameters
+    ----------
+    dimension: int
+        The dimension of the board.
+    """
+    cell_index = get_cell_index(dimension)
+    edge = dimension - 1
+    tables = []
+    for player in Player:
+        player_tables = []
+        for piece_type in PieceType:
+            values = []
+            for coord in cell_index.coordinates:
+                # Turn the hex back from the player's side of the board to white's.
+                white = rotate(coord, -player.value)
+                center = edge - max(abs(white.q), abs(white.r), abs(white.s))
+                advance = edge - white.r
+                values.append(
+                    PIECE_VALUES[piece_type] +
+                    CENTER_WEIGHTS[piece_type] * center +
+                    ADVANCE_WEIGHTS[piece_type] * advance)
+            player_tables.append(tuple(values))
+        tables.append(tuple(player_tables))
+    return tuple(tables)
+
+
+class Evaluator:
+    """This class is an abstract base class for the static evaluation used by the search. An evaluator scores a position
+    for every player, indexed by player value. The scores of a position always add up to zero, so one player can only
+    gain at the expense of the others.
+
+    The search calls reset() with the position it starts from and then move_made() and move_unmade() around every move
+    it makes, so an evaluator can keep running totals up to date rather than looking at the whole board every time it
+    is called. An evaluator that looks at the whole board can ignore them.
+    """
+
+    def reset(self, game_state: GameState) -> None:
+        """Called with the position a search starts from."""
+        pass
+
+    def move_made(self, game_state: GameState, undo: GameUndo) -> None:
+        """Called after the search makes a move, with the record of the move."""
+        pass
+
+    def move_unmade(self, game_state: GameState, undo: GameUndo) -> None:
+        """Called after the search takes back a move, with the record of the move."""
+        pass
+
+    @abstractmethod
+    def __call__(self, game_state: GameState) -> Scores:
+        """Return the score of the position for each player, indexed by player value."""
+        raise NotImplementedError
+
+
+class MaterialEvaluator(Evaluator):
+    """Scores a position by the value of the pieces each player has, compared to the value of all of the pieces on the
+    board."""
+
+    def __call__(self, game_state: GameState) -> Scores:
+        material = [0] * len(Player)
+        for piece_info in game_state.board_state.piece_map.values():
+            material[piece_info.player.value] += PIECE_VALUES[piece_info.piece_type]
+        total = sum(material)
+        return tuple(len(Player) * value - total for value in material)
+
+
+class PieceSquareEvaluator(Evaluator):
+    """Scores a position by the value of the pieces each player has and the hexes they are on, compared to the total
+    of all of the pieces on the board. The value of every piece on every hex comes from get_piece_square_tables().
+
+    The total of each player is worked out once in reset() and then kept up to date as moves are made and taken back,
+    which only has to look at the hexes the move is from and to, so calling the evaluator is just a sum of three
+    numbers however many pieces there are.
+    """
+
+    def __init__(self) -> None:
+        self._totals: List[int] = [0] * len(Player)
+        # The changes move_made() made to the totals, so move_unmade() can take them back.
+        self._changes: List[Tuple[int, int, int, int]] = []
+
+    def reset(self, game_state: GameState) -> None:
+        board_state = game_state.board_state
+        tables = get_piece_square_tables(board_state.board.dimension)
+        index = get_cell_index(board_state.board.dimension).index
+        self._totals = [0] * len(Player)
+        self._changes = []
+        for coord, piece_info in board_state.piece_map.items():
+            player = piece_info.player.value
+            self._totals[player] += tables[player][piece_info.piece_type.value][index(coord)]
+
+    def move_made(self, game_state: GameState, undo: GameUndo) -> None:
+        board_state = game_state.board_state
+        move_undo = undo.move_undo
+        move = move_undo.move
+        moved = move_undo.moved
+        captured = move_undo.captured
+        tables = get_piece_square_tables(board_state.board.dimension)
+        index = get_cell_index(board_state.board.dimension).index
+        to_index = index(move.to_coord)
+        # The piece on the to hex differs from the piece that moved if a pawn was promoted.
+        promoted = board_state.piece_map[move.to_coord].piece_type
+        mover = moved.player.value
+        from_value = tables[mover][moved.piece_type.value][index(move.from_coord)]
+        mover_change = tables[mover][promoted.value][to_index] - from_value
+        captured_player = 0
+        captured_change = 0
+        if captured is not None:
+            captured_player = captured.player.value
+            captured_change = -tables[captured_player][captured.piece_type.value][to_index]
+        self._totals[mover] += mover_change
+        self._totals[captured_player] += captured_change
+        self._changes.append((mover, mover_change, captured_player, captured_change))
+
+    def move_unmade(self, game_state: GameState, undo: GameUndo) -> None:
+        mover, mover_change, captured_player, captured_change = self._changes.pop()
+        self._totals[mover] -= mover_change
+        self._totals[captured_player] -= captured_change
+
+    def __call__(self, game_state: GameState) -> Scores:
+        totals = self._totals
+        total = sum(totals)
+        return tuple(len(Player) * value - total for value in totals)
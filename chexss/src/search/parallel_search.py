@@ -0,0 +1,112 @@
+"""
+parallel_search.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+from src.board.board_state_codec import decode_board_state, encode_board_state
+from src.board.cell_index import get_cell_index
+from src.game.game_state import GameState
+from src.pieces.move import Move, pack_move, unpack_move
+from src.search.evaluation import PIECE_VALUES, Evaluator
+from src.search.search import SearchAlgorithm, Searcher, SearchResult
+from src.search.transposition_table import Scores
+
+
+# A search sent to a worker process: the position encoded with encode_board_state(), the root moves the worker searches
+# packed with pack_move(), the algorithm value, the maximum depth and the time limit. This is a few hundred bytes, much
+# less than a pickled BoardState with its dictionaries of coordinates.
+_Job = Tuple[bytes, Tuple[int, ...], int, int, Optional[float]]
+
+# What a worker sends back: the best packed move and its scores for every depth it finished, and the nodes it searched.
+_JobResult = Tuple[Tuple[Tuple[int, Scores], ...], int]
+
+
+def parallel_search(
+    game_state: GameState,
+    max_depth: int,
+    time_limit: Optional[float] = None,
+    algorithm: SearchAlgorithm = SearchAlgorithm.PARANOID,
+    evaluator: Optional[Evaluator] = None,
+    max_workers: Optional[int] = None
+) -> SearchResult:
+    """Searches for the best move of the player to move like Searcher.search(), but splits the moves of the player to
+    move between a pool of worker processes. Each worker runs its own iterative deepening search over its share of the
+    moves, and the best move is picked from the deepest search that every worker finished, so the workers only need
+    to send back a few numbers per depth.
+
+    Captures are spread evenly across the workers so no worker gets all of the moves that take long to search.
+
+    Parameters
+    ----------
+    game_state: GameState
+        The position to search. It is not changed.
+
+    max_depth: int
+        The maximum number of plies to look ahead, between 1 and 127.
+
+    time_limit: Optional[float]
+        The maximum time each worker searches for in seconds. The search to depth 1 is always finished.
+
+    algorithm: SearchAlgorithm
+        How the search treats the other two players.
+
+    evaluator: Optional[Evaluator]
+        The static evaluation of the positions at the end of the search. It is pickled and sent to every worker.
+        Defaults to PieceSquareEvaluator.
+
+    max_workers: Optional[int]
+        The number of worker processes. If None, one per CPU is used. If 0 all of the moves are searched in this
+        process.
+    """
+    start = time.perf_counter()
+    moves = game_state.legal_moves()
+    if not moves:
+        return Searcher(algorithm, evaluator).search(game_state, max_depth)
+
+    cell_index = game_state.attack_map.bitboards.masks.cell_index
+    moves.sort(key=lambda move: -1 if move.captured is None else PIECE_VALUES[move.captured], reverse=True)
+    workers = max_workers if max_workers is not None else os.cpu_count() or 1
+    count = max(1, min(workers, len(moves)))
+    data = encode_board_state(game_state.board_state)
+    jobs = [
+        (data, tuple(pack_move(move, cell_index) for move in moves[i::count]), algorithm.value, max_depth, time_limit)
+        for i in range(count)
+    ]
+    if max_workers == 0:
+        results = [_search_job(job, evaluator) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=count) as executor:
+            results = list(executor.map(_search_job, jobs, [evaluator] * count))
+
+    mover = game_state.side_to_move.value
+    depth = min(len(iterations) for iterations, _ in results)
+    # Every worker finishes depth 1, so every worker has a best move.
+    best_move, best_scores = results[0][0][depth - 1]
+    for iterations, _ in results[1:]:
+        packed, scores = iterations[depth - 1]
+        if scores[mover] > best_scores[mover]:
+            best_move = packed
+            best_scores = scores
+    return SearchResult(
+        unpack_move(best_move, cell_index),
+        best_scores,
+        depth,
+        sum(nodes for _, nodes in results),
+        time.perf_counter() - start
+    )
+
+
+def _search_job(job: _Job, evaluator: Optional[Evaluator]) -> _JobResult:
+    """Search the root moves of a single job and return the result of each finished depth."""
+    data, packed_moves, algorithm, max_depth, time_limit = job
+    board_state = decode_board_state(data)
+    cell_index = get_cell_index(board_state.board.dimension)
+    moves: List[Move] = [unpack_move(packed, cell_index) for packed in packed_moves]
+    result = Searcher(SearchAlgorithm(algorithm), evaluator).search(
+        GameState(board_state), max_depth, time_limit=time_limit, root_moves=moves)
+    iterations = tuple((pack_move(move, cell_index), scores) for move, scores in result.iterations)
+    return iterations, result.nodes
@@ -0,0 +1,126 @@
+"""
+perft.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import argparse
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from src.board.board_state import BoardState
+from src.board.board_state_utils import generate_initial_board_state
+from src.pieces.move import Move
+from src.pieces.move_generator import generate_moves
+from src.pieces.player import Player
+
+
+MoveGenerator = Callable[[BoardState, Player], List[Move]]
+
+# The number of leaf nodes reached from generate_initial_board_state() at each depth, with white, silver and black
+# taking turns. Any move generator must reproduce these counts.
+INITIAL_PERFT_COUNTS: Dict[int, int] = {
+    1: 22,
+    2: 484,
+    3: 10648,
+    4: 277486,
+}
+
+
+def perft(
+    board_state: BoardState,
+    depth: int,
+    move_generator: MoveGenerator = generate_moves
+) -> int:
+    """Counts the leaf nodes of the game tree from the given board state to the given depth. Each level of the tree is
+    the moves of the player to move in that position, so with white to move depth 3 is one move by each player.
+
+    The moves are the pseudo-legal moves of the move generator, and pawns that reach a promotion hex are left as pawns,
+    so the counts test the move generator rather than the rules of the game. The board state is changed in place while
+    counting, but is back to where it started when this returns.
+
+    Parameters
+    ----------
+    board_state: BoardState
+        The position to count from.
+
+    depth: int
+        The number of moves to look ahead.
+
+    move_generator: MoveGenerator
+        The function used to generate the moves of a player. This lets other move generators be checked against the
+        same counts.
+    """
+    if depth <= 0:
+        return 1
+    moves = move_generator(board_state, board_state.side_to_move)
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        undo = board_state.make_move(move)
+        nodes += perft(board_state, depth - 1, move_generator)
+        board_state.unmake_move(undo)
+    return nodes
+
+
+def perft_divide(
+    board_state: BoardState,
+    depth: int,
+    move_generator: MoveGenerator = generate_moves
+) -> Dict[Move, int]:
+    """Returns the perft count below each move of the player to move. When two move generators disagree this narrows
+    the difference down to a single move.
+
+    Parameters
+    ----------
+    board_state: BoardState
+        The position to count from.
+
+    depth: int
+        The number of moves to look ahead, including the first move.
+
+    move_generator: MoveGenerator
+        The function used to generate the moves of a player.
+    """
+    counts: Dict[Move, int] = dict()
+    for move in move_generator(board_state, board_state.side_to_move):
+        undo = board_state.make_move(move)
+        counts[move] = perft(board_state, depth - 1, move_generator)
+        board_state.unmake_move(undo)
+    return counts
+
+
+def timed_perft(
+    board_state: BoardState,
+    depth: int,
+    move_generator: MoveGenerator = generate_moves
+) -> Tuple[int, float]:
+    """Runs perft() and returns the node count along with the number of seconds it took."""
+    start = time.perf_counter()
+    nodes = perft(board_state, depth, move_generator)
+    return nodes, time.perf_counter() - start
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Runs perft from the initial position for each depth up to the given one and prints the node count and speed.
+    Returns a non-zero exit code if a count does not match INITIAL_PERFT_COUNTS.
+
+    Usage: python -m src.search.perft [--depth N]
+    """
+    parser = argparse.ArgumentParser(description="Count the leaf nodes of the game tree from the initial position.")
+    parser.add_argument("--depth", type=int, default=3, help="The deepest depth to count to.")
+    parsed = parser.parse_args(args)
+
+    failed = False
+    board_state = generate_initial_board_state()
+    for depth in range(1, parsed.depth + 1):
+        nodes, seconds = timed_perft(board_state, depth)
+        speed = nodes / seconds if seconds > 0 else 0.0
+        expected = INITIAL_PERFT_COUNTS.get(depth)
+        status = "" if expected is None else (" ok" if expected == nodes else " expected {}".format(expected))
+        failed = failed or (expected is not None and expected != nodes)
+        print("depth {:2d} {:>14,d} nodes {:8.3f}s {:>12,.0f} nodes/s{}".format(depth, nodes, seconds, speed, status))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,400 @@
+"""
+search.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import time
+from enum import Enum
+from typing import List, Optional, Tuple
+from src.board.cell_index import CellIndex
+from src.board.zobrist import ZOBRIST_SEED
+from src.game.game_state import GameState
+from src.pieces.move import NO_MOVE, Move, pack_move
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+from src.search.evaluation import PIECE_VALUES, Evaluator, PieceSquareEvaluator
+from src.search.transposition_table import Bound, Scores, TranspositionTable
+
+
+# The score of a win, less the number of plies it takes so that quicker wins score higher. The winner gets twice this
+# and the other two players lose this each, so the scores still add up to zero.
+WIN_SCORE = 100000
+
+# Scores beyond this are wins and losses rather than evaluations. The transposition table stores them counted from the
+# position they are stored for rather than from the root, so they are right when found at another ply or by a search
+# from another root.
+_WIN_THRESHOLD = WIN_SCORE // 2
+
+# How often, in nodes, the time limit is checked.
+_CHECK_INTERVAL = 1024
+
+# A paranoid search scores positions for the player at the root, so its results are stored under a key that is
+# different for each root player and can not be mistaken for the results of another search.
+_PARANOID_KEYS: Tuple[int, ...] = tuple(
+    (ZOBRIST_SEED * (player.value + 1) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF for player in Player)
+
+# The sort keys that put the best move from the transposition table first, then captures, then killer moves, and then
+# everything else by its history score.
+_TABLE_MOVE_ORDER = 1 << 40
+_CAPTURE_ORDER = 1 << 32
+_KILLER_ORDER = 1 << 31
+
+
+def _to_table(scores: Scores, ply: int) -> Scores:
+    """Returns the scores with the wins and losses counted from the position at the given ply rather than the root."""
+    return tuple(
+        score + 2 * ply if score > _WIN_THRESHOLD else score - ply if score < -_WIN_THRESHOLD else score
+        for score in scores)
+
+
+def _from_table(scores: Scores, ply: int) -> Scores:
+    """Returns the scores stored by _to_table() with the wins and losses counted from the root again."""
+    return tuple(
+        score - 2 * ply if score > _WIN_THRESHOLD else score + ply if score < -_WIN_THRESHOLD else score
+        for score in scores)
+
+
+class SearchAlgorithm(Enum):
+    """How the search treats the other two players.
+
+    MAX_N assumes every player picks the move that is best for them, and backs up the scores of all three players.
+    PARANOID assumes the other two players work together against the player to move at the root, which turns the
+    search into a two sided search that alpha-beta can prune.
+    """
+    MAX_N = 0
+    PARANOID = 1
+
+
+class SearchResult:
+    """The result of a call to Searcher.search()."""
+
+    __slots__ = ("_best_move", "_scores", "_depth", "_nodes", "_elapsed", "_iterations")
+
+    def __init__(
+        self,
+        best_move: Optional[Move],
+        scores: Scores,
+        depth: int,
+        nodes: int,
+        elapsed: float,
+        iterations: Tuple[Tuple[Move, Scores], ...] = ()
+    ) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        best_move: Optional[Move]
+            The best move found, or None if the player to move has no legal moves.
+
+        scores: Scores
+            The score of the best move for each player, indexed by player value.
+
+        depth: int
+            The depth of the deepest search that was finished.
+
+        nodes: int
+            The number of positions searched.
+
+        elapsed: float
+            The time the search took in seconds.
+
+        iterations: Tuple[Tuple[Move, Scores], ...]
+            The best move and its scores from each finished depth, starting with depth 1.
+        """
+        self._best_move = best_move
+        self._scores = scores
+        self._depth = depth
+        self._nodes = nodes
+        self._elapsed = elapsed
+        self._iterations = iterations
+
+    @property
+    def best_move(self) -> Optional[Move]:
+        return self._best_move
+
+    @property
+    def scores(self) -> Scores:
+        return self._scores
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def nodes(self) -> int:
+        return self._nodes
+
+    @property
+    def elapsed(self) -> float:
+        return self._elapsed
+
+    @property
+    def iterations(self) -> Tuple[Tuple[Move, Scores], ...]:
+        return self._iterations
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self._nodes / self._elapsed if self._elapsed > 0 else 0.0
+
+
+class _SearchAborted(Exception):
+    """Raised inside the search when the time or node limit is reached."""
+    pass
+
+
+class Searcher:
+    """This class searches the game tree of a GameState for the best move of the player to move, taking turns in the
+    white, silver, black order of Player. It searches to depth 1, then 2 and so on up to the maximum depth (iterative
+    deepening), so when the time or node limit is reached the result of the deepest finished search is returned, and
+    each search orders its moves using what the previous ones found.
+
+    Moves are searched in the order: the best move stored in the transposition table, captures of the most valuable
+    pieces, the killer moves that were best at the same ply elsewhere in the tree, and then the rest by how often they
+    have been best before (the history heuristic). The transposition table and history are kept between searches, so a
+    Searcher should be reused for the moves of a game.
+    """
+
+    def __init__(
+        self,
+        algorithm: SearchAlgorithm = SearchAlgorithm.PARANOID,
+        evaluator: Optional[Evaluator] = None,
+        table: Optional[TranspositionTable] = None
+    ) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        algorithm: SearchAlgorithm
+            How the search treats the other two players.
+
+        evaluator: Optional[Evaluator]
+            The static evaluation of the positions at the end of the search. Defaults to PieceSquareEvaluator.
+
+        table: Optional[TranspositionTable]
+            The transposition table to use. Defaults to a new 16MB table.
+        """
+        self._algorithm = algorithm
+        self._evaluator: Evaluator = evaluator if evaluator is not None else PieceSquareEvaluator()
+        self._table = table if table is not None else TranspositionTable()
+        self._history: List[int] = []
+        self._killers: List[List[Optional[Move]]] = []
+        self._nodes = 0
+        self._node_limit: Optional[int] = None
+        self._deadline: Optional[float] = None
+        self._root_player = Player.WHITE
+        self._root_move: Optional[Move] = None
+        self._root_moves: Optional[List[Move]] = None
+
+    @property
+    def algorithm(self) -> SearchAlgorithm:
+        return self._algorithm
+
+    @property
+    def table(self) -> TranspositionTable:
+        return self._table
+
+    @property
+    def nodes(self) -> int:
+        """The number of positions searched by the current or last search."""
+        return self._nodes
+
+    def search(
+        self,
+        game_state: GameState,
+        max_depth: int,
+        time_limit: Optional[float] = None,
+        node_limit: Optional[int] = None,
+        root_moves: Optional[List[Move]] = None
+    ) -> SearchResult:
+        """Search for the best move of the player to move. The game state is changed while searching, but is back to
+        where it started when this returns.
+
+        Parameters
+        ----------
+        game_state: GameState
+            The position to search.
+
+        max_depth: int
+            The maximum number of plies to look ahead, between 1 and 127.
+
+        time_limit: Optional[float]
+            The maximum time to search for in seconds. The search to depth 1 is always finished.
+
+        node_limit: Optional[int]
+            The maximum number of positions to search. The search to depth 1 is always finished.
+
+        root_moves: Optional[List[Move]]
+            If given, only these moves of the player to move are searched, which is how a search is split between
+            processes. They must be legal moves.
+        """
+        if not 0 < max_depth < 128:
+            raise ValueError("The depth of the search must be between 1 and 127 but got {}.".format(max_depth))
+        if root_moves is not None and not root_moves:
+            raise ValueError("There must be at least one root move to search.")
+        start = time.perf_counter()
+        size = game_state.attack_map.bitboards.masks.cell_index.size
+        if len(self._history) != len(Player) * size * size:
+            self._history = [0] * (len(Player) * size * size)
+        else:
+            # Keep what was learned, but let the moves of this search count for more.
+            self._history = [value // 2 for value in self._history]
+        self._killers = [[None, None] for _ in range(max_depth + 1)]
+        self._nodes = 0
+        self._root_player = game_state.side_to_move
+        self._root_moves = root_moves
+        self._evaluator.reset(game_state)
+
+        best_move: Optional[Move] = None
+        scores: Scores = self._evaluator(game_state)
+        depth = 0
+        iterations: List[Tuple[Move, Scores]] = []
+        for iteration in range(1, max_depth + 1):
+            # The limits only apply once there is a move to return.
+            self._deadline = None if time_limit is None or iteration == 1 else start + time_limit
+            self._node_limit = None if iteration == 1 else node_limit
+            self._root_move = None
+            try:
+                iteration_scores = self._search(game_state, iteration, 0, -WIN_SCORE * 4, WIN_SCORE * 4)
+            except _SearchAborted:
+                break
+            best_move = self._root_move
+            scores = iteration_scores
+            depth = iteration
+            if best_move is None:
+                # The player to move has no legal moves, so searching deeper will not change anything.
+                break
+            iterations.append((best_move, scores))
+            if time_limit is not None and time.perf_counter() - start >= time_limit:
+                break
+        return SearchResult(best_move, scores, depth, self._nodes, time.perf_counter() - start, tuple(iterations))
+
+    def _search(self, game_state: GameState, depth: int, ply: int, alpha: int, beta: int) -> Scores:
+        """Search the position to the given depth and return its scores. For a paranoid search the score of the root
+        player is kept within alpha and beta; a max^n search ignores them."""
+        self._nodes += 1
+        if self._nodes % _CHECK_INTERVAL == 0:
+            if self._node_limit is not None and self._nodes >= self._node_limit:
+                raise _SearchAborted()
+            if self._deadline is not None and time.perf_counter() >= self._deadline:
+                raise _SearchAborted()
+
+        paranoid = self._algorithm == SearchAlgorithm.PARANOID
+        root = self._root_player.value
+        key = game_state.board_state.zobrist_hash
+        if paranoid:
+            key ^= _PARANOID_KEYS[root]
+        entry = self._table.probe(key)
+        table_move = NO_MOVE if entry is None else entry.move
+        if entry is not None and ply > 0 and entry.depth >= depth:
+            table_scores = _from_table(entry.scores, ply)
+            value = table_scores[root]
+            if (
+                entry.bound == Bound.EXACT or
+                (entry.bound == Bound.LOWER and value >= beta) or
+                (entry.bound == Bound.UPPER and value <= alpha)
+            ):
+                return table_scores
+
+        if depth == 0:
+            return self._evaluator(game_state)
+        moves = game_state.legal_moves() if ply > 0 or self._root_moves is None else self._root_moves
+        if not moves:
+            return self._terminal_scores(game_state, ply)
+
+        player = game_state.side_to_move
+        mover = player.value
+        maximizing = not paranoid or player == self._root_player
+        original_alpha = alpha
+        original_beta = beta
+        cell_index = game_state.attack_map.bitboards.masks.cell_index
+        best_scores: Optional[Scores] = None
+        best_move = moves[0]
+        for move in self._order_moves(game_state, moves, ply, table_move):
+            # The search only looks at promotions to a queen, which is almost always the best choice.
+            undo = game_state.make_move(move, PieceType.QUEEN if move.promotion else None)
+            self._evaluator.move_made(game_state, undo)
+            try:
+                scores = self._search(game_state, depth - 1, ply + 1, alpha, beta)
+            finally:
+                game_state.unmake_move(undo)
+                self._evaluator.move_unmade(game_state, undo)
+
+            if paranoid:
+                value = scores[root]
+                if best_scores is None or (value > best_scores[root] if maximizing else value < best_scores[root]):
+                    best_scores = scores
+                    best_move = move
+                if maximizing:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    self._record_cutoff(move, mover, ply, depth, cell_index)
+                    break
+            elif best_scores is None or scores[mover] > best_scores[mover]:
+                best_scores = scores
+                best_move = move
+
+        if best_scores is None:
+            best_scores = self._evaluator(game_state)
+        if not paranoid:
+            self._record_cutoff(best_move, mover, ply, depth, cell_index)
+        if ply == 0:
+            self._root_move = best_move
+
+        bound = Bound.EXACT
+        if paranoid:
+            if best_scores[root] <= original_alpha:
+                bound = Bound.UPPER
+            elif best_scores[root] >= original_beta:
+                bound = Bound.LOWER
+        # The scores of a search over some of the root moves are not the scores of the position.
+        if ply > 0 or self._root_moves is None:
+            self._table.store(key, depth, _to_table(best_scores, ply), bound, pack_move(best_move, cell_index))
+        return best_scores
+
+    def _terminal_scores(self, game_state: GameState, ply: int) -> Scores:
+        """The scores of a position where the player to move has no legal moves. If they are checkmated the player who
+        mated them wins, otherwise nobody does."""
+        winner = game_state.mating_player()
+        if winner is None:
+            return (0,) * len(Player)
+        score = WIN_SCORE - ply
+        return tuple(2 * score if player == winner else -score for player in Player)
+
+    def _order_moves(self, game_state: GameState, moves: List[Move], ply: int, table_move: int) -> List[Move]:
+        """Returns the moves in the order they should be searched."""
+        bitboards = game_state.attack_map.bitboards
+        cell_index = bitboards.masks.cell_index
+        index = cell_index.index
+        player = game_state.side_to_move
+        size = cell_index.size
+        history = self._history
+        history_offset = player.value * size * size
+        killers = self._killers[ply]
+
+        def order(move: Move) -> int:
+            from_index = index(move.from_coord)
+            to_index = index(move.to_coord)
+            if table_move != NO_MOVE and pack_move(move, cell_index) == table_move:
+                return _TABLE_MOVE_ORDER
+            if move.captured is not None and bitboards.is_valid_capture_location(player, to_index):
+                return _CAPTURE_ORDER + PIECE_VALUES[move.captured]
+            if move == killers[0] or move == killers[1]:
+                return _KILLER_ORDER
+            return history[history_offset + from_index * size + to_index]
+
+        return sorted(moves, key=order, reverse=True)
+
+    def _record_cutoff(self, move: Move, mover: int, ply: int, depth: int, cell_index: CellIndex) -> None:
+        """Remember a quiet move that was best or caused a cutoff, as a killer move for the ply and in the history."""
+        if move.is_capture:
+            return
+        killers = self._killers[ply]
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+        size = cell_index.size
+        from_index = cell_index.index(move.from_coord)
+        to_index = cell_index.index(move.to_coord)
+        self._history[(mover * size + from_index) * size + to_index] += depth * depth
@@ -0,0 +1,87 @@
+"""
+test_evaluation.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import random
+import unittest
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state_utils import generate_initial_board_state
+from src.board.cell_index import get_cell_index
+from src.board.position_notation import position_from_notation
+from src.game.game_state import GameState
+from src.pieces.piece_type import PieceType
+from src.pieces.player import Player
+from src.search.evaluation import MaterialEvaluator, PieceSquareEvaluator, get_piece_square_tables
+
+
+class TestMaterialEvaluator(unittest.TestCase):
+
+    def test_initial_position(self):
+        """We test that the players are even in the initial position."""
+        evaluator = MaterialEvaluator()
+        self.assertEqual(evaluator(GameState(generate_initial_board_state())), (0, 0, 0))
+
+    def test_material(self):
+        """We test the scores of a position where white has an extra queen."""
+        evaluator = MaterialEvaluator()
+        scores = evaluator(GameState(position_from_notation("4 Kb3,Qc4 Nh3,Kj7 Kl3 s")))
+        self.assertEqual(scores, (3 * 900 - 1220, 3 * 320 - 1220, -1220))
+        self.assertEqual(sum(scores), 0)
+
+
+class TestPieceSquareEvaluator(unittest.TestCase):
+
+    def test_initial_position(self):
+        """We test that the players are even in the initial position, which is the same for each player turned."""
+        game_state = GameState(generate_initial_board_state())
+        evaluator = PieceSquareEvaluator()
+        evaluator.reset(game_state)
+        self.assertEqual(evaluator(game_state), (0, 0, 0))
+
+    def test_tables_turn_with_the_board(self):
+        """We test that a piece is worth the same to each player on the hexes that are turned to their side."""
+        cell_index = get_cell_index(5)
+        tables = get_piece_square_tables(5)
+        for coord in cell_index.coordinates:
+            turned = BoardCoordinate(coord.r, coord.s)
+            for piece_type in PieceType:
+                white = tables[Player.WHITE.value][piece_type.value]
+                silver = tables[Player.SILVER.value][piece_type.value]
+                black = tables[Player.BLACK.value][piece_type.value]
+                self.assertEqual(white[cell_index.index(coord)], silver[cell_index.index(turned)])
+                self.assertEqual(silver[cell_index.index(coord)], black[cell_index.index(turned)])
+
+    def test_pawns_advance(self):
+        """We test that a pawn is worth more the closer it is to the far side of the board."""
+        tables = get_piece_square_tables(7)
+        cell_index = get_cell_index(7)
+        pawns = tables[Player.WHITE.value][PieceType.PAWN.value]
+        self.assertLess(pawns[cell_index.index(BoardCoordinate(0, 5))], pawns[cell_index.index(BoardCoordinate(0, 0))])
+        self.assertLess(pawns[cell_index.index(BoardCoordinate(0, 0))], pawns[cell_index.index(BoardCoordinate(0, -5))])
+
+    def test_incremental_updates(self):
+        """We test that the totals kept up to date through a random game match totals worked out from scratch."""
+        rng = random.Random(24)
+        game_state = GameState(generate_initial_board_state())
+        evaluator = PieceSquareEvaluator()
+        evaluator.reset(game_state)
+        initial = evaluator(game_state)
+        undos = []
+        for _ in range(60):
+            moves = game_state.legal_moves()
+            if not moves:
+                break
+            captures = [move for move in moves if move.is_capture]
+            move = rng.choice(captures if captures and rng.random() < 0.5 else moves)
+            undo = game_state.make_move(move, PieceType.QUEEN if move.promotion else None)
+            evaluator.move_made(game_state, undo)
+            undos.append(undo)
+            expected = PieceSquareEvaluator()
+            expected.reset(game_state)
+            self.assertEqual(evaluator(game_state), expected(game_state))
+            self.assertEqual(sum(evaluator(game_state)), 0)
+        for undo in reversed(undos):
+            game_state.unmake_move(undo)
+            evaluator.move_unmade(game_state, undo)
+        self.assertEqual(evaluator(game_state), initial)
@@ -0,0 +1,52 @@
+"""
+test_parallel_search.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import unittest
+from src.board.board_state_utils import generate_initial_board_state
+from src.board.position_notation import position_from_notation
+from src.game.game_state import GameState
+from src.game.move_notation import move_from_notation, move_to_notation
+from src.search.parallel_search import parallel_search
+from src.search.search import SearchAlgorithm, Searcher
+
+
+STOLEN_MATE = "5 Kc5,Rf4,Ph2 Km9 Qi9,Ko7 w"
+
+
+class TestParallelSearch(unittest.TestCase):
+
+    def test_matches_search(self):
+        """We test that splitting the root moves between workers gives the same score as searching them together."""
+        for algorithm in SearchAlgorithm:
+            game_state = GameState(generate_initial_board_state())
+            mover = game_state.side_to_move.value
+            expected = Searcher(algorithm).search(game_state, 3)
+            for max_workers in (0, 2):
+                result = parallel_search(game_state, 3, algorithm=algorithm, max_workers=max_workers)
+                self.assertEqual(result.depth, 3)
+                self.assertIn(result.best_move, game_state.legal_moves())
+                self.assertEqual(result.scores[mover], expected.scores[mover])
+                self.assertGreater(result.nodes, 0)
+            self.assertEqual(game_state.board_state, generate_initial_board_state())
+
+    def test_finds_mate(self):
+        """We test that the worker with the mating move gets picked."""
+        game_state = GameState(position_from_notation(STOLEN_MATE))
+        result = parallel_search(game_state, 2, max_workers=3)
+        self.assertEqual(move_to_notation(result.best_move, None, 5), "f4-k9")
+
+    def test_no_legal_moves(self):
+        """We test that a position without legal moves returns no move."""
+        board_state = position_from_notation(STOLEN_MATE)
+        game_state = GameState(board_state)
+        game_state.make_move(move_from_notation("f4-k9", board_state)[0])
+        self.assertIsNone(parallel_search(game_state, 2, max_workers=2).best_move)
+
+    def test_time_limit(self):
+        """We test that the workers stop at the time limit."""
+        game_state = GameState(generate_initial_board_state())
+        result = parallel_search(game_state, 10, time_limit=0.2, max_workers=2)
+        self.assertIsNotNone(result.best_move)
+        self.assertLess(result.depth, 10)
@@ -0,0 +1,62 @@
+"""
+test_perft.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import io
+import unittest
+from contextlib import redirect_stdout
+from typing import List
+from src.board.board import Board
+from src.board.board_coordinate import BoardCoordinate
+from src.board.board_state import BoardState, BoardStateBuilder
+from src.board.board_state_utils import generate_initial_board_state
+from src.pieces.move import Move
+from src.pieces.piece_type import PieceType
+from src.pieces.piece_utils import get_piece_from_type
+from src.pieces.player import Player
+from src.search.perft import INITIAL_PERFT_COUNTS, main, perft, perft_divide
+
+
+def piece_class_moves(board_state: BoardState, player: Player) -> List[Move]:
+    """Generates the moves of a player with the Piece classes, to check the move generator against."""
+    moves = []
+    for coord in list(board_state.player_coordinates(player)):
+        piece = get_piece_from_type(board_state.piece_map[coord].piece_type)
+        for target in piece.moves(coord, board_state):
+            target_info = board_state.get_piece_info(target)
+            moves.append(Move(coord, target, None if target_info is None else target_info.piece_type))
+    return moves
+
+
+class TestPerft(unittest.TestCase):
+
+    def test_initial_position_counts(self):
+        """We test the stored node counts of the initial position up to depth 3."""
+        board_state = generate_initial_board_state()
+        for depth in range(1, 4):
+            self.assertEqual(perft(board_state, depth), INITIAL_PERFT_COUNTS[depth])
+        self.assertEqual(board_state, generate_initial_board_state())
+
+    def test_matches_piece_classes(self):
+        """We test that the move generator and the Piece classes give the same counts below every move."""
+        board_state = (
+            BoardStateBuilder(Board(7))
+            .add_piece(Player.WHITE, BoardCoordinate(0, 0), PieceType.QUEEN)
+            .add_piece(Player.WHITE, BoardCoordinate(1, 4), PieceType.KING)
+            .add_piece(Player.WHITE, BoardCoordinate(-1, 2), PieceType.PAWN)
+            .add_piece(Player.SILVER, BoardCoordinate(0, -3), PieceType.BISHOP)
+            .add_piece(Player.SILVER, BoardCoordinate(2, -2), PieceType.KNIGHT)
+            .add_piece(Player.SILVER, BoardCoordinate(4, -1), PieceType.PAWN)
+            .add_piece(Player.BLACK, BoardCoordinate(-2, 2), PieceType.BISHOP)
+            .add_piece(Player.BLACK, BoardCoordinate(-1, -2), PieceType.PAWN)
+            .add_piece(Player.BLACK, BoardCoordinate(3, 0), PieceType.ROOK)
+            .build())
+        self.assertEqual(perft_divide(board_state, 3), perft_divide(board_state, 3, piece_class_moves))
+
+    def test_main(self):
+        """We test that the command line entry point checks the stored counts."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(main(["--depth", "2"]), 0)
+        self.assertIn("484 nodes", output.getvalue())
@@ -0,0 +1,141 @@
+"""
+test_search.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import unittest
+from src.board.board_state_utils import generate_initial_board_state
+from src.board.position_notation import position_from_notation
+from src.game.game_state import GameState
+from src.game.move_notation import move_from_notation, move_to_notation
+from src.pieces.player import Player
+from src.search.evaluation import MaterialEvaluator
+from src.search.search import WIN_SCORE, SearchAlgorithm, Searcher
+
+
+# White can take black's queen with the king, or mate black with the rook on k9, which steals the mate of silver.
+STOLEN_MATE = "5 Kc5,Rf4,Ph2 Km9 Qi9,Ko7 w"
+
+# After silver's king moves from k4 to m4, black's only move is i2-i4, and then white mates.
+MATE_LINE = "4 Rd5,Qh1,Kk6 Kk4 Pd3,Ki2 s"
+
+# Silver can take white's queen on c4 with the knight on h3.
+HANGING_QUEEN = "4 Kb3,Qc4 Nh3,Kj7 Kl3 s"
+
+
+class TestSearch(unittest.TestCase):
+
+    def test_finds_mate(self):
+        """We test that both algorithms find the mate and score it as a win for the mating player."""
+        for algorithm in SearchAlgorithm:
+            board_state = position_from_notation(STOLEN_MATE)
+            result = Searcher(algorithm).search(GameState(board_state), 3)
+            self.assertIsNotNone(result.best_move)
+            self.assertEqual(move_to_notation(result.best_move, None, 5), "f4-k9")
+            self.assertEqual(result.scores, (2 * (WIN_SCORE - 1), 1 - WIN_SCORE, 1 - WIN_SCORE))
+            self.assertEqual(result.depth, 3)
+            self.assertEqual(board_state, position_from_notation(STOLEN_MATE))
+
+    def test_finds_capture(self):
+        """We test that both algorithms take a hanging queen."""
+        for algorithm in SearchAlgorithm:
+            game_state = GameState(position_from_notation(HANGING_QUEEN))
+            result = Searcher(algorithm).search(game_state, 2)
+            self.assertEqual(move_to_notation(result.best_move, None, 4), "h3xc4")
+            self.assertGreater(result.scores[Player.SILVER.value], 0)
+
+    def test_mate_found_again(self):
+        """We test that a searcher reused for the plies up to a mate scores it by the distance from each root."""
+        for algorithm in SearchAlgorithm:
+            board_state = position_from_notation(MATE_LINE)
+            game_state = GameState(board_state)
+            searcher = Searcher(algorithm)
+            silver_move = move_from_notation("k4-m4", board_state)[0]
+            result = searcher.search(game_state, 4, root_moves=[silver_move])
+            self.assertEqual(result.scores[Player.WHITE.value], 2 * (WIN_SCORE - 3))
+            game_state.make_move(silver_move)
+            result = searcher.search(game_state, 3)
+            self.assertEqual(move_to_notation(result.best_move, None, 4), "i2-i4")
+            self.assertEqual(result.scores[Player.WHITE.value], 2 * (WIN_SCORE - 2))
+            game_state.make_move(result.best_move)
+            result = searcher.search(game_state, 3)
+            self.assertEqual(result.scores[Player.WHITE.value], 2 * (WIN_SCORE - 1))
+            game_state.make_move(result.best_move)
+            self.assertEqual(game_state.mating_player(), Player.WHITE)
+
+    def test_no_legal_moves(self):
+        """We test that a checkmated player gets no move and the win is scored for the mating player."""
+        board_state = position_from_notation(STOLEN_MATE)
+        game_state = GameState(board_state)
+        game_state.make_move(move_from_notation("f4-k9", board_state)[0])
+        result = Searcher().search(game_state, 3)
+        self.assertIsNone(result.best_move)
+        self.assertEqual(result.depth, 1)
+        self.assertEqual(result.scores, (2 * WIN_SCORE, -WIN_SCORE, -WIN_SCORE))
+
+    def test_node_limit(self):
+        """We test that the node limit stops the search, after finishing the search to depth 1."""
+        game_state = GameState(generate_initial_board_state())
+        result = Searcher().search(game_state, 10, node_limit=2000)
+        self.assertIsNotNone(result.best_move)
+        self.assertGreaterEqual(result.depth, 1)
+        self.assertLess(result.depth, 10)
+        self.assertLessEqual(result.nodes, 2000 + 1024)
+        self.assertEqual(game_state.board_state, generate_initial_board_state())
+
+    def test_time_limit(self):
+        """We test that the time limit stops the search."""
+        game_state = GameState(generate_initial_board_state())
+        result = Searcher().search(game_state, 10, time_limit=0.2)
+        self.assertIsNotNone(result.best_move)
+        self.assertLess(result.depth, 10)
+        self.assertLess(result.elapsed, 2.0)
+        self.assertGreater(result.nodes_per_second, 0)
+
+    def test_transposition_table(self):
+        """We test that a repeated search finds its results in the transposition table and gives the same result."""
+        game_state = GameState(generate_initial_board_state())
+        searcher = Searcher()
+        first = searcher.search(game_state, 3)
+        hits = searcher.table.hits
+        second = searcher.search(game_state, 3)
+        self.assertGreater(searcher.table.hits, hits)
+        self.assertLess(second.nodes, first.nodes)
+        self.assertEqual(first.scores, second.scores)
+
+    def test_paranoid_matches_minimax(self):
+        """We test that alpha-beta and the move ordering do not change the score of a paranoid search."""
+        game_state = GameState(position_from_notation(HANGING_QUEEN))
+        evaluator = MaterialEvaluator()
+
+        def minimax(depth: int) -> int:
+            moves = game_state.legal_moves()
+            if depth == 0 or not moves:
+                return evaluator(game_state)[Player.SILVER.value]
+            values = []
+            for move in moves:
+                undo = game_state.make_move(move)
+                values.append(minimax(depth - 1))
+                game_state.unmake_move(undo)
+            return max(values) if game_state.side_to_move == Player.SILVER else min(values)
+
+        result = Searcher(SearchAlgorithm.PARANOID, evaluator).search(game_state, 3)
+        self.assertEqual(result.scores[Player.SILVER.value], minimax(3))
+
+    def test_root_moves(self):
+        """We test that a search limited to some root moves only picks from them."""
+        game_state = GameState(position_from_notation(HANGING_QUEEN))
+        moves = [move for move in game_state.legal_moves() if move_to_notation(move, None, 4) != "h3xc4"]
+        result = Searcher().search(game_state, 2, root_moves=moves)
+        self.assertIn(result.best_move, moves)
+        self.assertEqual(len(result.iterations), 2)
+        with self.assertRaises(ValueError):
+            Searcher().search(game_state, 2, root_moves=[])
+
+    def test_invalid_depth(self):
+        """We test that an invalid depth raises an error."""
+        game_state = GameState(generate_initial_board_state())
+        with self.assertRaises(ValueError):
+            Searcher().search(game_state, 0)
+        with self.assertRaises(ValueError):
+            Searcher().search(game_state, 128)
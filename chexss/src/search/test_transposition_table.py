@@ -0,0 +1,76 @@
+"""
+test_transposition_table.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+import unittest
+from src.board.board_state_utils import generate_initial_board_state
+from src.board.cell_index import get_cell_index
+from src.pieces.move import NO_MOVE, pack_move, unpack_move
+from src.pieces.move_generator import generate_moves
+from src.pieces.player import Player
+from src.search.transposition_table import Bound, TranspositionTable
+
+
+class TestTranspositionTable(unittest.TestCase):
+
+    def test_pack_and_unpack_moves(self):
+        """We test that every move in the initial position survives being packed and unpacked."""
+        board_state = generate_initial_board_state()
+        cell_index = get_cell_index(board_state.board.dimension)
+        for player in Player:
+            for move in generate_moves(board_state, player):
+                packed = pack_move(move, cell_index)
+                self.assertNotEqual(packed, NO_MOVE)
+                self.assertLess(packed, 1 << 32)
+                self.assertEqual(unpack_move(packed, cell_index), move)
+
+    def test_store_and_probe(self):
+        """We test that a stored result can be read back and that unknown positions miss."""
+        board_state = generate_initial_board_state()
+        cell_index = get_cell_index(board_state.board.dimension)
+        move = pack_move(generate_moves(board_state, Player.WHITE)[0], cell_index)
+        table = TranspositionTable(0.01)
+
+        table.store(board_state.zobrist_hash, 3, (10, -5, -5), Bound.LOWER, move)
+        entry = table.probe(board_state.zobrist_hash)
+        self.assertIsNotNone(entry)
+        self.assertEqual(entry.depth, 3)
+        self.assertEqual(entry.scores, (10, -5, -5))
+        self.assertEqual(entry.bound, Bound.LOWER)
+        self.assertEqual(entry.move, move)
+        self.assertIsNone(table.probe(board_state.zobrist_hash + 1))
+        self.assertEqual((table.hits, table.misses, table.stores), (1, 1, 1))
+
+        table.clear()
+        self.assertIsNone(table.probe(board_state.zobrist_hash))
+
+    def test_replacement_policy(self):
+        """We test that shallow results do not replace deep ones, but still get stored in the always-replace entry."""
+        table = TranspositionTable(0.001)
+        buckets = table.capacity // 2
+        deep, shallow, newer = 7, 7 + buckets, 7 + 2 * buckets
+
+        table.store(deep, 5, (1, 2, 3), Bound.EXACT)
+        table.store(shallow, 1, (4, 5, 6), Bound.EXACT)
+        self.assertEqual(table.probe(deep).depth, 5)
+        self.assertEqual(table.probe(shallow).depth, 1)
+
+        # A second shallow result pushes out the first one, not the deep one.
+        table.store(newer, 2, (7, 8, 9), Bound.UPPER)
+        self.assertEqual(table.probe(deep).depth, 5)
+        self.assertIsNone(table.probe(shallow))
+        self.assertEqual(table.collisions, 1)
+
+        # A search that is at least as deep takes over the depth-preferred entry.
+        table.store(newer, 6, (7, 8, 9), Bound.EXACT)
+        self.assertEqual(table.probe(newer).depth, 6)
+        self.assertIsNone(table.probe(deep))
+
+    def test_memory_is_bounded(self):
+        """We test that the table does not use more memory than it was given."""
+        table = TranspositionTable(1)
+        self.assertLessEqual(table.size_bytes, 1024 * 1024)
+        for key in range(3 * table.capacity):
+            table.store(key, key % 10, (0, 0, 0), Bound.EXACT)
+        self.assertEqual(table.capacity, TranspositionTable(1).capacity)
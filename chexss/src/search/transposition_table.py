@@ -0,0 +1,241 @@
+"""
+transposition_table.py
+Copyright © 2025 Derek Seiple
+Licensed under Creative Commons BY-NC-SA 3.0. See license file.
+"""
+from array import array
+from enum import Enum
+from typing import Optional, Tuple
+from src.pieces.move import NO_MOVE
+from src.pieces.player import Player
+
+
+class Bound(Enum):
+    """How a stored score relates to the true score of the position."""
+    EXACT = 0
+    LOWER = 1
+    UPPER = 2
+
+
+Scores = Tuple[int, ...]
+
+
+class TranspositionEntry:
+    """A single result read from the TranspositionTable."""
+
+    __slots__ = ("_key", "_move", "_depth", "_scores", "_bound")
+
+    def __init__(
+        self,
+        key: int,
+        move: int,
+        depth: int,
+        scores: Scores,
+        bound: Bound
+    ) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        key: int
+            The Zobrist hash of the position.
+
+        move: int
+            The best move found for the position, packed with pack_move(), or NO_MOVE.
+
+        depth: int
+            The depth the position was searched to.
+
+        scores: Scores
+            The score of the position for each player, indexed by player value.
+
+        bound: Bound
+            Whether the scores are exact or a lower or upper bound.
+        """
+        self._key = key
+        self._move = move
+        self._depth = depth
+        self._scores = scores
+        self._bound = bound
+
+    @property
+    def key(self) -> int:
+        return self._key
+
+    @property
+    def move(self) -> int:
+        return self._move
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def scores(self) -> Scores:
+        return self._scores
+
+    @property
+    def bound(self) -> Bound:
+        return self._bound
+
+
+class TranspositionTable:
+    """This class is a fixed-size cache of search results keyed by the Zobrist hash of a position (see
+    BoardState.zobrist_hash). All of the storage is preallocated in flat arrays when the table is created, so the memory
+    used never grows no matter how long the table is in use.
+
+    The table is split into buckets of two entries. The first entry of a bucket is depth-preferred: it is only replaced
+    by a search that is at least as deep. The second entry is always replaced, so recent shallow results still have a
+    place to go. Along with the best move, depth and bound, each entry stores a score for every player, which is what a
+    three player max^n search needs (a paranoid search can just use the score of the searching player).
+    """
+
+    # key (8) + move (4) + depth (1) + bound (1) + a 4 byte score per player
+    ENTRY_BYTES = 8 + 4 + 1 + 1 + 4 * len(Player)
+
+    _EMPTY_DEPTH = -128
+
+    def __init__(self, size_mb: float = 16.0) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        size_mb: float
+            The approximate amount of memory the table should use in megabytes.
+        """
+        if size_mb <= 0:
+            raise ValueError("The size of the table must be positive.")
+        self._bucket_count = max(1, int(size_mb * 1024 * 1024) // (2 * self.ENTRY_BYTES))
+        entries = 2 * self._bucket_count
+        self._keys = array("Q", bytes(8 * entries))
+        self._moves = array("I", bytes(4 * entries))
+        self._depths = array("b", [self._EMPTY_DEPTH]) * entries
+        self._bounds = array("B", bytes(entries))
+        self._scores = array("i", bytes(4 * len(Player) * entries))
+        self._hits = 0
+        self._misses = 0
+        self._collisions = 0
+        self._stores = 0
+
+    def probe(self, key: int) -> Optional[TranspositionEntry]:
+        """Look up the position with the given Zobrist hash.
+
+        Parameters
+        ----------
+        key: int
+            The Zobrist hash of the position.
+
+        Returns
+        -------
+        Optional[TranspositionEntry]
+            The stored result for the position, or None if there is none.
+        """
+        slot = 2 * (key % self._bucket_count)
+        for entry in (slot, slot + 1):
+            if self._depths[entry] != self._EMPTY_DEPTH and self._keys[entry] == key:
+                self._hits += 1
+                players = len(Player)
+                return TranspositionEntry(
+                    key,
+                    self._moves[entry],
+                    self._depths[entry],
+                    tuple(self._scores[entry * players:(entry + 1) * players]),
+                    Bound(self._bounds[entry])
+                )
+
+        self._misses += 1
+        if self._depths[slot] != self._EMPTY_DEPTH or self._depths[slot + 1] != self._EMPTY_DEPTH:
+            # The bucket holds other positions that hash to the same place.
+            self._collisions += 1
+        return None
+
+    def store(
+        self,
+        key: int,
+        depth: int,
+        scores: Scores,
+        bound: Bound,
+        move: int = NO_MOVE
+    ) -> None:
+        """Store a search result for the position with the given Zobrist hash.
+
+        Parameters
+        ----------
+        key: int
+            The Zobrist hash of the position.
+
+        depth: int
+            The depth the position was searched to, between 0 and 127.
+
+        scores: Scores
+            The score of the position for each player, indexed by player value.
+
+        bound: Bound
+            Whether the scores are exact or a lower or upper bound.
+
+        move: int
+            The best move found for the position packed with pack_move(), or NO_MOVE.
+        """
+        slot = 2 * (key % self._bucket_count)
+        preferred_depth = self._depths[slot]
+        if preferred_depth == self._EMPTY_DEPTH or self._keys[slot] == key or depth >= preferred_depth:
+            entry = slot
+        else:
+            entry = slot + 1
+
+        if move == NO_MOVE and self._depths[entry] != self._EMPTY_DEPTH and self._keys[entry] == key:
+            # Keep the best move we already know about for this position.
+            move = self._moves[entry]
+
+        self._keys[entry] = key
+        self._moves[entry] = move
+        self._depths[entry] = depth
+        self._bounds[entry] = bound.value
+        players = len(Player)
+        self._scores[entry * players:(entry + 1) * players] = array("i", scores)
+        self._stores += 1
+
+    def clear(self) -> None:
+        """Remove every entry from the table and reset the statistics."""
+        for entry in range(len(self._depths)):
+            self._depths[entry] = self._EMPTY_DEPTH
+        self._hits = 0
+        self._misses = 0
+        self._collisions = 0
+        self._stores = 0
+
+    @property
+    def capacity(self) -> int:
+        """The number of entries the table can hold."""
+        return 2 * self._bucket_count
+
+    @property
+    def size_bytes(self) -> int:
+        """The number of bytes used by the entries of the table."""
+        return self.capacity * self.ENTRY_BYTES
+
+    @property
+    def hits(self) -> int:
+        """The number of probes that found the position."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of probes that did not find the position."""
+        return self._misses
+
+    @property
+    def collisions(self) -> int:
+        """The number of probes that did not find the position because other positions were stored in its bucket."""
+        return self._collisions
+
+    @property
+    def stores(self) -> int:
+        """The number of results stored in the table."""
+        return self._stores
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of probes that found the position."""
+        probes = self._hits + self._misses
+        return self._hits / probes if probes else 0.0